@@ -0,0 +1,39 @@
+from nx_pandas_graph import classes
+
+from .common import edge_df, graph_types, num_attrs, num_edges, with_node_df
+
+
+class GraphFromPandas:
+    params = [num_edges, graph_types, num_attrs]
+    param_names = ["num_edges", "graph_type", "num_attrs"]
+
+    def setup(self, num_edges, graph_type, num_attrs):
+        self.df = with_node_df(edge_df(num_edges, graph_type, num_attrs))
+        self.graph_class = getattr(classes, graph_type)
+
+    def time_from_pandas(self, *args):
+        self.graph_class.from_pandas(self.df)
+
+    def time_from_pandas_copy(self, *args):
+        self.graph_class.from_pandas(self.df, copy=True)
+
+    def peakmem_from_pandas_copy(self, *args):
+        self.graph_class.from_pandas(self.df, copy=True)
+
+
+class GraphCopy:
+    params = [num_edges, graph_types, num_attrs]
+    param_names = ["num_edges", "graph_type", "num_attrs"]
+
+    def setup(self, num_edges, graph_type, num_attrs):
+        df = with_node_df(edge_df(num_edges, graph_type, num_attrs))
+        self.G = getattr(classes, graph_type).from_pandas(df)
+
+    def time_copy(self, *args):
+        self.G.copy()
+
+    def time_copy_as_view(self, *args):
+        self.G.copy(as_view=True)
+
+    def peakmem_copy(self, *args):
+        self.G.copy()
@@ -0,0 +1,66 @@
+from nx_pandas.interface import backend_interface
+
+from .common import edge_df, graph_types, num_attrs, num_edges, nx_graph, with_node_df
+
+
+class ConvertFromNx:
+    params = [num_edges, graph_types, num_attrs]
+    param_names = ["num_edges", "graph_type", "num_attrs"]
+
+    def setup(self, num_edges, graph_type, num_attrs):
+        self.G = nx_graph(num_edges, graph_type, num_attrs)
+
+    def time_convert_from_nx(self, *args):
+        backend_interface.convert_from_nx(
+            self.G, preserve_edge_attrs=True, preserve_node_attrs=True
+        )
+
+    def time_convert_from_nx_no_attrs(self, *args):
+        backend_interface.convert_from_nx(self.G)
+
+    def peakmem_convert_from_nx(self, *args):
+        backend_interface.convert_from_nx(
+            self.G, preserve_edge_attrs=True, preserve_node_attrs=True
+        )
+
+
+class ConvertToNx:
+    params = [num_edges, graph_types, num_attrs, [False, True]]
+    param_names = ["num_edges", "graph_type", "num_attrs", "node_df"]
+
+    def setup(self, num_edges, graph_type, num_attrs, node_df):
+        self.df = edge_df(num_edges, graph_type, num_attrs)
+        if node_df:
+            with_node_df(self.df)
+
+    def time_convert_to_nx(self, *args):
+        backend_interface.convert_to_nx(self.df)
+
+    def time_convert_to_nx_one_attr(self, *args):
+        # As done when dispatching e.g. `shortest_path(df, weight="attr0")`
+        backend_interface.convert_to_nx(
+            self.df,
+            edge_attrs={"attr0": 1},
+            preserve_edge_attrs=False,
+            preserve_node_attrs=False,
+        )
+
+    def peakmem_convert_to_nx(self, *args):
+        backend_interface.convert_to_nx(self.df)
+
+
+class CSR:
+    params = [num_edges, graph_types]
+    param_names = ["num_edges", "graph_type"]
+
+    def setup(self, num_edges, graph_type):
+        self.df = edge_df(num_edges, graph_type, 0)
+
+    def time_csr(self, *args):
+        # Rebuilt each time, since `df.nx.csr` is cached on the accessor
+        self.df.nx._csr = None
+        self.df.nx.csr.indptr
+
+    def peakmem_csr(self, *args):
+        self.df.nx._csr = None
+        self.df.nx.csr.indptr
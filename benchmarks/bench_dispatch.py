@@ -0,0 +1,38 @@
+import networkx as nx
+
+from .common import edge_df, graph_types
+
+
+class AutoFuncOverhead:
+    """Overhead of dispatching to networkx with a cached converted graph.
+
+    The graphs are tiny, so this mostly measures `_auto_func` and conversion
+    cache lookups rather than the algorithm.
+    """
+
+    params = [graph_types]
+    param_names = ["graph_type"]
+
+    def setup(self, graph_type):
+        self.df = edge_df(10, graph_type, 1).nx.set_properties(cache_enabled=True)
+        nx.is_isolate(self.df, 0)  # Fill the conversion cache
+
+    def time_cached_dispatch(self, graph_type):
+        nx.is_isolate(self.df, 0)
+
+    def time_uncached_dispatch(self, graph_type):
+        self.df.nx.cache_enabled = False
+        nx.is_isolate(self.df, 0)
+        self.df.nx.cache_enabled = True
+
+
+class NativeDispatch:
+    params = [graph_types]
+    param_names = ["graph_type"]
+
+    def setup(self, graph_type):
+        self.df = edge_df(10, graph_type, 1)
+        self.df.nx.csr  # Build the index ahead of time
+
+    def time_degree_centrality(self, graph_type):
+        nx.degree_centrality(self.df)
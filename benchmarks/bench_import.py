@@ -0,0 +1,14 @@
+class ImportTime:
+    """Time to import networkx in a new interpreter, which loads our backend info.
+
+    This should not include importing pandas, which is only patched when imported.
+    """
+
+    def timeraw_import_networkx(self):
+        return "import networkx"
+
+    def timeraw_import_networkx_and_pandas(self):
+        return """
+        import networkx
+        import pandas
+        """
@@ -0,0 +1,64 @@
+"""Synthetic graphs shared by the benchmarks.
+
+Run the benchmarks with `asv <https://asv.readthedocs.io>`_ from the root of the
+repository, for example::
+
+    asv run --quick --show-stderr
+    asv continuous main HEAD  # Compare to main to catch regressions
+
+Use ``--bench`` to select benchmarks by regex. The largest graphs (``1e7``
+edges) need several GB of memory to convert to networkx graphs, so limit sizes
+with the ``NX_PANDAS_BENCH_MAX_EDGES`` environment variable if necessary.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from nx_pandas.interface import backend_interface
+
+_max_edges = int(float(os.environ.get("NX_PANDAS_BENCH_MAX_EDGES", 10**7)))
+
+num_edges = [n for n in [10**3, 10**5, 10**7] if n <= _max_edges]
+graph_types = ["Graph", "DiGraph", "MultiGraph", "MultiDiGraph"]
+num_attrs = [0, 4, 32]
+
+# Building networkx graphs this large in setup is too slow to be useful
+max_nx_edges = 10**6
+
+
+def edge_df(num_edges, graph_type, num_attrs, *, seed=42):
+    """Return a random graph DataFrame with ``num_attrs`` float edge attributes.
+
+    Graphs have an average degree of 16 and include duplicate edges.
+    """
+    rng = np.random.default_rng(seed)
+    num_nodes = max(num_edges // 8, 2)
+    columns = {
+        "source": rng.integers(0, num_nodes, num_edges),
+        "target": rng.integers(0, num_nodes, num_edges),
+    }
+    for i in range(num_attrs):
+        columns[f"attr{i}"] = rng.random(num_edges)
+    return pd.DataFrame(columns).nx.set_properties(
+        is_directed="Di" in graph_type, is_multigraph="Multi" in graph_type
+    )
+
+
+def with_node_df(df, *, seed=42):
+    """Add ``df.nx.node_df`` with two node attributes for every node."""
+    nodes = pd.unique(np.concatenate([df["source"], df["target"]]))
+    rng = np.random.default_rng(seed)
+    df.nx.node_df = pd.DataFrame(
+        {"size": rng.random(len(nodes)), "group": rng.integers(0, 10, len(nodes))},
+        index=nodes,
+    )
+    return df
+
+
+def nx_graph(num_edges, graph_type, num_attrs):
+    """Return a networkx graph; raise NotImplementedError (skip) if too large."""
+    if num_edges > max_nx_edges:
+        raise NotImplementedError
+    return backend_interface.convert_to_nx(edge_df(num_edges, graph_type, num_attrs))
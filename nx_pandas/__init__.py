@@ -12,3 +12,28 @@ except Exception as exc:
         "`python -m pip install -e path/to/nx-pandas`"
     ) from exc
 del importlib
+
+# Import after `__version__` is defined, since this imports networkx, which loads
+# backend info that uses `nx_pandas.__version__`.
+from ._instrument import CallRecord, DispatchStats, instrument, stats  # noqa: E402
+
+# These import pandas, so import them when first used (see `_get_info`)
+_lazy_attrs = {
+    "GraphBuilder": "builder",
+    "from_edge_chunks": "builder",
+    "read_feather": "io",
+    "read_parquet": "io",
+}
+
+
+def __getattr__(name):
+    if (module_name := _lazy_attrs.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    importlib.import_module("._patch", __name__)  # Add `df.nx`
+    return getattr(importlib.import_module(f".{module_name}", __name__), name)
+
+
+def __dir__():
+    return [*globals(), *_lazy_attrs]
@@ -0,0 +1,68 @@
+"""Backend info for networkx, which must not import pandas.
+
+networkx calls `get_info` when it is imported. Instead of importing pandas here,
+the ``df.nx`` accessor and ``pd.DataFrame`` attributes (see ``nx_pandas._patch``)
+are installed when pandas is imported, or now if pandas is already imported.
+"""
+
+import importlib.abc
+import importlib.util
+import sys
+
+__all__ = ["get_info"]
+
+
+def get_info():
+    _install_patch()
+    # Should we add config for e.g. default source, target, edge_key columns?
+    # Maybe config to enable/disable cache by default?
+    return {
+        "default_config": {
+            # Record timings of dispatched calls in `nx_pandas.stats`
+            "instrument": False,
+            # Create graph DataFrames with categorical source and target columns
+            "compact_nodes": False,
+            # Limits of `__networkx_cache__` of each DataFrame (None for no limit);
+            # least recently used graphs are evicted first.
+            "cache_max_entries": 16,
+            "cache_max_bytes": None,
+        },
+    }
+
+
+def _install_patch():
+    """Patch pandas now if it is imported, otherwise right after it is imported."""
+    if "pandas" in sys.modules:
+        importlib.import_module("nx_pandas._patch")
+    elif not any(isinstance(finder, _PandasFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _PandasFinder())
+
+
+class _PandasFinder(importlib.abc.MetaPathFinder):
+    """Find pandas with the other finders and wrap its loader to patch it."""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != "pandas":
+            return None
+        # Only used once, which also keeps `find_spec` below from finding us
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is not None and spec.loader is not None:
+            spec.loader = _PatchingLoader(spec.loader)
+        return spec
+
+
+class _PatchingLoader(importlib.abc.Loader):
+    def __init__(self, loader):
+        self.loader = loader
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.loader.exec_module(module)
+        importlib.import_module("nx_pandas._patch")
+
+    def __getattr__(self, attr):
+        # e.g. `get_resource_reader`
+        return getattr(self.loader, attr)
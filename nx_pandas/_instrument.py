@@ -0,0 +1,185 @@
+"""Opt-in instrumentation of dispatched calls and graph conversions.
+
+Enable globally with ``nx.config.backends.pandas.instrument = True`` to record
+into ``nx_pandas.stats``, or record calls made within a block of code with::
+
+    >>> with nx_pandas.instrument() as stats:
+    ...     nx.pagerank(df)
+    >>> stats.summary()
+
+Hooks added with ``stats.add_hook(callback)`` are called with each `CallRecord`.
+"""
+
+import collections
+import contextlib
+import contextvars
+import time
+
+import networkx as nx
+
+__all__ = ["CallRecord", "DispatchStats", "instrument", "stats"]
+
+_timer = time.perf_counter
+
+
+class CallRecord:
+    """Timings and conversion counts of one call dispatched to the pandas backend.
+
+    Attributes
+    ----------
+    func_name : str
+    backend : str
+        Name of the backend that ran the function; "pandas" if run natively.
+    convert_time : float
+        Seconds spent converting graph arguments (zero for cache hits).
+    run_time : float
+        Seconds spent running the function.
+    result_time : float
+        Seconds spent converting a returned graph back to pandas.
+    rows : int
+        Number of DataFrame rows converted.
+    nbytes : int
+        Number of bytes of DataFrame columns converted.
+    cache_hits, cache_misses : int
+        Lookups of converted graphs in ``df.__networkx_cache__``.
+    """
+
+    __slots__ = [
+        "func_name",
+        "backend",
+        "convert_time",
+        "run_time",
+        "result_time",
+        "rows",
+        "nbytes",
+        "cache_hits",
+        "cache_misses",
+    ]
+
+    def __init__(self, func_name, backend):
+        self.func_name = func_name
+        self.backend = backend
+        self.convert_time = 0.0
+        self.run_time = 0.0
+        self.result_time = 0.0
+        self.rows = 0
+        self.nbytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def total_time(self):
+        return self.convert_time + self.run_time + self.result_time
+
+    def as_dict(self):
+        rv = {attr: getattr(self, attr) for attr in self.__slots__}
+        rv["total_time"] = self.total_time
+        return rv
+
+    def __repr__(self):
+        return (
+            f"CallRecord({self.func_name!r}, backend={self.backend!r}, "
+            f"total_time={self.total_time:.6f})"
+        )
+
+
+class DispatchStats:
+    """Collection of `CallRecord` objects with hooks called for each new record.
+
+    Only the latest ``max_records`` records are kept (all if None), but `summary`
+    has totals of all records added since the last `clear`.
+    """
+
+    def __init__(self, max_records=None):
+        self.records = collections.deque(maxlen=max_records)
+        self._totals = {}
+        self._hooks = []
+
+    def add_hook(self, callback):
+        """Call ``callback(record)`` for every call recorded from now on."""
+        self._hooks.append(callback)
+
+    def remove_hook(self, callback):
+        self._hooks.remove(callback)
+
+    def clear(self):
+        """Remove all records and totals (hooks are kept)."""
+        self.records.clear()
+        self._totals.clear()
+
+    def summary(self):
+        """Return totals of records by function name as a dict of dicts."""
+        return {
+            func_name: {**info, "backends": dict(info["backends"])}
+            for func_name, info in self._totals.items()
+        }
+
+    def _add(self, record):
+        self.records.append(record)
+        if (info := self._totals.get(record.func_name)) is None:
+            info = self._totals[record.func_name] = dict.fromkeys(
+                ["calls", *CallRecord.__slots__[2:], "total_time"], 0
+            )
+            info["backends"] = {}
+        info["calls"] += 1
+        for attr in CallRecord.__slots__[2:]:
+            info[attr] += getattr(record, attr)
+        info["total_time"] += record.total_time
+        backends = info["backends"]
+        backends[record.backend] = backends.get(record.backend, 0) + 1
+        for callback in self._hooks:
+            callback(record)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} with {len(self)} records>"
+
+
+# Records calls when `nx.config.backends.pandas.instrument` is True; keep a bounded
+# number of records, since this may be enabled in long-running processes
+stats = DispatchStats(max_records=10_000)
+
+# Stats of the active `instrument()` contexts (per thread or task)
+_active = contextvars.ContextVar("nx_pandas_instrument", default=())
+
+
+@contextlib.contextmanager
+def instrument(hook=None):
+    """Record calls dispatched to the pandas backend within the context.
+
+    Yields a new `DispatchStats`; ``hook`` is added as a hook if given.
+    """
+    collector = DispatchStats()
+    if hook is not None:
+        collector.add_hook(hook)
+    token = _active.set((*_active.get(), collector))
+    try:
+        yield collector
+    finally:
+        _active.reset(token)
+
+
+def _collectors():
+    """Return the stats objects that should record the current call, if any."""
+    collectors = _active.get()
+    config = getattr(nx.config.backends, "pandas", None)
+    if config is not None and config.get("instrument", False):
+        collectors = (stats, *collectors)
+    return collectors
+
+
+def _new_record(func_name, backend):
+    """Return a new `CallRecord` if instrumentation is enabled, otherwise None."""
+    if _collectors():
+        return CallRecord(func_name, backend)
+    return None
+
+
+def _finish(record):
+    for collector in _collectors():
+        collector._add(record)
@@ -1,5 +1,18 @@
+import itertools
+import sys
+
+import numpy as np
 import pandas as pd
 
+from .convert import (
+    _add_edges_from_pandas,
+    _compact_node_columns,
+    _expand_node_columns,
+)
+from .csr import CSRIndex, _content_fingerprint, _encode, _index_dtype
+from ._get_info import get_info  # noqa: F401 (entry point of older installs)
+from .io import _to_feather, _to_parquet
+
 
 # https://pandas.pydata.org/docs/development/extending.html#registering-custom-accessors
 @pd.api.extensions.register_dataframe_accessor("nx")
@@ -11,9 +24,20 @@ class NxAccessor:
         self._source = "source" if "source" in pandas_obj.columns else None
         self._target = "target" if "target" in pandas_obj.columns else None
         self._edge_key = "edge_key" if "edge_key" in pandas_obj.columns else None
-        self.node_df = None
+        self._node_df = None
+        # Nodes in no edges, if `node_df` is derived lazily (see `node_df`)
+        self._isolated_nodes = None
         self.graph = {}  # `df.nx.graph` instead of `df.graph`
         self._cache = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+        # Estimated bytes of cached graphs by `(backend_name, key)`, oldest first
+        self._cache_lru = {}
+        # Limits of the cache; None means use the global config
+        self._cache_max_entries = None
+        self._cache_max_bytes = None
+        self._csr = None
 
     @property
     def source(self):
@@ -89,10 +113,262 @@ class NxAccessor:
         if not val:
             # Wipe out the cache when disabling the cache
             self._cache = None
+            self._cache_lru.clear()
         elif self._cache is None:
             # Enable cache if necessary
             self._cache = {}
 
+    @property
+    def cache_max_entries(self):
+        """Maximum number of cached graphs before least recently used are evicted.
+
+        Defaults to ``nx.config.backends.pandas.cache_max_entries`` if None.
+        """
+        if self._cache_max_entries is None:
+            return _get_config("cache_max_entries")
+        return self._cache_max_entries
+
+    @cache_max_entries.setter
+    def cache_max_entries(self, val):
+        self._cache_max_entries = val
+        self._cache_evict()
+
+    @property
+    def cache_max_bytes(self):
+        """Maximum estimated size of cached graphs in bytes.
+
+        Defaults to ``nx.config.backends.pandas.cache_max_bytes`` if None.
+        """
+        if self._cache_max_bytes is None:
+            return _get_config("cache_max_bytes")
+        return self._cache_max_bytes
+
+    @cache_max_bytes.setter
+    def cache_max_bytes(self, val):
+        self._cache_max_bytes = val
+        self._cache_evict()
+
+    @property
+    def compact_nodes(self):
+        """Whether source and target columns are categoricals of the same nodes.
+
+        Setting this to True encodes the columns as categoricals sharing one node
+        dictionary, which uses much less memory for e.g. string node ids; setting
+        it to False decodes them again. Nodes are decoded when converting to
+        networkx, so results are the same either way.
+        """
+        if self._source is None or self._target is None:
+            return False
+        src = self._df[self.source]
+        dst = self._df[self.target]
+        return (
+            isinstance(src.dtype, pd.CategoricalDtype)
+            and isinstance(dst.dtype, pd.CategoricalDtype)
+            and src.cat.categories.equals(dst.cat.categories)
+        )
+
+    @compact_nodes.setter
+    def compact_nodes(self, val):
+        _attr_raise_if_invalid_graph(self._df, "compact_nodes")
+        if val and not self.compact_nodes:
+            _compact_node_columns(self._df)
+        elif not val and self.compact_nodes:
+            _expand_node_columns(self._df)
+
+    @property
+    def node_df(self):
+        """DataFrame of nodes and node attributes, indexed by node, or None.
+
+        Nodes in ``node_df`` come first when iterating over nodes of the graph,
+        followed by nodes first seen in the edges. Graphs converted from networkx
+        without node attributes only keep a list of isolated nodes, and this is
+        created from the edges on first access.
+        """
+        if self._node_df is None and self._isolated_nodes is not None:
+            # Derive from edges, and keep it, since it may be modified in-place.
+            # Nodes are the same, so the index and cached graphs are still valid.
+            fingerprint = self._fingerprint()
+            self.node_df = _derive_node_df(self._df, self._isolated_nodes)
+            self._keep_derived(fingerprint)
+        return self._node_df
+
+    @node_df.setter
+    def node_df(self, val):
+        self._node_df = val
+        self._isolated_nodes = None
+
+    @property
+    def csr(self):
+        """Integer-coded CSR adjacency index of the graph as a ``CSRIndex``.
+
+        This is built on first access and reused until the DataFrame changes.
+        """
+        _attr_raise_if_invalid_graph(self._df, "csr")
+        fingerprint = self._fingerprint()
+        if self._csr is None or self._csr[0] != fingerprint:
+            self._csr = (fingerprint, CSRIndex.from_dataframe(self._df))
+        return self._csr[1]
+
+    def add_edges_from_frame(self, edges):
+        """Return a new graph DataFrame with the rows of ``edges`` appended.
+
+        ``edges`` must have the source and target (and edge key) columns. Graph
+        properties are kept, and derived data is updated instead of rebuilt:
+        ``node_df`` is shared, ``df.nx.csr`` is extended without factorizing the
+        existing edges again, and networkx graphs in the cache have the new edges
+        added. Cached graphs are moved to the new DataFrame.
+        """
+        _attr_raise_if_invalid_graph(self._df, "add_edges_from_frame")
+        return _append_edges(self._df, edges)
+
+    def save_csr(self, path):
+        """Save ``df.nx.csr`` as ``.npy`` files in the directory ``path``.
+
+        Load it with `load_csr` to skip building the index, e.g. when the graph is
+        read from a file again.
+        """
+        _attr_raise_if_invalid_graph(self._df, "save_csr")
+        self.csr.save(path, _content_fingerprint(self._df))
+
+    def load_csr(self, path, *, mmap_mode="r", allow_pickle=False):
+        """Use the index saved in ``path`` by `save_csr` as ``df.nx.csr``.
+
+        The index is only used if it was saved from the same nodes and edges,
+        which is checked by hashing the source and target columns. Arrays are
+        memory-mapped by default (see ``np.load``). Node labels that are neither
+        numbers nor strings are pickled, so only use ``allow_pickle=True`` with
+        trusted files to load them. Return True if the index was loaded, and
+        False if it doesn't exist, is stale, or has pickled nodes not allowed.
+        """
+        _attr_raise_if_invalid_graph(self._df, "load_csr")
+        fingerprint = _content_fingerprint(self._df)
+        csr = CSRIndex.load(
+            path,
+            mmap_mode=mmap_mode,
+            fingerprint=fingerprint,
+            allow_pickle=allow_pickle,
+        )
+        if csr is None:
+            return False
+        self._csr = (self._fingerprint(), csr)
+        return True
+
+    def to_parquet(self, path, *, csr=False, **kwargs):
+        """Write the graph to a Parquet file, keeping ``df.nx`` properties.
+
+        ``df.nx.node_df`` is written to a second file ``f"{path}.nodes.parquet"``.
+        If ``csr`` is True, ``df.nx.csr`` is saved in ``f"{path}.csr"`` and used
+        by ``nx_pandas.read_parquet`` (see `save_csr`). Read the graph with
+        ``nx_pandas.read_parquet``. Keyword arguments are given to
+        ``pyarrow.parquet.write_table``.
+        """
+        _attr_raise_if_invalid_graph(self._df, "to_parquet")
+        _to_parquet(self._df, path, csr=csr, **kwargs)
+
+    def to_feather(self, path, *, csr=False, **kwargs):
+        """Write the graph to a Feather file, keeping ``df.nx`` properties.
+
+        This is like `to_parquet`, and is read with ``nx_pandas.read_feather``.
+        """
+        _attr_raise_if_invalid_graph(self._df, "to_feather")
+        _to_feather(self._df, path, csr=csr, **kwargs)
+
+    def cache_info(self):
+        """Return a dict of cache statistics for converted graphs."""
+        backends = {} if self._cache is None else self._cache.get("backends", {})
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "evictions": self._cache_evictions,
+            "entries": sum(map(len, backends.values())),
+            "nbytes": sum(self._cache_lru.values()),
+        }
+
+    def _fingerprint(self):
+        # Cheap check of whether the DataFrame changed since graphs were cached.
+        # Adding, removing, or replacing columns or rows creates new arrays, but
+        # mutating values in-place (e.g. `df.loc[0, "weight"] = 2`) is not caught;
+        # use `df.__networkx_cache__.clear()` after doing this.
+        df = self._df
+        return (
+            tuple(df.columns),
+            len(df),
+            tuple(map(id, df._mgr.arrays)),
+            self._source,
+            self._target,
+            self._edge_key,
+            self.is_directed,
+            self.is_multigraph,
+            id(self._node_df),
+            id(self._isolated_nodes),
+            id(self.graph),
+        )
+
+    def _keep_derived(self, fingerprint):
+        """Keep the index and cached graphs of ``fingerprint`` for the current one.
+
+        Use this after changes that keep the nodes, edges and values of the graph.
+        """
+        new_fingerprint = self._fingerprint()
+        if self._csr is not None and self._csr[0] == fingerprint:
+            self._csr = (new_fingerprint, self._csr[1])
+        if self._cache is not None and self._cache.get("fingerprint") == fingerprint:
+            self._cache["fingerprint"] = new_fingerprint
+
+    def _cache_backends(self):
+        """Return the cache of converted graphs, clearing it if the DataFrame changed."""
+        if self._cache.get("fingerprint") != (fingerprint := self._fingerprint()):
+            self._cache["fingerprint"] = fingerprint
+            self._cache["backends"] = {}
+            self._cache_lru.clear()
+        return self._cache.setdefault("backends", {})
+
+    def _cache_get(self, backend_name, *keys):
+        """Get a converted graph by the first key found; return None if not found."""
+        if self._cache is None:
+            return None
+        cache = self._cache_backends().get(backend_name, {})
+        for key in keys:
+            if (rv := cache.get(key)) is not None:
+                self._cache_hits += 1
+                # Mark as most recently used
+                lru = self._cache_lru
+                lru_key = (backend_name, key)
+                lru[lru_key] = (
+                    lru.pop(lru_key) if lru_key in lru else _estimate_nbytes(rv)
+                )
+                return rv
+        self._cache_misses += 1
+        return None
+
+    def _cache_set(self, backend_name, key, value):
+        """Add a converted graph to the cache (if enabled), evicting if necessary."""
+        if self._cache is not None:
+            self._cache_backends().setdefault(backend_name, {})[key] = value
+            self._cache_lru.pop((backend_name, key), None)
+            self._cache_lru[backend_name, key] = _estimate_nbytes(value)
+            self._cache_evict()
+
+    def _cache_evict(self):
+        """Evict least recently used graphs until the cache is within its limits."""
+        if self._cache is None:
+            return
+        max_entries = self.cache_max_entries
+        max_bytes = self.cache_max_bytes
+        lru = self._cache_lru
+        nbytes = sum(lru.values())
+        backends = self._cache.get("backends", {})
+        while lru and (
+            max_entries is not None
+            and len(lru) > max_entries
+            or max_bytes is not None
+            and nbytes > max_bytes
+        ):
+            backend_name, key = lru_key = next(iter(lru))
+            nbytes -= lru.pop(lru_key)
+            backends.get(backend_name, {}).pop(key, None)
+            self._cache_evictions += 1
+
     def __dir__(self):
         attrs = super().__dir__()
         if not self.is_multigraph:
@@ -108,6 +384,9 @@ class NxAccessor:
         is_directed=None,
         is_multigraph=None,
         cache_enabled=None,
+        cache_max_entries=None,
+        cache_max_bytes=None,
+        compact_nodes=None,
     ):
         """Set many graph properties (i.e., ``df.nx`` attributes) at once.
 
@@ -138,9 +417,18 @@ class NxAccessor:
         if cache_enabled is not None:
             prev["cache_enabled"] = self.cache_enabled
             cur["cache_enabled"] = cache_enabled
+        if cache_max_entries is not None:
+            prev["cache_max_entries"] = self._cache_max_entries
+            cur["cache_max_entries"] = cache_max_entries
+        if cache_max_bytes is not None:
+            prev["cache_max_bytes"] = self._cache_max_bytes
+            cur["cache_max_bytes"] = cache_max_bytes
         try:
             for attr, val in cur.items():
                 setattr(self, attr, val)
+            if compact_nodes is not None:
+                # Last, since this uses the new source and target columns
+                self.compact_nodes = compact_nodes
         except Exception:
             for attr, val in prev.items():
                 setattr(self, attr, val)
@@ -148,6 +436,359 @@ class NxAccessor:
         return self._df
 
 
+def _derive_node_df(df, isolated_nodes):
+    # Nodes in order of first appearance in the edges, then isolated nodes
+    src = df[df.nx.source].tolist()
+    dst = df[df.nx.target].tolist()
+    nodes = list(dict.fromkeys(itertools.chain.from_iterable(zip(src, dst))))
+    nodes.extend(isolated_nodes)
+    return pd.DataFrame(index=pd.Index(nodes, tupleize_cols=False))
+
+
+def _append_edges(df, edges):
+    nx = df.nx
+    source = nx.source
+    target = nx.target
+    edge_key = nx.edge_key if nx.is_multigraph else None
+    num_edges = len(df)
+    src = edges[source].to_numpy()
+    dst = edges[target].to_numpy()
+    values = np.empty(2 * len(edges), np.result_type(src, dst))
+    values[::2] = src
+    values[1::2] = dst
+    values = pd.Index(values, tupleize_cols=False)
+    fingerprint = nx._fingerprint()
+    csr = nx._csr[1] if nx._csr is not None and nx._csr[0] == fingerprint else None
+
+    node_df = nx._node_df
+    isolated = nx._isolated_nodes
+    if isolated:
+        # New nodes must come after isolated nodes, which needs `node_df`
+        if csr is None or not values.isin(csr.nodes[: -len(isolated)]).all():
+            node_df = _derive_node_df(df, isolated)
+            isolated = None
+
+    # Append rows, keeping categorical nodes compact
+    if nx.compact_nodes:
+        categories = df[source].cat.categories
+        codes, categories = _encode(values, categories)
+        dtype = pd.CategoricalDtype(categories)
+        rv = pd.concat(
+            [df.drop(columns=[source, target]), edges.drop(columns=[source, target])],
+            ignore_index=True,
+        )
+        for col, old, new in [
+            (source, df[source], codes[::2]),
+            (target, df[target], codes[1::2]),
+        ]:
+            rv[col] = pd.Categorical.from_codes(
+                np.concatenate([old.cat.codes.to_numpy(), new]), dtype=dtype
+            )
+        rv = rv[[*df.columns, *(col for col in edges.columns if col not in df.columns)]]
+    else:
+        rv = pd.concat([df, edges], ignore_index=True)
+    rv.nx.set_properties(
+        source=source,
+        target=target,
+        is_directed=nx.is_directed,
+        is_multigraph=nx.is_multigraph,
+    )
+    if edge_key is not None:
+        rv.nx.edge_key = edge_key
+    rv.nx.graph.update(nx.graph)
+    rv.nx._node_df = node_df
+    rv.nx._isolated_nodes = None if isolated is None else list(isolated)
+
+    if csr is not None:
+        # Only the new edges are factorized
+        codes, nodes = _encode(values, csr.nodes)
+        dtype = _index_dtype(len(nodes))
+        new_csr = CSRIndex(
+            nodes,
+            np.concatenate([csr.src, codes[::2]]).astype(dtype, copy=False),
+            np.concatenate([csr.dst, codes[1::2]]).astype(dtype, copy=False),
+            is_directed=csr.is_directed,
+            is_multigraph=csr.is_multigraph,
+        )
+        rv.nx._csr = (rv.nx._fingerprint(), new_csr)
+
+    if nx._cache is not None:
+        rv.nx._cache = {}
+        if nx._cache.get("fingerprint") == fingerprint:
+            # Add new edges to cached networkx graphs; other backends are dropped
+            graphs = nx._cache.get("backends", {}).pop("networkx", {})
+            tail = rv.iloc[num_edges:]
+            for (edge_part, _, _), G in graphs.items():
+                _add_edges_from_pandas(
+                    G,
+                    tail,
+                    source,
+                    target,
+                    edge_key,
+                    edge_attrs=None if isinstance(edge_part, bool) else dict(edge_part),
+                    preserve_edge_attrs=edge_part is True,
+                )
+            for key, G in graphs.items():
+                rv.nx._cache_set("networkx", key, G)
+    return rv
+
+
+def _copy_on_write():
+    """Whether pandas copy-on-write is enabled (it always is since pandas 3)."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.get_option("mode.copy_on_write") is True
+
+
+def _share_columns(df):
+    """Return a copy of ``df`` that shares the buffers of its columns if possible.
+
+    With pandas copy-on-write, this is a shallow copy, and writing to either frame
+    copies the column first. Otherwise, this is a deep copy, since shared NumPy
+    columns would see writes made to the other frame.
+    """
+    if _copy_on_write():
+        return df.copy(deep=False)
+    return df.copy()
+
+
+def _view_columns(df):
+    """Return a copy of ``df`` that shares the buffers of its columns read-only.
+
+    With pandas copy-on-write, this is a shallow copy. Otherwise, NumPy columns
+    become read-only views, so writing to the copy in-place raises instead of
+    changing ``df`` until `_own_columns` copies them. Extension arrays are copied,
+    which shares the immutable buffers of Arrow-backed columns.
+    """
+    if _copy_on_write():
+        return df.copy(deep=False)
+    columns = {}
+    for i in range(df.shape[1]):
+        values = df.iloc[:, i]
+        if isinstance(values.dtype, np.dtype):
+            values = values.to_numpy().view()
+            values.flags.writeable = False
+        else:
+            values = values.array.copy()
+        columns[i] = values
+    rv = pd.DataFrame(columns, index=df.index, copy=False)
+    rv.columns = df.columns
+    return rv
+
+
+def _freeze_columns(df):
+    """Make NumPy columns of ``df`` read-only in-place, unless pandas copy-on-write.
+
+    Return whether columns were frozen; `_own_columns` makes them writeable again.
+    """
+    if _copy_on_write():
+        return False
+    for values in df._mgr.arrays:
+        if isinstance(values, np.ndarray):
+            values.flags.writeable = False
+    return True
+
+
+def _own_columns(df):
+    """Replace read-only NumPy columns of ``df`` with writeable copies in-place."""
+    if _copy_on_write():
+        return
+    for i, dtype in enumerate(df.dtypes):
+        if isinstance(dtype, np.dtype):
+            values = df.iloc[:, i].to_numpy()
+            if not values.flags.writeable:
+                df.isetitem(i, values.copy())
+
+
+def _freeze_frame(df):
+    """Make NumPy columns of graph DataFrame ``df`` and its node data read-only.
+
+    See `_freeze_columns`; return whether columns were frozen.
+    """
+    if df.nx._node_df is not None:
+        _freeze_columns(df.nx._node_df)
+    return _freeze_columns(df)
+
+
+def _own_frame(df):
+    """Copy read-only columns of graph DataFrame ``df`` and its node data in-place.
+
+    Values are the same, so the CSR index and cached graphs are kept.
+    """
+    fingerprint = df.nx._fingerprint()
+    _own_columns(df)
+    if df.nx._node_df is not None:
+        _own_columns(df.nx._node_df)
+    df.nx._keep_derived(fingerprint)
+
+
+def _copy_properties(df, rv):
+    """Copy graph properties (not nodes or derived data) of ``df`` to ``rv``."""
+    nx = df.nx
+    rv_nx = rv.nx
+    for attr in [
+        "_source",
+        "_target",
+        "_edge_key",
+        "is_directed",
+        "is_multigraph",
+        "_cache_max_entries",
+        "_cache_max_bytes",
+    ]:
+        setattr(rv_nx, attr, getattr(nx, attr))
+    rv_nx.graph = nx.graph.copy()
+    if nx._cache is not None:
+        rv_nx._cache = {}
+    return rv
+
+
+def _copy_frame(df, *, is_directed=None, is_multigraph=None, share=_share_columns):
+    """Return a copy of graph DataFrame ``df`` with columns copied by ``share``.
+
+    See `_share_columns` and `_view_columns`. Graph properties are copied, and
+    ``is_directed`` and ``is_multigraph`` may be changed without copying edges.
+    Unless they change, the CSR index and cached graphs are shared with the copy.
+    """
+    nx = df.nx
+    rv = share(df)
+    rv_nx = _copy_properties(df, rv).nx
+    if nx._node_df is not None:
+        rv_nx._node_df = share(nx._node_df)
+    if nx._isolated_nodes is not None:
+        rv_nx._isolated_nodes = list(nx._isolated_nodes)
+    if (is_directed is not None and is_directed != nx.is_directed) or (
+        is_multigraph is not None and is_multigraph != nx.is_multigraph
+    ):
+        rv_nx.set_properties(is_directed=is_directed, is_multigraph=is_multigraph)
+        return rv
+
+    # The index and cached graphs only depend on values, which are the same
+    fingerprint = nx._fingerprint()
+    if nx._csr is not None and nx._csr[0] == fingerprint:
+        rv_nx._csr = (rv_nx._fingerprint(), nx._csr[1])
+    if nx._cache is not None and nx._cache.get("fingerprint") == fingerprint:
+        for backend_name, graphs in nx._cache.get("backends", {}).items():
+            for key, G in graphs.items():
+                rv_nx._cache_set(backend_name, key, G)
+    return rv
+
+
+def _select_frame(df, node_mask, edge_mask):
+    """Return the graph DataFrame of the nodes and rows of ``df`` in boolean masks.
+
+    ``node_mask`` is aligned with ``df.nx.csr.nodes``, and rows in ``edge_mask``
+    must have both nodes selected. Node order and node data are kept, and the CSR
+    index of the result is derived from the codes of ``df.nx.csr``. If everything
+    is selected, the result shares the columns of ``df`` (see `_copy_frame`).
+    """
+    csr = df.nx.csr
+    if node_mask.all() and edge_mask.all():
+        return _copy_frame(df)
+    rv = _copy_properties(df, df[edge_mask])
+    nodes = csr.nodes[node_mask]
+    # Codes of selected nodes are in the same order as in `df`
+    remap = np.cumsum(node_mask) - 1
+    node_df = df.nx._node_df
+    if node_df is not None:
+        node_df = node_df[node_df.index.isin(nodes)]
+    _set_nodes(rv, nodes, remap[csr.src[edge_mask]], remap[csr.dst[edge_mask]], node_df)
+    return rv
+
+
+def _set_nodes(df, nodes, src, dst, node_df=None):
+    """Set the nodes of graph DataFrame ``df`` to ``nodes`` in that order.
+
+    ``src`` and ``dst`` are the codes in ``nodes`` of the source and target of
+    every row, and ``node_df`` is node data of some of the nodes or None. Node
+    order is given by ``node_df``, then edges, then isolated nodes, so ``node_df``
+    is extended to all nodes if necessary. The CSR index is set from the codes.
+    """
+    dtype = _index_dtype(len(nodes))
+    src = src.astype(dtype, copy=False)
+    dst = dst.astype(dtype, copy=False)
+    if node_df is not None:
+        before = nodes.get_indexer(node_df.index).astype(dtype, copy=False)
+    else:
+        before = np.empty(0, dtype)
+    values = np.empty(len(before) + 2 * len(src), dtype)
+    values[: len(before)] = before
+    values[len(before) :: 2] = src
+    values[len(before) + 1 :: 2] = dst
+    order = pd.unique(values)
+    isolated = np.ones(len(nodes), bool)
+    isolated[order] = False
+    order = np.concatenate([order, isolated.nonzero()[0]])
+    if (order != np.arange(len(nodes))).any():
+        # Nodes would be in a different order, so give all of them
+        if node_df is None:
+            node_df = pd.DataFrame(index=nodes)
+        else:
+            node_df = node_df.reindex(nodes)
+        df.nx.node_df = node_df
+    elif node_df is not None:
+        df.nx.node_df = node_df
+    elif isolated.any():
+        df.nx._isolated_nodes = nodes[isolated].tolist()
+    csr = CSRIndex(
+        nodes,
+        src,
+        dst,
+        is_directed=df.nx.is_directed,
+        is_multigraph=df.nx.is_multigraph,
+    )
+    df.nx._csr = (df.nx._fingerprint(), csr)
+    return csr
+
+
+def _merge_duplicates(df, keys):
+    """Merge rows of ``df`` with equal ``keys`` (an array or list of arrays).
+
+    Like updating edge data dicts in row order, the last non-missing value of each
+    column is kept. Return the merged DataFrame in order of first appearance of
+    keys and the position of the last row of each key.
+    """
+    positions = pd.Series(np.arange(len(df))).groupby(keys, sort=False, dropna=False)
+    positions = positions.last().to_numpy()
+    if len(positions) == len(df):
+        return df, positions
+    rv = df.groupby(keys, sort=False, dropna=False).last()
+    return rv.reset_index(drop=True), positions
+
+
+def _get_config(key, default=None):
+    # Import here, since this module may be imported while networkx is imported
+    import networkx as nx
+
+    config = getattr(nx.config.backends, "pandas", None)
+    return default if config is None else config.get(key, default)
+
+
+# Rough sizes of networkx graphs: bytes per node, and per entry in `G._adj`
+# (directed graphs also have `G._pred`), not including attributes.
+_NX_NODE_NBYTES = 250
+_NX_ADJ_NBYTES = 75
+
+
+def _estimate_nbytes(obj):
+    """Estimate the memory used by a cached graph, e.g. from its array sizes."""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage().sum())
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if hasattr(obj, "_adj") and hasattr(obj, "_node"):
+        # networkx graph
+        num_adj = sum(map(len, obj._adj.values()))
+        if obj.is_directed():
+            num_adj *= 2
+        return _NX_NODE_NBYTES * len(obj._node) + _NX_ADJ_NBYTES * num_adj
+    if hasattr(obj, "__dict__"):
+        # Graphs of other backends are often made of arrays
+        arrays = [val for val in vars(obj).values() if hasattr(val, "nbytes")]
+        if arrays:
+            return sum(int(val.nbytes) for val in arrays)
+    return sys.getsizeof(obj)
+
+
 def _attr_raise_if_invalid_graph(df, attr):
     try:
         df.nx.source
@@ -213,9 +854,3 @@ pd.DataFrame.__networkx_cache__ = property(__networkx_cache__)
 # Add `is_directed` and `is_multigraph` so `not_implemented_for` decorator works
 pd.DataFrame.is_directed = property(is_directed_property)
 pd.DataFrame.is_multigraph = property(is_multigraph_property)
-
-
-def get_info():
-    # Should we add config for e.g. default source, target, edge_key columns?
-    # Maybe config to enable/disable cache by default?
-    return {}
@@ -0,0 +1,9 @@
+from . import (
+    centrality,
+    cluster,
+    components,
+    function,
+    link_analysis,
+    operators,
+    relabel,
+)
@@ -0,0 +1,34 @@
+from nx_pandas.utils import _raise_if_undirected, _to_dict, networkx_algorithm
+
+from .function import _degree_arrays
+
+__all__ = ["degree_centrality", "in_degree_centrality", "out_degree_centrality"]
+
+
+@networkx_algorithm
+def degree_centrality(G):
+    csr = G.nx.csr
+    if csr.num_nodes <= 1:
+        return {n: 1 for n in csr.nodes.tolist()}
+    out_deg, in_deg = _degree_arrays(G)
+    return _to_dict(csr, (out_deg + in_deg) * (1.0 / (csr.num_nodes - 1.0)))
+
+
+@networkx_algorithm
+def in_degree_centrality(G):
+    _raise_if_undirected(G)
+    csr = G.nx.csr
+    if csr.num_nodes <= 1:
+        return {n: 1 for n in csr.nodes.tolist()}
+    _, in_deg = _degree_arrays(G)
+    return _to_dict(csr, in_deg * (1.0 / (csr.num_nodes - 1.0)))
+
+
+@networkx_algorithm
+def out_degree_centrality(G):
+    _raise_if_undirected(G)
+    csr = G.nx.csr
+    if csr.num_nodes <= 1:
+        return {n: 1 for n in csr.nodes.tolist()}
+    out_deg, _ = _degree_arrays(G)
+    return _to_dict(csr, out_deg * (1.0 / (csr.num_nodes - 1.0)))
@@ -0,0 +1,124 @@
+import numpy as np
+
+from nx_pandas.utils import (
+    _is_node,
+    _nbunch_to_dict,
+    _raise_if_directed,
+    _raise_if_multigraph,
+    _to_dict,
+    networkx_algorithm,
+)
+
+__all__ = ["average_clustering", "clustering", "transitivity", "triangles"]
+
+# Maximum number of wedges (paths of length two) to check at once
+_CHUNK_SIZE = 2**22
+
+
+def _triangles_and_degrees(csr):
+    """Return ``(triangles, degrees)`` arrays aligned with node codes.
+
+    Self-loops and parallel edges are ignored, so ``degrees`` is the number of
+    distinct neighbors of each node. Edges are oriented from lower to higher
+    ``(degree, code)``, so every triangle is found exactly once by joining each
+    oriented edge ``(a, b)`` with the out-neighbors ``c`` of ``a`` and checking
+    whether ``(b, c)`` is an oriented edge. This is done in chunks of at most
+    ``_CHUNK_SIZE`` wedges to bound peak memory.
+    """
+    N = csr.num_nodes
+    src, dst, _ = csr.edges
+    mask = src != dst
+    u = np.minimum(src[mask], dst[mask]).astype(np.int64)
+    v = np.maximum(src[mask], dst[mask]).astype(np.int64)
+    u, v = np.divmod(np.unique(u * N + v), N)
+    degrees = np.bincount(u, minlength=N) + np.bincount(v, minlength=N)
+    swap = degrees[u] > degrees[v]
+    keys = np.sort(np.where(swap, v, u) * N + np.where(swap, u, v))
+    a, b = np.divmod(keys, N)
+    indptr = np.zeros(N + 1, np.int64)
+    np.cumsum(np.bincount(a, minlength=N), out=indptr[1:])
+    # Number of wedges to check for each oriented edge
+    wedges = indptr[a + 1] - indptr[a]
+    ends = np.cumsum(wedges)
+    triangles = np.zeros(N, np.int64)
+    start = 0
+    while start < len(keys):
+        done = ends[start - 1] if start else 0
+        stop = max(np.searchsorted(ends, done + _CHUNK_SIZE, "right"), start + 1)
+        counts = wedges[start:stop]
+        # Gather the out-neighbors of `a` for all edges in the chunk at once
+        offsets = np.repeat(indptr[a[start:stop]] - np.cumsum(counts) + counts, counts)
+        c = b[offsets + np.arange(len(offsets))]
+        query = np.repeat(b[start:stop], counts) * N + c
+        pos = np.minimum(np.searchsorted(keys, query), len(keys) - 1)
+        found = keys[pos] == query
+        for x in [np.repeat(a[start:stop], counts), query // N, c]:
+            triangles += np.bincount(x[found], minlength=N)
+        start = stop
+    return triangles, degrees
+
+
+def _clustering_array(G, weight=None):
+    if G.nx.is_directed:
+        raise NotImplementedError("clustering of directed graphs")
+    if weight is not None:
+        raise NotImplementedError("weighted clustering")
+    _raise_if_multigraph(G)
+    csr = G.nx.csr
+    triangles, degrees = _triangles_and_degrees(csr)
+    # `2 * triangles / (d * (d - 1))`, but 0 (not nan) when there are no triangles
+    denom = degrees * (degrees - 1)
+    result = np.zeros(csr.num_nodes)
+    np.divide(2 * triangles, denom, out=result, where=triangles != 0)
+    return csr, result
+
+
+@networkx_algorithm
+def triangles(G, nodes=None):
+    _raise_if_directed(G)
+    csr = G.nx.csr
+    if nodes is not None:
+        # networkx only supports multigraphs for all nodes
+        _raise_if_multigraph(G)
+    result, _ = _triangles_and_degrees(csr)
+    if nodes is None:
+        return _to_dict(csr, result)
+    if _is_node(csr, nodes):
+        return result[csr.nodes.get_loc(nodes)].item()
+    return _nbunch_to_dict(csr, result, nodes)
+
+
+@networkx_algorithm
+def clustering(G, nodes=None, weight=None):
+    csr, result = _clustering_array(G, weight)
+    if nodes is None:
+        return _to_dict(csr, result)
+    if _is_node(csr, nodes):
+        return result[csr.nodes.get_loc(nodes)].item()
+    return _nbunch_to_dict(csr, result, nodes)
+
+
+@networkx_algorithm
+def average_clustering(G, nodes=None, weight=None, count_zeros=True):
+    if nodes is None:
+        _, c = _clustering_array(G, weight)
+    else:
+        c = np.array(list(clustering(G, nodes, weight=weight).values()))
+    if not count_zeros:
+        c = c[np.abs(c) > 0]
+    return float(c.sum()) / len(c)
+
+
+@networkx_algorithm
+def transitivity(G):
+    if G.nx.is_directed:
+        raise NotImplementedError("transitivity of directed graphs")
+    _raise_if_multigraph(G)
+    csr = G.nx.csr
+    if csr.num_nodes == 0:
+        return 0
+    triangles, degrees = _triangles_and_degrees(csr)
+    # Each triangle is counted once at each of its three nodes
+    num_triangles = 2 * int(triangles.sum())
+    contri = int((degrees * (degrees - 1)).sum())
+    return 0 if num_triangles == 0 else num_triangles / contri
@@ -0,0 +1,216 @@
+import networkx as nx
+import numpy as np
+
+from nx_pandas.utils import (
+    _raise_if_directed,
+    _raise_if_undirected,
+    networkx_algorithm,
+)
+
+__all__ = [
+    "connected_components",
+    "is_connected",
+    "is_strongly_connected",
+    "is_weakly_connected",
+    "node_connected_component",
+    "number_connected_components",
+    "number_strongly_connected_components",
+    "number_weakly_connected_components",
+    "strongly_connected_components",
+    "weakly_connected_components",
+]
+
+
+def _component_labels(csr):
+    """Label each node by the smallest node code in its (weakly) connected component.
+
+    This is array-based union-find: roots of the two endpoints of every edge are
+    hooked onto the smaller root, then paths are fully compressed by pointer
+    jumping. Edges within a single component are dropped after each round.
+    """
+    labels = np.arange(csr.num_nodes, dtype=csr.src.dtype)
+    src = csr.src
+    dst = csr.dst
+    while True:
+        lu = labels[src]
+        lv = labels[dst]
+        mask = lu != lv
+        if not mask.any():
+            return labels
+        src = src[mask]
+        dst = dst[mask]
+        lu = lu[mask]
+        lv = lv[mask]
+        np.minimum.at(labels, np.maximum(lu, lv), np.minimum(lu, lv))
+        while True:
+            parents = labels[labels]
+            if (parents == labels).all():
+                break
+            labels = parents
+
+
+def _components_from_labels(csr, labels):
+    """Yield sets of nodes of each component in the same order as networkx."""
+    order = np.argsort(labels, kind="stable")
+    bounds = np.flatnonzero(np.diff(labels[order])) + 1
+    nodes = csr.nodes.to_numpy()[order]
+    for group in np.split(nodes, bounds) if len(nodes) else []:
+        yield set(group.tolist())
+
+
+def _num_components(labels):
+    return int(np.count_nonzero(labels == np.arange(len(labels))))
+
+
+def _reachable(indptr, indices, source):
+    """Return a boolean mask of nodes reachable from ``source`` (breadth-first)."""
+    seen = np.zeros(len(indptr) - 1, bool)
+    seen[source] = True
+    frontier = np.array([source])
+    while len(frontier):
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        # Gather all neighbors of the frontier at once
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        nbrs = indices[offsets + np.arange(len(offsets))]
+        frontier = np.unique(nbrs[~seen[nbrs]])
+        seen[frontier] = True
+    return seen
+
+
+def _raise_if_null_graph(csr):
+    if csr.num_nodes == 0:
+        raise nx.NetworkXPointlessConcept(
+            "Connectivity is undefined for the null graph."
+        )
+
+
+@networkx_algorithm
+def connected_components(G):
+    _raise_if_directed(G)
+    csr = G.nx.csr
+    return _components_from_labels(csr, _component_labels(csr))
+
+
+@networkx_algorithm
+def number_connected_components(G):
+    _raise_if_directed(G)
+    return _num_components(_component_labels(G.nx.csr))
+
+
+@networkx_algorithm
+def is_connected(G):
+    _raise_if_directed(G)
+    csr = G.nx.csr
+    _raise_if_null_graph(csr)
+    return _num_components(_component_labels(csr)) == 1
+
+
+@networkx_algorithm
+def node_connected_component(G, n):
+    _raise_if_directed(G)
+    csr = G.nx.csr
+    if n not in csr.nodes:
+        raise KeyError(n)
+    seen = _reachable(csr.indptr, csr.indices, csr.nodes.get_loc(n))
+    return set(csr.nodes[seen].tolist())
+
+
+@networkx_algorithm
+def weakly_connected_components(G):
+    _raise_if_undirected(G)
+    csr = G.nx.csr
+    return _components_from_labels(csr, _component_labels(csr))
+
+
+@networkx_algorithm
+def number_weakly_connected_components(G):
+    _raise_if_undirected(G)
+    return _num_components(_component_labels(G.nx.csr))
+
+
+@networkx_algorithm
+def is_weakly_connected(G):
+    _raise_if_undirected(G)
+    csr = G.nx.csr
+    _raise_if_null_graph(csr)
+    return _num_components(_component_labels(csr)) == 1
+
+
+def _tarjan(csr):
+    """Yield lists of node codes of strongly connected components.
+
+    Iterative Tarjan's algorithm over the CSR arrays (no recursion or dicts).
+    """
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    N = csr.num_nodes
+    index = [-1] * N
+    lowlink = [0] * N
+    onstack = [False] * N
+    stack = []
+    counter = 0
+    for root in range(N):
+        if index[root] != -1:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        onstack[root] = True
+        work = [(root, indptr[root])]
+        while work:
+            v, pos = work[-1]
+            end = indptr[v + 1]
+            while pos < end:
+                w = indices[pos]
+                pos += 1
+                if index[w] == -1:
+                    # Descend into w; resume v at `pos` afterwards
+                    work[-1] = (v, pos)
+                    index[w] = lowlink[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    onstack[w] = True
+                    work.append((w, indptr[w]))
+                    break
+                if onstack[w] and index[w] < lowlink[v]:
+                    lowlink[v] = index[w]
+            else:
+                work.pop()
+                if lowlink[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        onstack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    yield component
+                if work and lowlink[v] < lowlink[u := work[-1][0]]:
+                    lowlink[u] = lowlink[v]
+
+
+@networkx_algorithm
+def strongly_connected_components(G):
+    _raise_if_undirected(G)
+    csr = G.nx.csr
+    nodes = csr.nodes.tolist()
+    return ({nodes[i] for i in component} for component in _tarjan(csr))
+
+
+@networkx_algorithm
+def number_strongly_connected_components(G):
+    _raise_if_undirected(G)
+    return sum(1 for _ in _tarjan(G.nx.csr))
+
+
+@networkx_algorithm
+def is_strongly_connected(G):
+    _raise_if_undirected(G)
+    csr = G.nx.csr
+    _raise_if_null_graph(csr)
+    # Strongly connected iff every node is reachable from and can reach node 0
+    return bool(
+        _reachable(csr.indptr, csr.indices, 0).all()
+        and _reachable(csr.in_indptr, csr.in_indices, 0).all()
+    )
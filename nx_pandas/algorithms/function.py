@@ -0,0 +1,323 @@
+import numpy as np
+import pandas as pd
+
+from nx_pandas._patch import (
+    _copy_frame,
+    _copy_properties,
+    _merge_duplicates,
+    _select_frame,
+    _set_nodes,
+    _share_columns,
+)
+from nx_pandas.utils import (
+    _edge_weights,
+    _is_node,
+    _nbr_slice,
+    _nbunch_codes,
+    _node_code,
+    _to_dict,
+    networkx_algorithm,
+)
+
+__all__ = [
+    "degree",
+    "density",
+    "edge_subgraph",
+    "is_empty",
+    "number_of_selfloops",
+    "restricted_view",
+    "subgraph",
+    "to_undirected",
+]
+
+
+def _degree_arrays(df, weight=None):
+    """Return ``(out_degree, in_degree)`` arrays aligned with ``df.nx.csr.nodes``."""
+    csr = df.nx.csr
+    src, dst, edge_ids = csr.edges
+    weights = _edge_weights(df, weight, edge_ids)
+    return (
+        np.bincount(src, weights, minlength=csr.num_nodes),
+        np.bincount(dst, weights, minlength=csr.num_nodes),
+    )
+
+
+def _degrees(df, weight=None):
+    """Return degrees aligned with ``df.nx.csr.nodes`` like ``G.degree(weight=...)``."""
+    out_deg, in_deg = _degree_arrays(df, weight)
+    degrees = out_deg + in_deg
+    if (
+        weight is not None
+        and weight in df.columns
+        and pd.api.types.is_integer_dtype(df[weight].dtype)
+    ):
+        degrees = degrees.astype(np.int64)
+    return degrees
+
+
+class DegreeView:
+    """View of node degrees like ``G.degree``; use ``G.degree(weight=...)``.
+
+    ``G.degree[n]`` uses the CSR slices of ``n``; iterating computes all degrees.
+    """
+
+    __slots__ = ("_df", "_nbunch", "_weight")
+
+    def __init__(self, df, nbunch=None, weight=None):
+        self._df = df
+        self._nbunch = nbunch
+        self._weight = weight
+
+    def __call__(self, nbunch=None, weight=None):
+        if nbunch is None:
+            if weight == self._weight:
+                return self
+            return type(self)(self._df, None, weight)
+        if _is_node(self._df.nx.csr, nbunch):
+            if weight == self._weight:
+                return self[nbunch]
+            return type(self)(self._df, None, weight)[nbunch]
+        return type(self)(self._df, nbunch, weight)
+
+    def __getitem__(self, n):
+        df = self._df
+        csr = df.nx.csr
+        if (i := _node_code(csr, n)) < 0:
+            raise KeyError(n)
+        slices = [(csr.indptr, csr.indices, csr.edge_ids)]
+        if df.nx.is_directed:
+            slices.append((csr.in_indptr, csr.in_indices, csr.in_edge_ids))
+        edge_ids = []
+        for indptr, indices, ids in slices:
+            edge_ids.append(ids[indptr[i] : indptr[i + 1]])
+            if not df.nx.is_directed:
+                # Self-loops are stored once, but add 2 to the degree
+                start, stop = _nbr_slice(indptr, indices, i, i)
+                edge_ids.append(ids[start:stop])
+        edge_ids = np.concatenate(edge_ids)
+        if self._weight is None or self._weight not in df.columns:
+            return len(edge_ids)
+        # Missing weights are 1 like in networkx
+        return df[self._weight].take(edge_ids).fillna(1).sum().item()
+
+    def __iter__(self):
+        csr = self._df.nx.csr
+        degrees = _degrees(self._df, self._weight)
+        if self._nbunch is None:
+            return iter(_to_dict(csr, degrees).items())
+        codes = _nbunch_codes(csr, self._nbunch)
+        return zip(csr.nodes.take(codes).tolist(), degrees[codes].tolist())
+
+    def __len__(self):
+        if self._nbunch is None:
+            return self._df.nx.csr.num_nodes
+        return len(_nbunch_codes(self._df.nx.csr, self._nbunch))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)})"
+
+    def __str__(self):
+        return str(list(self))
+
+
+@networkx_algorithm
+def degree(G, nbunch=None, weight=None):
+    # Not dispatched by networkx, since `nx.degree` uses `G.degree`, so call it
+    # with `backend_interface.degree(df)`. Like `G.degree`, this returns a view.
+    return DegreeView(G)(nbunch, weight)
+
+
+@networkx_algorithm
+def density(G, nodes=None):
+    # networkx dispatches `bipartite.density(B, nodes)` as "density", and
+    # `nx.density(G)` is not dispatchable, so we implement both here.
+    csr = G.nx.csr
+    n = csr.num_nodes
+    m = csr.num_edges
+    if nodes is not None:
+        # Same as `nx.bipartite.density`
+        nb = len(nodes)
+        nt = n - nb
+        if m == 0:
+            return 0.0
+        if G.nx.is_directed:
+            return m / (2 * nb * nt)
+        return m / (nb * nt)
+    if m == 0 or n <= 1:
+        return 0
+    d = m / (n * (n - 1))
+    if not G.nx.is_directed:
+        d *= 2
+    return d
+
+
+# `is_empty` and `number_of_selfloops` are dispatched by networkx since 3.5, so with
+# older versions, call them with the backend, e.g. `backend_interface.is_empty(df)`
+@networkx_algorithm
+def is_empty(G):
+    return len(G) == 0
+
+
+@networkx_algorithm
+def number_of_selfloops(G):
+    src, dst, _ = G.nx.csr.edges
+    return int(np.count_nonzero(src == dst))
+
+
+def _node_pairs(u, v, num_nodes, *, is_directed):
+    """Return one integer per node code pair; reversed pairs match if undirected."""
+    if not is_directed:
+        u, v = np.minimum(u, v), np.maximum(u, v)
+    return u.astype(np.int64) * num_nodes + v
+
+
+def _edge_pairs(df, u, v):
+    return _node_pairs(u, v, df.nx.csr.num_nodes, is_directed=df.nx.is_directed)
+
+
+def _multiedge_keys(df, pairs):
+    """Return the edge key of every row of a multigraph like `convert_to_nx`."""
+    edge_key = df.nx.edge_key
+    if edge_key is None:
+        return pd.Series(pairs).groupby(pairs).cumcount().to_numpy()
+    keys = df[edge_key]
+    if keys.dtype != object or not keys.isna().any():
+        return keys.to_numpy()
+    # Rows without keys get the next unused integer key of their edge
+    keys = keys.tolist()
+    seen = {}
+    for i, (pair, key) in enumerate(zip(pairs.tolist(), keys)):
+        pair_keys = seen.setdefault(pair, set())
+        if key is None:
+            key = keys[i] = len(pair_keys)
+            while key in pair_keys:
+                key = keys[i] = key + 1
+        pair_keys.add(key)
+    return np.array(keys, dtype=object)
+
+
+def _merge_edges(df, src, dst, num_nodes, edge_keys=None):
+    """Merge rows of graph DataFrame ``df`` that are the same edge.
+
+    ``src`` and ``dst`` are the node codes of rows, and ``edge_keys`` are the keys
+    of rows of multigraphs (see `_multiedge_keys`). Return the merged DataFrame,
+    which has the properties but not the nodes of ``df``, and its node codes.
+    """
+    keys = _node_pairs(src, dst, num_nodes, is_directed=df.nx.is_directed)
+    rv, positions = _merge_duplicates(
+        df, keys if edge_keys is None else [keys, edge_keys]
+    )
+    src = src[positions]
+    dst = dst[positions]
+    if edge_keys is not None:
+        edge_keys = edge_keys[positions]
+        if df.nx.edge_key is None:
+            # Rows without keys are given keys in row order, so sort by key
+            by_key = np.argsort(edge_keys, kind="stable")
+            rv = rv.take(by_key).reset_index(drop=True)
+            src = src[by_key]
+            dst = dst[by_key]
+        else:
+            rv = rv.copy(deep=False) if rv is df else rv
+            rv[df.nx.edge_key] = edge_keys
+    if rv is not df:
+        rv = _copy_properties(df, rv)
+    return rv, src, dst
+
+
+def _edges_to_codes(df, edges):
+    """Return node codes (-1 if not a node) of edges, and keys of multigraphs."""
+    csr = df.nx.csr
+    edges = list(edges)
+    if df.nx.is_multigraph:
+        us, vs, keys = zip(*edges) if edges else ((), (), ())
+    else:
+        us, vs = zip(*(edge[:2] for edge in edges)) if edges else ((), ())
+        keys = None
+    u = csr.nodes.get_indexer(pd.Index(us, dtype=object, tupleize_cols=False))
+    v = csr.nodes.get_indexer(pd.Index(vs, dtype=object, tupleize_cols=False))
+    return u, v, keys
+
+
+def _edge_mask(df, u, v, keys):
+    """Return a mask of the rows of ``df`` that are edges with codes ``u`` and ``v``."""
+    csr = df.nx.csr
+    valid = (u >= 0) & (v >= 0)
+    edges = _edge_pairs(df, u[valid], v[valid])
+    rows = _edge_pairs(df, csr.src, csr.dst)
+    if keys is None:
+        return np.isin(rows, edges)
+    keys = [key for key, is_valid in zip(keys, valid.tolist()) if is_valid]
+    rows = pd.MultiIndex.from_arrays([rows, _multiedge_keys(df, rows)])
+    return rows.isin(list(zip(edges.tolist(), keys)))
+
+
+@networkx_algorithm(returns_graph=True)
+def subgraph(G, nbunch):
+    csr = G.nx.csr
+    node_mask = np.zeros(csr.num_nodes, bool)
+    node_mask[_nbunch_codes(csr, nbunch)] = True
+    return _select_frame(G, node_mask, node_mask[csr.src] & node_mask[csr.dst])
+
+
+@networkx_algorithm(returns_graph=True)
+def edge_subgraph(G, edges):
+    csr = G.nx.csr
+    u, v, keys = _edges_to_codes(G, edges)
+    # Like networkx, nodes of edges not in the graph are included
+    node_mask = np.zeros(csr.num_nodes, bool)
+    node_mask[u[u >= 0]] = True
+    node_mask[v[v >= 0]] = True
+    return _select_frame(G, node_mask, _edge_mask(G, u, v, keys))
+
+
+@networkx_algorithm(returns_graph=True)
+def restricted_view(G, nodes, edges):
+    csr = G.nx.csr
+    node_mask = ~csr.nodes.isin(list(nodes))
+    edge_mask = ~_edge_mask(G, *_edges_to_codes(G, edges))
+    edge_mask &= node_mask[csr.src] & node_mask[csr.dst]
+    return _select_frame(G, node_mask, edge_mask)
+
+
+@networkx_algorithm(returns_graph=True)
+def to_undirected(G, reciprocal=False, as_view=False):
+    # Not dispatched by networkx, but used by `nx_pandas_graph` graphs
+    if as_view:
+        raise NotImplementedError("undirected views of graph DataFrames")
+    if not G.nx.is_directed:
+        return _copy_frame(G)
+    csr = G.nx.csr
+    src = csr.src
+    dst = csr.dst
+    keys = [_node_pairs(src, dst, csr.num_nodes, is_directed=False)]
+    if G.nx.is_multigraph:
+        # Keys of edges in both directions are merged like networkx does
+        keys.append(_multiedge_keys(G, _edge_pairs(G, src, dst)))
+    if not reciprocal and pd.MultiIndex.from_arrays(keys).is_unique:
+        # Nothing to merge, so only change the flag
+        return _copy_frame(G, is_directed=False)
+    # networkx updates edge data in order of source node
+    order = np.argsort(src, kind="stable")
+    edge_keys = keys[1] if G.nx.is_multigraph else None
+    if reciprocal:
+        # Keep edges in both directions, which must have the same key in multigraphs
+        pairs = _edge_pairs(G, src, dst)
+        reverse_pairs = _edge_pairs(G, dst, src)
+        if edge_keys is None:
+            is_reciprocal = np.isin(reverse_pairs, pairs)
+        else:
+            is_reciprocal = pd.MultiIndex.from_arrays([reverse_pairs, edge_keys]).isin(
+                pd.MultiIndex.from_arrays([pairs, edge_keys])
+            )
+        order = order[is_reciprocal[order]]
+    if edge_keys is not None:
+        edge_keys = edge_keys[order]
+    rv = _copy_properties(G, G.take(order))
+    rv.nx.is_directed = False
+    rv, src, dst = _merge_edges(rv, src[order], dst[order], csr.num_nodes, edge_keys)
+    node_df = G.nx._node_df
+    if node_df is not None:
+        node_df = _share_columns(node_df)
+    _set_nodes(rv, csr.nodes, src, dst, node_df)
+    return rv
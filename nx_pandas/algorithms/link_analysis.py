@@ -0,0 +1,120 @@
+import networkx as nx
+import numpy as np
+
+from nx_pandas.utils import _edge_weights, _to_dict, networkx_algorithm
+
+__all__ = ["hits", "pagerank"]
+
+
+def _adjacency_coo(df, weight):
+    """Return ``(rows, cols, weights)`` of the adjacency matrix of a graph DataFrame.
+
+    This matches ``nx.to_scipy_sparse_array``: undirected graphs are symmetric
+    with self-loops on the diagonal once, and weights of parallel edges are
+    summed (when summed with ``np.bincount``).
+    """
+    src, dst, edge_ids = df.nx.csr.edges
+    weights = _edge_weights(df, weight, edge_ids)
+    if weights is None:
+        weights = np.ones(len(src))
+    if df.nx.is_directed:
+        return src, dst, weights
+    mask = src != dst
+    return (
+        np.concatenate([src, dst[mask]]),
+        np.concatenate([dst, src[mask]]),
+        np.concatenate([weights, weights[mask]]),
+    )
+
+
+def _dict_to_array(csr, d):
+    """Return an array of values of dict ``d`` (default 0) in node code order."""
+    return np.fromiter(
+        (d.get(n, 0) for n in csr.nodes.tolist()), np.float64, csr.num_nodes
+    )
+
+
+@networkx_algorithm
+def pagerank(
+    G,
+    alpha=0.85,
+    personalization=None,
+    max_iter=100,
+    tol=1.0e-6,
+    nstart=None,
+    weight="weight",
+    dangling=None,
+):
+    csr = G.nx.csr
+    N = csr.num_nodes
+    if N == 0:
+        return {}
+    rows, cols, weights = _adjacency_coo(G, weight)
+    # Normalize rows to make the transition matrix (as `Q @ A` in networkx)
+    S = np.bincount(rows, weights, minlength=N)
+    is_dangling = np.flatnonzero(S == 0)
+    S[S != 0] = 1.0 / S[S != 0]
+    weights = weights * S[rows]
+
+    # initial vector
+    if nstart is None:
+        x = np.repeat(1.0 / N, N)
+    else:
+        x = _dict_to_array(csr, nstart)
+        x /= x.sum()
+
+    # Personalization vector
+    if personalization is None:
+        p = np.repeat(1.0 / N, N)
+    else:
+        p = _dict_to_array(csr, personalization)
+        if p.sum() == 0:
+            raise ZeroDivisionError
+        p /= p.sum()
+
+    # Dangling nodes
+    if dangling is None:
+        dangling_weights = p
+    else:
+        dangling_weights = _dict_to_array(csr, dangling)
+        dangling_weights /= dangling_weights.sum()
+
+    # power iteration: make up to max_iter iterations
+    for _ in range(max_iter):
+        xlast = x
+        # `x @ A` is a weighted bincount over the columns of A
+        xA = np.bincount(cols, x[rows] * weights, minlength=N)
+        x = alpha * (xA + x[is_dangling].sum() * dangling_weights) + (1 - alpha) * p
+        # check convergence, l1 norm
+        err = np.absolute(x - xlast).sum()
+        if err < N * tol:
+            return _to_dict(csr, x)
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+@networkx_algorithm
+def hits(G, max_iter=100, tol=1.0e-8, nstart=None, normalized=True):
+    import scipy as sp
+
+    csr = G.nx.csr
+    N = csr.num_nodes
+    if N == 0:
+        return {}, {}
+    rows, cols, weights = _adjacency_coo(G, "weight")
+    # Same matrix as `nx.adjacency_matrix`; duplicate entries are summed
+    A = sp.sparse.coo_array((weights, (rows, cols)), shape=(N, N)).tocsr()
+    if nstart is not None:
+        # Like networkx, starting values are used in order, not matched to nodes
+        nstart = np.array(list(nstart.values()))
+    if max_iter <= 0:
+        raise nx.PowerIterationFailedConvergence(max_iter)
+    try:
+        _, _, vt = sp.sparse.linalg.svds(A, k=1, v0=nstart, maxiter=max_iter, tol=tol)
+    except sp.sparse.linalg.ArpackNoConvergence as exc:
+        raise nx.PowerIterationFailedConvergence(max_iter) from exc
+    a = vt.flatten().real
+    h = A @ a
+    if normalized:
+        h /= h.sum()
+        a /= a.sum()
+    return _to_dict(csr, h), _to_dict(csr, a)
@@ -0,0 +1,205 @@
+import functools
+import itertools
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from nx_pandas._patch import (
+    _copy_properties,
+    _merge_duplicates,
+    _set_nodes,
+    _share_columns,
+)
+from nx_pandas.utils import networkx_algorithm
+
+from .function import _edge_pairs, _multiedge_keys, _node_pairs
+from .relabel import _relabel
+
+__all__ = ["compose", "disjoint_union", "reverse", "union"]
+
+
+@networkx_algorithm
+def reverse(G, copy=True):
+    if not G.nx.is_directed:
+        raise nx.NetworkXError("Cannot reverse an undirected graph.")
+    csr = G.nx.csr
+    source = G.nx.source
+    target = G.nx.target
+    # Swap the names of the source and target columns without copying them. With
+    # `copy=False`, columns are shared like networkx's reverse view shares data.
+    share = _share_columns if copy else functools.partial(pd.DataFrame.copy, deep=False)
+    rv = share(G)
+    rv.columns = [{source: target, target: source}.get(col, col) for col in rv.columns]
+    rv = _copy_properties(G, rv)
+    node_df = G.nx._node_df
+    if node_df is not None:
+        node_df = share(node_df)
+    rv_csr = _set_nodes(rv, csr.nodes, csr.dst, csr.src, node_df)
+    # Successors in the reverse graph are predecessors in `G`
+    if "_in" in vars(csr):
+        rv_csr._out = csr._in
+    if "_out" in vars(csr):
+        rv_csr._in = csr._out
+    return rv
+
+
+def _check_graphs(G, H):
+    if G.nx.is_directed != H.nx.is_directed:
+        raise nx.NetworkXError("All graphs must be directed or undirected.")
+    if G.nx.is_multigraph != H.nx.is_multigraph:
+        raise nx.NetworkXError("All graphs must be graphs or multigraphs.")
+
+
+def _node_data(df, labels):
+    """Return ``df.nx.node_df`` with nodes relabeled by ``labels``, or None.
+
+    ``labels`` is an Index of new labels aligned with ``df.nx.csr.nodes``.
+    """
+    if (node_df := df.nx._node_df) is None:
+        return None
+    rv = _share_columns(node_df)
+    rv.index = labels[df.nx.csr.nodes.get_indexer(node_df.index)]
+    return rv
+
+
+def _combine(G, H, nodes, g_codes, h_codes, *, merge):
+    """Return the graph DataFrame of the nodes and edges of ``G`` and then ``H``.
+
+    ``nodes`` is the Index of nodes of the result, and ``g_codes`` and ``h_codes``
+    are the codes in ``nodes`` of the nodes of each graph. If ``merge`` is True,
+    edges in both graphs are merged, and node data and edge data of ``H`` update
+    those of ``G``. Node columns are encoded from the codes, so they are compact
+    (see ``df.nx.compact_nodes``) if they are in ``G``.
+    """
+    _check_graphs(G, H)
+    g_csr = G.nx.csr
+    h_csr = H.nx.csr
+    src = np.concatenate([g_codes[g_csr.src], h_codes[h_csr.src]])
+    dst = np.concatenate([g_codes[g_csr.dst], h_codes[h_csr.dst]])
+    is_multigraph = G.nx.is_multigraph
+    g_names = [G.nx.source, G.nx.target, G.nx.edge_key if is_multigraph else None]
+    h_names = [H.nx.source, H.nx.target, H.nx.edge_key if is_multigraph else None]
+    # Edge attributes (and keys) of `H` are in columns with the names used in `G`
+    h_attrs = H.drop(columns=[name for name in h_names if name is not None])
+    g_attrs = G.drop(columns=[name for name in g_names if name is not None])
+    rv = pd.concat([g_attrs, h_attrs], ignore_index=True)
+    edge_key = None
+    if is_multigraph:
+        keys = np.concatenate(
+            [
+                _multiedge_keys(G, _edge_pairs(G, g_csr.src, g_csr.dst)),
+                _multiedge_keys(H, _edge_pairs(H, h_csr.src, h_csr.dst)),
+            ]
+        )
+        edge_key = g_names[2] if g_names[2] is not None else h_names[2]
+    if merge:
+        pairs = _node_pairs(src, dst, len(nodes), is_directed=G.nx.is_directed)
+        rv, positions = _merge_duplicates(rv, [pairs, keys] if is_multigraph else pairs)
+        src = src[positions]
+        dst = dst[positions]
+        if is_multigraph:
+            keys = keys[positions]
+
+    # Insert node (and key) columns where they are in `G`
+    if G.nx.compact_nodes:
+        dtype = pd.CategoricalDtype(nodes)
+        src_values = pd.Categorical.from_codes(src, dtype=dtype)
+        dst_values = pd.Categorical.from_codes(dst, dtype=dtype)
+    else:
+        src_values = nodes.take(src)
+        dst_values = nodes.take(dst)
+    columns = [(G.nx.source, src_values), (G.nx.target, dst_values)]
+    if edge_key is not None:
+        columns.append((edge_key, keys))
+    positions = {col: i for i, col in enumerate(G.columns)}
+    for col, values in sorted(
+        columns, key=lambda item: positions.get(item[0], len(G.columns))
+    ):
+        rv.insert(min(positions.get(col, len(G.columns)), len(rv.columns)), col, values)
+
+    rv = _copy_properties(G, rv)
+    rv.nx.graph.update(H.nx.graph)
+    if edge_key is not None:
+        rv.nx.edge_key = edge_key
+    node_dfs = [
+        node_df
+        for node_df in [
+            _node_data(G, nodes.take(g_codes)),
+            _node_data(H, nodes.take(h_codes)),
+        ]
+        if node_df is not None
+    ]
+    if not node_dfs:
+        node_df = None
+    elif len(node_dfs) == 1:
+        node_df = node_dfs[0]
+    else:
+        node_df = pd.concat(node_dfs)
+        if merge and not node_df.index.is_unique:
+            node_df = node_df.groupby(level=0, sort=False, dropna=False).last()
+    _set_nodes(rv, nodes, src, dst, node_df)
+    return rv
+
+
+@networkx_algorithm
+def compose(G, H):
+    g_nodes = G.nx.csr.nodes
+    h_nodes = H.nx.csr.nodes
+    nodes = g_nodes.append(h_nodes[~h_nodes.isin(g_nodes)])
+    return _combine(
+        G,
+        H,
+        nodes,
+        np.arange(len(g_nodes)),
+        nodes.get_indexer(h_nodes),
+        merge=True,
+    )
+
+
+def _add_prefix(df, prefix):
+    if prefix is None:
+        return df
+    labels = [f"{prefix}{node}" for node in df.nx.csr.nodes.tolist()]
+    return _relabel(df, pd.Index(labels, dtype=object))
+
+
+@networkx_algorithm
+def union(G, H, rename=()):
+    if rename:
+        # Like networkx, prefixes are added with `relabel_nodes`
+        G, H = (
+            _add_prefix(df, prefix)
+            for df, prefix in zip([G, H], itertools.chain(rename, [None, None]))
+        )
+    _check_graphs(G, H)
+    g_nodes = G.nx.csr.nodes
+    h_nodes = H.nx.csr.nodes
+    if h_nodes.isin(g_nodes).any():
+        raise nx.NetworkXError(
+            "The node sets of the graphs are not disjoint.\n"
+            "Use `rename` to specify prefixes for the graphs or use\n"
+            "disjoint_union(G1, G2, ..., GN)."
+        )
+    return _combine(
+        G,
+        H,
+        g_nodes.append(h_nodes),
+        np.arange(len(g_nodes)),
+        np.arange(len(g_nodes), len(g_nodes) + len(h_nodes)),
+        merge=False,
+    )
+
+
+@networkx_algorithm
+def disjoint_union(G, H):
+    # Same as relabeling nodes with `convert_node_labels_to_integers` first
+    num_nodes = G.nx.csr.num_nodes + H.nx.csr.num_nodes
+    return _combine(
+        G,
+        H,
+        pd.RangeIndex(num_nodes),
+        np.arange(G.nx.csr.num_nodes),
+        np.arange(G.nx.csr.num_nodes, num_nodes),
+        merge=False,
+    )
@@ -0,0 +1,121 @@
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from nx_pandas._patch import _copy_properties, _set_nodes, _share_columns
+from nx_pandas.utils import networkx_algorithm
+
+from .function import _degree_arrays, _merge_edges
+
+__all__ = ["convert_node_labels_to_integers", "relabel_nodes"]
+
+
+def _relabel(G, labels, *, label_attribute=None):
+    """Return a copy of graph DataFrame ``G`` with nodes relabeled by ``labels``.
+
+    ``labels`` is an Index of new labels aligned with ``G.nx.csr.nodes``. Only the
+    source and target columns are replaced; other columns share their buffers
+    with ``G``. Like ``nx.relabel_nodes``, nodes with the same label are merged:
+    node data is that of the last node, and edge data is updated in row order.
+    If ``label_attribute`` is given, old labels are added to node data.
+    """
+    csr = G.nx.csr
+    codes, nodes = labels.factorize()
+    merge = len(nodes) < len(labels)
+    src = codes[csr.src]
+    dst = codes[csr.dst]
+    rv = _share_columns(G)
+    if G.nx.compact_nodes:
+        dtype = pd.CategoricalDtype(nodes)
+        rv[G.nx.source] = pd.Categorical.from_codes(src, dtype=dtype)
+        rv[G.nx.target] = pd.Categorical.from_codes(dst, dtype=dtype)
+    else:
+        rv[G.nx.source] = nodes.take(src)
+        rv[G.nx.target] = nodes.take(dst)
+    rv = _copy_properties(G, rv)
+    if merge:
+        if G.nx.is_multigraph:
+            # networkx gives new keys to conflicting edges in order of `G.edges`
+            raise NotImplementedError("relabeling multigraphs with merged nodes")
+        # Update edge data in order of `G.edges` like networkx
+        if G.nx.is_directed:
+            order = np.argsort(csr.src, kind="stable")
+        else:
+            order = np.argsort(np.minimum(csr.src, csr.dst), kind="stable")
+        rv = _copy_properties(G, rv.take(order))
+        rv, src, dst = _merge_edges(rv, src[order], dst[order], len(nodes))
+
+    node_df = G.nx._node_df
+    if label_attribute is not None or merge and node_df is not None:
+        # Every node gets a row, since data of merged nodes is replaced
+        if node_df is None:
+            node_df = pd.DataFrame(index=csr.nodes)
+        else:
+            node_df = node_df.reindex(csr.nodes)
+        if label_attribute is not None:
+            node_df[label_attribute] = csr.nodes
+    elif node_df is not None:
+        node_df = _share_columns(node_df)
+    if node_df is not None:
+        node_df.index = labels[csr.nodes.get_indexer(node_df.index)]
+        if merge:
+            node_df = node_df[~node_df.index.duplicated(keep="last")].reindex(nodes)
+    _set_nodes(rv, nodes, src, dst, node_df)
+    return rv
+
+
+@networkx_algorithm
+def relabel_nodes(G, mapping, copy=True):
+    nodes = G.nx.csr.nodes.tolist()
+    if callable(mapping):
+        mapping = {node: mapping(node) for node in nodes}
+    labels = pd.Index([mapping.get(node, node) for node in nodes], tupleize_cols=False)
+    if copy:
+        return _relabel(G, labels)
+    if mapping.keys() & mapping.values() or not labels.is_unique:
+        # networkx relabels one node at a time, which may merge nodes or fail
+        raise NotImplementedError("relabeling in-place with overlapping labels")
+    # Replace the node columns of `G`
+    rv = _relabel(G, labels)
+    g_nx = G.nx
+    G[g_nx.source] = rv[g_nx.source]
+    G[g_nx.target] = rv[g_nx.target]
+    # Like networkx, relabeled nodes are moved after the other nodes
+    moved = np.array([label != node for node, label in zip(nodes, labels)], bool)
+    order = np.concatenate([(~moved).nonzero()[0], moved.nonzero()[0]])
+    ranks = np.empty(len(order), np.intp)
+    ranks[order] = np.arange(len(order))
+    csr = rv.nx.csr
+    node_df = rv.nx._node_df
+    if node_df is not None and moved.any():
+        node_df = node_df.reindex(labels.take(order))
+    g_nx._node_df = g_nx._isolated_nodes = None
+    _set_nodes(G, labels.take(order), ranks[csr.src], ranks[csr.dst], node_df)
+    return G
+
+
+@networkx_algorithm
+def convert_node_labels_to_integers(
+    G, first_label=0, ordering="default", label_attribute=None
+):
+    csr = G.nx.csr
+    labels = pd.RangeIndex(first_label, first_label + csr.num_nodes)
+    if ordering == "default":
+        return _relabel(G, labels, label_attribute=label_attribute)
+    if ordering not in {"sorted", "increasing degree", "decreasing degree"}:
+        raise nx.NetworkXError(f"Unknown node ordering: {ordering}")
+    try:
+        order = csr.nodes.argsort()
+    except TypeError as exc:
+        raise NotImplementedError("sorting nodes of different types") from exc
+    if ordering != "sorted":
+        # Sort by `(degree, node)` like networkx
+        ranks = np.empty(csr.num_nodes, np.intp)
+        ranks[order] = np.arange(csr.num_nodes)
+        out_deg, in_deg = _degree_arrays(G)
+        order = np.lexsort((ranks, out_deg + in_deg))
+        if ordering == "decreasing degree":
+            order = order[::-1]
+    ranks = np.empty(csr.num_nodes, np.intp)
+    ranks[order] = np.arange(csr.num_nodes)
+    return _relabel(G, labels.take(ranks), label_attribute=label_attribute)
@@ -0,0 +1,163 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["GraphBuilder", "from_edge_chunks"]
+
+# Aggregations that give the same result when applied to partial aggregates
+_AGGREGATES = {"sum", "min", "max", "first", "last"}
+
+
+class GraphBuilder:
+    """Build a graph DataFrame from chunks of edges without holding all of them.
+
+    Chunks are DataFrames of edges, such as from ``pd.read_csv(..., chunksize=n)``.
+    Nodes are factorized as chunks are added, so only integer node codes and the
+    requested attribute columns are kept. The result has categorical source and
+    target columns (see ``df.nx.compact_nodes``) and ``df.nx`` properties set.
+
+    Parameters
+    ----------
+    source, target : str
+        Names of the source and target columns of the chunks and the result.
+    edge_attrs : list of str, optional
+        Columns to keep as edge attributes; all other columns by default.
+    is_directed, is_multigraph : bool
+    aggregate : str, optional
+        Combine duplicate edges of simple graphs by aggregating edge attributes
+        with "sum", "min", "max", "first", or "last". By default, all edges are
+        kept, and later edges update earlier ones when converting to networkx.
+    """
+
+    def __init__(
+        self,
+        *,
+        source="source",
+        target="target",
+        edge_attrs=None,
+        is_directed=True,
+        is_multigraph=False,
+        aggregate=None,
+    ):
+        if aggregate is not None:
+            if is_multigraph:
+                raise ValueError("aggregate is only supported for simple graphs")
+            if aggregate not in _AGGREGATES:
+                raise ValueError(
+                    f"aggregate must be one of {sorted(_AGGREGATES)}; "
+                    f"got {aggregate!r}"
+                )
+        self.source = source
+        self.target = target
+        self.edge_attrs = edge_attrs
+        self.is_directed = is_directed
+        self.is_multigraph = is_multigraph
+        self.aggregate = aggregate
+        self._node_codes = {}  # {node: code} in order of first appearance
+        self._chunks = []  # DataFrames of codes and edge attributes
+        self._num_edges = 0
+
+    @property
+    def num_nodes(self):
+        return len(self._node_codes)
+
+    @property
+    def num_edges(self):
+        """Number of rows added so far (after aggregating each chunk)."""
+        return self._num_edges
+
+    def add_edges(self, chunk):
+        """Add a DataFrame of edges."""
+        src = chunk[self.source].to_numpy()
+        dst = chunk[self.target].to_numpy()
+        values = np.empty(2 * len(chunk), np.result_type(src, dst))
+        values[::2] = src
+        values[1::2] = dst
+        # Factorize at C speed, then only look up the distinct nodes of the chunk
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        node_codes = self._node_codes
+        uniques = uniques.tolist()
+        mapping = np.fromiter(
+            map(node_codes.get, uniques, itertools.repeat(-1)), np.int64, len(uniques)
+        )
+        if (new := (mapping < 0).nonzero()[0]).size:
+            start = len(node_codes)
+            mapping[new] = np.arange(start, start + new.size)
+            node_codes.update(
+                zip(map(uniques.__getitem__, new.tolist()), itertools.count(start))
+            )
+        dtype = np.int32 if len(node_codes) < np.iinfo(np.int32).max else np.int64
+        codes = mapping.astype(dtype, copy=False)[codes]
+        if self.edge_attrs is None:
+            names = [
+                col for col in chunk.columns if col not in {self.source, self.target}
+            ]
+        else:
+            names = self.edge_attrs
+        columns = {self.source: codes[::2], self.target: codes[1::2]}
+        columns.update((name, chunk[name].to_numpy()) for name in names)
+        df = pd.DataFrame(columns)
+        if self.aggregate is not None:
+            df = self._aggregate(df)
+        self._chunks.append(df)
+        self._num_edges += len(df)
+        return self
+
+    def build(self, *, compact_nodes=True):
+        """Return the graph DataFrame of all edges added.
+
+        Source and target columns are decoded to node labels if ``compact_nodes``
+        is False.
+        """
+        if self._chunks:
+            df = pd.concat(self._chunks, ignore_index=True)
+        else:
+            columns = [self.source, self.target, *(self.edge_attrs or [])]
+            df = pd.DataFrame({col: np.empty(0, np.int32) for col in columns})
+        if self.aggregate is not None and len(self._chunks) > 1:
+            df = self._aggregate(df)
+        # Chunks are replaced by the result
+        self._chunks = [df]
+        nodes = pd.Index(list(self._node_codes), tupleize_cols=False)
+        dtype = pd.CategoricalDtype(nodes)
+        df = df.copy(deep=False)
+        for col in [self.source, self.target]:
+            df[col] = pd.Categorical.from_codes(df[col].to_numpy(), dtype=dtype)
+        df.nx.set_properties(
+            source=self.source,
+            target=self.target,
+            is_directed=self.is_directed,
+            is_multigraph=self.is_multigraph,
+        )
+        if not compact_nodes:
+            df.nx.compact_nodes = False
+        return df
+
+    def _aggregate(self, df):
+        if not self.is_directed:
+            # Undirected edges are the same in either direction
+            source = df[self.source].to_numpy()
+            target = df[self.target].to_numpy()
+            df = df.assign(
+                **{
+                    self.source: np.minimum(source, target),
+                    self.target: np.maximum(source, target),
+                }
+            )
+        if len(df.columns) == 2:
+            return df.drop_duplicates(ignore_index=True)
+        grouped = df.groupby([self.source, self.target], sort=False)
+        return grouped.agg(self.aggregate).reset_index()
+
+
+def from_edge_chunks(chunks, **kwargs):
+    """Build a graph DataFrame from an iterable of DataFrames of edges.
+
+    For example, ``from_edge_chunks(pd.read_csv(path, chunksize=1_000_000))``.
+    Keyword arguments are given to `GraphBuilder`.
+    """
+    builder = GraphBuilder(**kwargs)
+    for chunk in chunks:
+        builder.add_edges(chunk)
+    return builder.build()
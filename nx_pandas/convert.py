@@ -0,0 +1,319 @@
+import itertools
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+_nan = float("nan")
+
+
+def _iter_adj(G):
+    """Yield ``(sources, targets, keys, datas)`` lists from one pass over ``G._adj``.
+
+    Edges are yielded in the same order as ``G.edges``. ``keys`` is None for
+    non-multigraphs.
+    """
+    sources = []
+    targets = []
+    datas = []
+    if G.is_multigraph():
+        keys = []
+        if G.is_directed():
+            for u, nbrs in G._adj.items():
+                for v, keydict in nbrs.items():
+                    n = len(keydict)
+                    sources.extend(itertools.repeat(u, n))
+                    targets.extend(itertools.repeat(v, n))
+                    keys.extend(keydict)
+                    datas.extend(keydict.values())
+        else:
+            seen = set()
+            for u, nbrs in G._adj.items():
+                for v, keydict in nbrs.items():
+                    if v not in seen:
+                        n = len(keydict)
+                        sources.extend(itertools.repeat(u, n))
+                        targets.extend(itertools.repeat(v, n))
+                        keys.extend(keydict)
+                        datas.extend(keydict.values())
+                seen.add(u)
+    else:
+        keys = None
+        if G.is_directed():
+            for u, nbrs in G._adj.items():
+                sources.extend(itertools.repeat(u, len(nbrs)))
+                targets.extend(nbrs)
+                datas.extend(nbrs.values())
+        else:
+            seen = set()
+            for u, nbrs in G._adj.items():
+                for v, data in nbrs.items():
+                    if v not in seen:
+                        sources.append(u)
+                        targets.append(v)
+                        datas.append(data)
+                seen.add(u)
+    return sources, targets, keys, datas
+
+
+def _attr_columns(datas, attrs, preserve_attrs, reserved=()):
+    """Build one list per attribute from a list of attribute dicts.
+
+    ``attrs`` is a dict of ``{attr: default}`` as given by the dispatcher. If it
+    is None and ``preserve_attrs`` is True, all attributes found are used.
+    Missing values are filled with the default, or NaN if the default is None.
+    """
+    if attrs is None:
+        if not preserve_attrs:
+            return {}
+        # Ordered union of all attribute names (this runs at C speed)
+        attrs = dict.fromkeys(itertools.chain.from_iterable(datas))
+    columns = {}
+    for attr, default in attrs.items():
+        if attr in reserved:
+            raise nx.NetworkXError(f"Column name {attr!r} is an attribute name")
+        if default is None:
+            if not any(attr in data for data in datas):
+                # Don't create columns of all NaN
+                continue
+            default = _nan
+        columns[attr] = [data.get(attr, default) for data in datas]
+    return columns
+
+
+def _edgelist_from_nx(
+    G,
+    *,
+    source="source",
+    target="target",
+    edge_key=None,
+    edge_attrs=None,
+    preserve_edge_attrs=False,
+):
+    """Create an edgelist DataFrame from a networkx graph with one walk of ``G._adj``.
+
+    Only the requested edge attributes are materialized. The DataFrame returned
+    does not have ``df.nx`` properties set.
+    """
+    sources, targets, keys, datas = _iter_adj(G)
+    reserved = {source, target}
+    columns = {source: sources, target: targets}
+    if keys is not None and edge_key is not None:
+        reserved.add(edge_key)
+        columns[edge_key] = keys
+    columns.update(_attr_columns(datas, edge_attrs, preserve_edge_attrs, reserved))
+    return pd.DataFrame(columns)
+
+
+def _node_df_from_nx(G, df, *, node_attrs=None, preserve_node_attrs=False):
+    """Set ``df.nx.node_df`` of node attributes in ``G`` iteration order.
+
+    Only the requested node attributes are materialized. If there are none, and
+    the nodes of ``G`` are in order of first appearance in the edges of ``df``
+    followed by isolated nodes, then only isolated nodes are kept and
+    ``df.nx.node_df`` is derived lazily.
+    """
+    columns = _attr_columns(G._node.values(), node_attrs, preserve_node_attrs)
+    if not columns:
+        src = df[df.nx.source].tolist()
+        dst = df[df.nx.target].tolist()
+        nodes = dict.fromkeys(itertools.chain.from_iterable(zip(src, dst)))
+        isolated = [n for n in G._node if n not in nodes]
+        if list(nodes) + isolated == list(G._node):
+            df.nx._isolated_nodes = isolated
+            return
+    df.nx.node_df = pd.DataFrame(columns, index=list(G._node))
+
+
+def _compact_node_columns(df):
+    """Replace the source and target columns with categoricals of shared nodes.
+
+    Categories are nodes in order of first appearance in the edges (unless the
+    columns are already categorical), and codes use the smallest integer dtype
+    that fits (int8, int16, or int32).
+    """
+    source = df.nx.source
+    target = df.nx.target
+    if isinstance(df[source].dtype, pd.CategoricalDtype) and isinstance(
+        df[target].dtype, pd.CategoricalDtype
+    ):
+        # Recode with the union of categories without decoding nodes
+        nodes = df[source].cat.categories.union(df[target].cat.categories, sort=False)
+        df[source] = df[source].cat.set_categories(nodes)
+        df[target] = df[target].cat.set_categories(nodes)
+        return
+    src = df[source].to_numpy()
+    dst = df[target].to_numpy()
+    values = np.empty(2 * len(df), np.result_type(src, dst))
+    values[::2] = src
+    values[1::2] = dst
+    codes, nodes = pd.factorize(values)
+    dtype = pd.CategoricalDtype(pd.Index(nodes, tupleize_cols=False))
+    df[source] = pd.Categorical.from_codes(codes[::2], dtype=dtype)
+    df[target] = pd.Categorical.from_codes(codes[1::2], dtype=dtype)
+
+
+def _expand_node_columns(df):
+    """Replace categorical source and target columns with the node labels."""
+    for col in [df.nx.source, df.nx.target]:
+        df[col] = df[col].astype(df[col].cat.categories.dtype)
+
+
+def _node_datas_from_columns(columns, num_nodes):
+    """Build one attribute dict per node from ``{attr: Series}``, skipping missing."""
+    datas = [{} for _ in range(num_nodes)]
+    for col, values in columns.items():
+        mask = values.notna().to_numpy()
+        values = values.tolist()
+        if mask.all():
+            for data, val in zip(datas, values):
+                data[col] = val
+        else:
+            for i in mask.nonzero()[0].tolist():
+                datas[i][col] = values[i]
+    return datas
+
+
+def _attr_series(df, names, attrs, preserve_attrs):
+    """Return ``{attr: Series}`` of the columns of ``df`` to use as attributes.
+
+    ``attrs`` and ``preserve_attrs`` are as in `_attr_columns`. Only columns in
+    ``names`` may be used, and requested attributes that are not columns are
+    skipped (they are missing everywhere). Missing values are filled with the
+    default of requested attributes if the default is not None.
+    """
+    if attrs is None:
+        return {name: df[name] for name in names} if preserve_attrs else {}
+    names = set(names)
+    columns = {}
+    for attr, default in attrs.items():
+        if attr not in names:
+            continue
+        values = df[attr]
+        if default is not None and values.hasnans:
+            values = values.fillna(default)
+        columns[attr] = values
+    return columns
+
+
+def _nx_from_pandas(
+    df,
+    create_using,
+    *,
+    edge_attrs=None,
+    node_attrs=None,
+    preserve_edge_attrs=True,
+    preserve_node_attrs=True,
+    preserve_graph_attrs=True,
+):
+    """Create a networkx graph from a graph DataFrame in a single pass.
+
+    Nodes from ``df.nx.node_df`` are added first (in order) followed by nodes
+    first seen in the edges, then isolated nodes if ``node_df`` is not derived yet.
+    Edges are inserted directly into the adjacency dicts in row order, matching
+    ``nx.from_pandas_edgelist``.
+
+    Only the requested edge and node attributes are materialized (all of them by
+    default); missing values of requested attributes are filled with defaults.
+    """
+    G = create_using()
+    node = G._node
+    adj = G._adj
+    pred = G._pred if G.is_directed() else adj
+    node_factory = G.node_attr_dict_factory
+    adj_factory = G.adjlist_inner_dict_factory
+
+    if (node_df := df.nx._node_df) is not None:
+        columns = _attr_series(
+            node_df, node_df.columns, node_attrs, preserve_node_attrs
+        )
+        datas = _node_datas_from_columns(columns, len(node_df))
+        for n, data in zip(node_df.index, datas):
+            if n in node:
+                node[n].update(data)
+            else:
+                node[n] = data
+                adj[n] = adj_factory()
+                if pred is not adj:
+                    pred[n] = adj_factory()
+
+    source = df.nx.source
+    target = df.nx.target
+    edge_key = df.nx.edge_key if df.nx.is_multigraph else None
+    _add_edges_from_pandas(
+        G,
+        df,
+        source,
+        target,
+        edge_key,
+        edge_attrs=edge_attrs,
+        preserve_edge_attrs=preserve_edge_attrs,
+    )
+    # Isolated nodes come after nodes first seen in edges
+    for n in df.nx._isolated_nodes or ():
+        node[n] = node_factory()
+        adj[n] = adj_factory()
+        if pred is not adj:
+            pred[n] = adj_factory()
+    if preserve_graph_attrs:
+        G.graph.update(df.nx.graph)
+    return G
+
+
+def _add_edges_from_pandas(
+    G, df, source, target, edge_key=None, *, edge_attrs=None, preserve_edge_attrs=True
+):
+    """Add edges in the rows of ``df`` to networkx graph ``G``.
+
+    Nodes first seen in the edges are added first, in order of appearance. Edges
+    are inserted directly into the adjacency dicts in row order, and all columns
+    other than source, target, and edge key columns may be edge attributes.
+    """
+    node = G._node
+    adj = G._adj
+    pred = G._pred if G.is_directed() else adj
+    node_factory = G.node_attr_dict_factory
+    adj_factory = G.adjlist_inner_dict_factory
+    names = [col for col in df.columns if col not in {source, target, edge_key}]
+    columns = _attr_series(df, names, edge_attrs, preserve_edge_attrs)
+    sources = df[source].tolist()
+    targets = df[target].tolist()
+    # Add nodes first seen in edges, in order of appearance
+    for n in itertools.chain.from_iterable(zip(sources, targets)):
+        if n not in node:
+            node[n] = node_factory()
+            adj[n] = adj_factory()
+            if pred is not adj:
+                pred[n] = adj_factory()
+
+    if columns:
+        names = list(columns)
+        values = [col.tolist() for col in columns.values()]
+        datas = (dict(zip(names, vals)) for vals in zip(*values))
+    else:
+        datas = (G.edge_attr_dict_factory() for _ in range(len(sources)))
+    if not G.is_multigraph():
+        for u, v, data in zip(sources, targets, datas):
+            nbrs = adj[u]
+            if (dd := nbrs.get(v)) is None:
+                nbrs[v] = pred[v][u] = data
+            else:
+                dd.update(data)
+    else:
+        if edge_key is None:
+            keys = itertools.repeat(None)
+        else:
+            keys = df[edge_key].tolist()
+        for u, v, key, data in zip(sources, targets, keys, datas):
+            nbrs = adj[u]
+            if (keydict := nbrs.get(v)) is None:
+                keydict = nbrs[v] = pred[v][u] = G.edge_key_dict_factory()
+            if key is None:
+                # Same as `G.new_edge_key(u, v)`
+                key = len(keydict)
+                while key in keydict:
+                    key += 1
+            if (dd := keydict.get(key)) is None:
+                keydict[key] = data
+            else:
+                dd.update(data)
@@ -0,0 +1,309 @@
+import hashlib
+import json
+import os
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["CSRIndex"]
+
+# Format version of indexes saved with `CSRIndex.save`
+_SAVE_VERSION = 2
+
+
+class CSRIndex:
+    """Integer-coded adjacency index of a graph DataFrame.
+
+    Nodes are encoded as integers ``0..N-1`` in the same order networkx graphs
+    converted from the DataFrame iterate over nodes: nodes in ``df.nx.node_df``
+    first, then nodes in order of first appearance in the edges, then isolated
+    nodes if ``node_df`` has not been derived yet.
+
+    Attributes
+    ----------
+    nodes : pd.Index
+        The node label table; node code ``i`` is ``nodes[i]``.
+    src, dst : np.ndarray
+        Node codes of the source and target of every row of the DataFrame.
+    indptr, indices, edge_ids : np.ndarray
+        CSR adjacency. Neighbors of node ``i`` are ``indices[indptr[i]:indptr[i+1]]``
+        sorted by code, and ``edge_ids`` holds the DataFrame row position of each
+        entry. Undirected graphs store both directions (self-loops once).
+        Duplicate edges of non-multigraphs are stored once using the last row.
+    in_indptr, in_indices, in_edge_ids : np.ndarray
+        CSC (predecessor) adjacency; the same arrays as CSR for undirected graphs.
+    """
+
+    def __init__(self, nodes, src, dst, *, is_directed, is_multigraph):
+        self.nodes = nodes
+        self.src = src
+        self.dst = dst
+        self.is_directed = is_directed
+        self.is_multigraph = is_multigraph
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """Factorize the source and target columns of a graph DataFrame."""
+        src = df[df.nx.source]
+        dst = df[df.nx.target]
+        num_edges = len(src)
+        node_df = df.nx._node_df
+        isolated = df.nx._isolated_nodes
+        before = node_df.index if node_df is not None else pd.Index([])
+        after = pd.Index(isolated or [], tupleize_cols=False)
+        num_before = len(before)
+        end = num_before + 2 * num_edges
+        if df.nx.compact_nodes:
+            # Factorize the (small) integer codes instead of the node labels
+            categories = src.cat.categories
+            src = src.cat.codes.to_numpy()
+            dst = dst.cat.codes.to_numpy()
+            before, categories = _encode(before, categories)
+            after, categories = _encode(after, categories)
+        else:
+            categories = None
+            src = src.to_numpy()
+            dst = dst.to_numpy()
+            before = before.to_numpy()
+            after = after.to_numpy()
+        # Interleave so codes are assigned in order of first appearance
+        arrays = [src, dst, *(x for x in [before, after] if len(x))]
+        values = np.empty(end + len(after), np.result_type(*arrays))
+        values[:num_before] = before
+        values[num_before:end:2] = src
+        values[num_before + 1 : end : 2] = dst
+        values[end:] = after
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        codes = codes.astype(_index_dtype(len(uniques)), copy=False)
+        if categories is not None:
+            uniques = categories.take(uniques)
+        return cls(
+            pd.Index(uniques, tupleize_cols=False),
+            codes[num_before:end:2],
+            codes[num_before + 1 : end : 2],
+            is_directed=df.nx.is_directed,
+            is_multigraph=df.nx.is_multigraph,
+        )
+
+    def save(self, path, fingerprint):
+        """Save the index as ``.npy`` files in the directory ``path``.
+
+        ``fingerprint`` (a string) is saved with the arrays to validate them
+        against the DataFrame when loading.
+        """
+        os.makedirs(path, exist_ok=True)
+        nodes, nodes_pickled = _node_array(self.nodes)
+        np.save(os.path.join(path, "nodes.npy"), nodes, allow_pickle=nodes_pickled)
+        arrays = {"src": self.src, "dst": self.dst}
+        arrays.update(zip(["indptr", "indices", "edge_ids"], self._out))
+        if self.is_directed:
+            arrays.update(zip(["in_indptr", "in_indices", "in_edge_ids"], self._in))
+        for name, array in arrays.items():
+            np.save(os.path.join(path, f"{name}.npy"), array)
+        info = {
+            "version": _SAVE_VERSION,
+            "fingerprint": fingerprint,
+            "is_directed": self.is_directed,
+            "is_multigraph": self.is_multigraph,
+            "nodes_pickled": nodes_pickled,
+            "arrays": list(arrays),
+        }
+        # Written last, so an interrupted save is never loaded
+        with open(os.path.join(path, "info.json"), "w") as f:
+            json.dump(info, f)
+
+    @classmethod
+    def load(cls, path, *, mmap_mode="r", fingerprint=None, allow_pickle=False):
+        """Load an index saved with `save`, or return None if it doesn't exist.
+
+        None is also returned if ``fingerprint`` is given and does not match the
+        saved fingerprint. Arrays are memory-mapped by default, so processes that
+        load the same index share memory. Node labels that are neither numbers
+        nor strings are pickled, and loading them may run arbitrary code, so
+        None is returned for such indexes unless ``allow_pickle`` is True.
+        """
+        try:
+            with open(os.path.join(path, "info.json")) as f:
+                info = json.load(f)
+        except FileNotFoundError:
+            return None
+        if info["version"] != _SAVE_VERSION or (
+            fingerprint is not None and info["fingerprint"] != fingerprint
+        ):
+            return None
+        if info["nodes_pickled"] and not allow_pickle:
+            return None
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in info["arrays"]
+        }
+        nodes = np.load(
+            os.path.join(path, "nodes.npy"), allow_pickle=info["nodes_pickled"]
+        )
+        rv = cls(
+            pd.Index(nodes, tupleize_cols=False),
+            arrays["src"],
+            arrays["dst"],
+            is_directed=info["is_directed"],
+            is_multigraph=info["is_multigraph"],
+        )
+        # Set cached properties so nothing is recomputed
+        rv._out = arrays["indptr"], arrays["indices"], arrays["edge_ids"]
+        if rv.is_directed:
+            rv._in = arrays["in_indptr"], arrays["in_indices"], arrays["in_edge_ids"]
+        return rv
+
+    @property
+    def num_nodes(self):
+        return len(self.nodes)
+
+    @property
+    def num_edges(self):
+        return len(self.edges[0])
+
+    @cached_property
+    def edges(self):
+        """``(src, dst, edge_ids)`` of the distinct edges of the graph in row order.
+
+        This is every row for multigraphs. Otherwise, duplicate edges (including
+        reversed edges of undirected graphs) are dropped keeping the last row.
+        """
+        edge_ids = np.arange(len(self.src), dtype=_index_dtype(len(self.src)))
+        if self.is_multigraph or len(self.src) < 2:
+            return self.src, self.dst, edge_ids
+        if self.is_directed:
+            u, v = self.src, self.dst
+        else:
+            u, v = np.minimum(self.src, self.dst), np.maximum(self.src, self.dst)
+        key = u.astype(np.int64) * self.num_nodes + v
+        mask = ~pd.Series(key).duplicated(keep="last").to_numpy()
+        if mask.all():
+            return self.src, self.dst, edge_ids
+        return self.src[mask], self.dst[mask], edge_ids[mask]
+
+    @property
+    def indptr(self):
+        return self._out[0]
+
+    @property
+    def indices(self):
+        return self._out[1]
+
+    @property
+    def edge_ids(self):
+        return self._out[2]
+
+    @property
+    def in_indptr(self):
+        return self._in[0] if self.is_directed else self._out[0]
+
+    @property
+    def in_indices(self):
+        return self._in[1] if self.is_directed else self._out[1]
+
+    @property
+    def in_edge_ids(self):
+        return self._in[2] if self.is_directed else self._out[2]
+
+    @cached_property
+    def _out(self):
+        edge_ids = np.arange(len(self.src), dtype=_index_dtype(len(self.src)))
+        if self.is_directed:
+            return self._compress(self.src, self.dst, edge_ids)
+        # Symmetrize (interleaved to keep row order), but add self-loops once
+        mask = np.repeat(self.src != self.dst, 2)
+        mask[::2] = True
+        return self._compress(
+            np.column_stack([self.src, self.dst]).ravel()[mask],
+            np.column_stack([self.dst, self.src]).ravel()[mask],
+            np.repeat(edge_ids, 2)[mask],
+        )
+
+    @cached_property
+    def _in(self):
+        edge_ids = np.arange(len(self.src), dtype=_index_dtype(len(self.src)))
+        return self._compress(self.dst, self.src, edge_ids)
+
+    def _compress(self, rows, cols, edge_ids):
+        # Stable sort by (row, col) keeps duplicate edges in row order
+        order = np.argsort(rows.astype(np.int64) * self.num_nodes + cols, kind="stable")
+        rows = rows[order]
+        cols = cols[order]
+        edge_ids = edge_ids[order]
+        if not self.is_multigraph and len(rows) > 1:
+            # Keep the last duplicate, like later rows updating edge data
+            keep = np.ones(len(rows), bool)
+            keep[:-1] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+            rows = rows[keep]
+            cols = cols[keep]
+            edge_ids = edge_ids[keep]
+        indptr = np.zeros(self.num_nodes + 1, _index_dtype(len(rows)))
+        np.cumsum(np.bincount(rows, minlength=self.num_nodes), out=indptr[1:])
+        return indptr, cols, edge_ids
+
+
+def _content_fingerprint(df):
+    """Return a hex digest of the nodes and edges of a graph DataFrame.
+
+    This hashes all of the source and target columns, which is much faster for
+    numeric or categorical (see ``df.nx.compact_nodes``) columns than for objects.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update(repr((_SAVE_VERSION, df.nx.is_directed, df.nx.is_multigraph)).encode())
+    node_df = df.nx._node_df
+    columns = [
+        df[df.nx.source],
+        df[df.nx.target],
+        pd.Series(node_df.index if node_df is not None else []),
+        pd.Series(df.nx._isolated_nodes or [], dtype=object),
+    ]
+    for values in columns:
+        h.update(repr((len(values), str(values.dtype))).encode())
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            h.update(pd.util.hash_array(values.cat.categories.to_numpy()))
+            values = values.cat.codes
+        values = values.to_numpy()
+        if values.dtype.kind not in "biufcmM":
+            values = pd.util.hash_array(values)
+        h.update(np.ascontiguousarray(values))
+    return h.hexdigest()
+
+
+def _node_array(nodes):
+    """Return ``(array, pickled)`` to save node labels ``nodes`` with ``np.save``.
+
+    Strings are saved as a NumPy string array, so only labels that are neither
+    numbers nor strings are saved as an object array, which must be pickled.
+    """
+    array = nodes.to_numpy()
+    if array.dtype != object:
+        return array, False
+    if pd.api.types.infer_dtype(array, skipna=False) in {"string", "empty"}:
+        strings = array.astype(str)
+        # NumPy strings can't end with null characters
+        if strings.tolist() == array.tolist():
+            return strings, False
+    return array, True
+
+
+def _encode(values, categories):
+    """Return codes of ``values`` in ``categories``, and categories with new values.
+
+    Values not in ``categories`` are appended to them in order of first appearance.
+    """
+    if not len(values):
+        return np.empty(0, np.intp), categories
+    codes = categories.get_indexer(values)
+    if (missing := codes < 0).any():
+        new_codes, new_values = pd.factorize(values[missing])
+        codes[missing] = len(categories) + new_codes
+        new_values = pd.Index(new_values, tupleize_cols=False)
+        if len(categories):
+            new_values = categories.append(new_values)
+        categories = new_values
+    return codes, categories
+
+
+def _index_dtype(n):
+    return np.int32 if n < np.iinfo(np.int32).max else np.int64
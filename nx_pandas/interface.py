@@ -1,3 +1,5 @@
+import inspect
+import itertools
 import os
 from functools import partial
 
@@ -6,6 +8,11 @@ import pandas as pd
 from networkx.classes.reportviews import NodeView
 from networkx.utils.backends import _registered_algorithms, _load_backend
 
+from . import _instrument, _patch  # noqa: F401 (adds `df.nx`)
+from . import algorithms  # noqa: F401 (registers native algorithms)
+from .convert import _edgelist_from_nx, _node_df_from_nx, _nx_from_pandas
+from .utils import _registry
+
 _IS_TESTING = os.environ.get("NETWORKX_TEST_BACKEND") in {"pandas", "pandas_graph"}
 
 
@@ -31,55 +38,49 @@ class BackendInterface:
             new_graph.add_nodes_from(G.items())
             G = new_graph
 
-        # PERF: optimize all of this! Don't use `nx.to_pandas_edgelist`
-        keep_cols = {source, target}
-        if G.is_multigraph() and edge_key is not None:
-            keep_cols.add(edge_key)
-        else:
+        if not G.is_multigraph():
             edge_key = None
-        df = nx.to_pandas_edgelist.orig_func(
-            G, source=source, target=target, edge_key=edge_key
+        # Only the requested attributes are materialized as columns
+        df = _edgelist_from_nx(
+            G,
+            source=source,
+            target=target,
+            edge_key=edge_key,
+            edge_attrs=edge_attrs,
+            preserve_edge_attrs=preserve_edge_attrs,
         )
-        if edge_attrs is not None:
-            # Drop unused columns and apply default
-            df = df.drop(columns=df.columns.difference(keep_cols | edge_attrs.keys()))
-            for edge_attr, edge_default in edge_attrs.items():
-                if edge_default is not None and edge_attr in df.columns:
-                    df[edge_attr] = df[edge_attr].fillna(edge_default)
-        elif not preserve_edge_attrs:
-            # Drop data columns
-            df = df.drop(columns=df.columns.difference(keep_cols))
-
-        # Handle node attributes
-        if preserve_node_attrs:
-            node_df = pd.DataFrame.from_dict(G.nodes, orient="index")
-            if len(node_df) != len(G):
-                node_df = node_df.reindex(G)
-        elif node_attrs is not None:
-            node_df = pd.DataFrame.from_dict(G.nodes, orient="index")
-            node_df = node_df.drop(columns=node_df.columns.difference(node_attrs))
-            if len(node_df) != len(G):
-                node_df = node_df.reindex(G)
-            for node_attr, node_default in node_attrs.items():
-                if node_default is not None and node_attr in node_df.columns:
-                    node_df[node_attr] = node_df[node_attr].fillna(node_default)
-        else:
-            node_df = pd.DataFrame(index=G)
-        df.nx.node_df = node_df
-
         # Update `df.nx` attributes
         df.nx.source = source
         df.nx.target = target
+        _node_df_from_nx(
+            G,
+            df,
+            node_attrs=node_attrs if not preserve_node_attrs else None,
+            preserve_node_attrs=preserve_node_attrs,
+        )
         df.nx.is_directed = G.is_directed()
         df.nx.is_multigraph = G.is_multigraph()
         if G.is_multigraph():
             df.nx.edge_key = edge_key
         if preserve_graph_attrs:
             df.nx.graph.update(G.graph)
+        if _get_config("compact_nodes"):
+            df.nx.compact_nodes = True
         return df
 
     @staticmethod
-    def convert_to_nx(obj, *, name=None):
+    def convert_to_nx(
+        obj,
+        *,
+        name=None,
+        edge_attrs=None,
+        node_attrs=None,
+        preserve_edge_attrs=True,
+        preserve_node_attrs=True,
+        preserve_graph_attrs=True,
+    ):
+        # All attributes are converted by default, but `_convert_to_backend` only
+        # asks for the attributes the function being dispatched needs.
         if isinstance(obj, pd.DataFrame):
             if not hasattr(obj, "__networkx_backend__"):
                 return obj
@@ -88,95 +89,236 @@ class BackendInterface:
                 if obj.nx.is_multigraph
                 else nx.DiGraph if obj.nx.is_directed else nx.Graph
             )
-            edge_key = obj.nx.edge_key if obj.nx.is_multigraph else None
-            edge_attr = set(obj.columns) - {obj.nx.source, obj.nx.target}
-            # This may be necessary for networkx <= 3.3
-            if edge_key is not None:
-                edge_attr.discard(edge_key)
-            G = nx.from_pandas_edgelist(
+            # Nodes from `node_df` come first to maintain node iteration order
+            return _nx_from_pandas(
                 obj,
-                source=obj.nx.source,
-                target=obj.nx.target,
-                edge_attr=list(edge_attr) if edge_attr else None,
-                edge_key=edge_key,
-                create_using=create_using,
+                create_using,
+                edge_attrs=edge_attrs,
+                node_attrs=node_attrs,
+                preserve_edge_attrs=preserve_edge_attrs,
+                preserve_node_attrs=preserve_node_attrs,
+                preserve_graph_attrs=preserve_graph_attrs,
             )
-            if obj.nx.node_df is not None:
-                # Try to maintain iteration order when iterating over nodes
-                G_temp = create_using()
-                G_temp.add_nodes_from(
-                    (k, v.dropna().to_dict()) for k, v in obj.nx.node_df.iterrows()
-                )
-                if G.is_multigraph():
-                    G_temp.add_edges_from(G.edges(data=True, keys=True))
-                else:
-                    G_temp.add_edges_from(G.edges(data=True))
-                G = G_temp
-            G.graph.update(obj.nx.graph)
-            return G
+        return obj
+
+    # Other backends may implement `convert_from_pandas` and `convert_to_pandas` to
+    # convert directly between graph DataFrames (with `df.nx` properties, including
+    # the integer-coded adjacency `df.nx.csr`) and their own graph types without
+    # creating intermediate networkx graphs. `convert_from_pandas` is given the same
+    # attribute requirements as `convert_from_nx`. We implement them here too, since
+    # graph DataFrames are our graphs.
+    @staticmethod
+    def convert_from_pandas(
+        df,
+        edge_attrs=None,
+        node_attrs=None,
+        preserve_edge_attrs=False,
+        preserve_node_attrs=False,
+        preserve_graph_attrs=False,
+        name=None,
+        graph_name=None,
+    ):
+        return df
+
+    @staticmethod
+    def convert_to_pandas(obj, *, name=None):
         return obj
 
     def __getattr__(self, attr, *, from_backend_name="pandas"):
-        if (
+        key = (from_backend_name, attr)
+        if (func := _backend_funcs.get(key)) is not None:
+            return func
+        if attr in _registry:
+            func = partial(_native_func, from_backend_name, attr)
+        elif (
             attr not in _registered_algorithms
             or _IS_TESTING  # Avoid infinite recursion when testing
             and attr in {"empty_graph", "from_pandas_edgelist"}
         ):
             raise AttributeError(attr)
-        return partial(_auto_func, from_backend_name, attr)
+        else:
+            func = partial(_auto_func, from_backend_name, attr)
+        _backend_funcs[key] = func
+        return func
+
+
+# Functions returned by `BackendInterface.__getattr__` by `(from_backend_name, attr)`
+_backend_funcs = {}
+
+
+def _get_config(key, default=False):
+    """Get ``nx.config.backends.pandas[key]``, which may not be configured."""
+    config = getattr(nx.config.backends, "pandas", None)
+    return default if config is None else config.get(key, default)
+
+
+def _native_func(from_backend_name, func_name, /, *args, **kwargs):
+    # Run the native implementation directly on the DataFrames if we can.
+    # `nx_pandas_graph` graphs are unwrapped to their DataFrames, and if any graph
+    # is not from a pandas backend, then convert and run elsewhere instead.
+    func = _registry[func_name]
+    native_args = list(args)
+    native_kwargs = dict(kwargs)
+    is_native = True
+    for gname, pos in func.graphs.items():
+        if gname in kwargs:
+            native_kwargs[gname] = G = _get_df(kwargs[gname])
+        elif pos < len(args):
+            native_args[pos] = G = _get_df(args[pos])
+        else:
+            continue
+        if G is not None and getattr(G, "__networkx_backend__", None) != "pandas":
+            is_native = False
+    if is_native:
+        record = _instrument._new_record(func_name, "pandas")
+        start = _instrument._timer()
+        try:
+            rv = func(*native_args, **native_kwargs)
+        except NotImplementedError:
+            if func_name not in _registered_algorithms:
+                raise
+        else:
+            if func.returns_graph and _get_config("compact_nodes"):
+                rv.nx.compact_nodes = True
+            if func.returns_graph and from_backend_name != "pandas":
+                # e.g. wrap in a `nx_pandas_graph` graph
+                rv = _load_backend(from_backend_name).convert_from_pandas(rv)
+            if record is not None:
+                record.run_time = _instrument._timer() - start
+                _instrument._finish(record)
+            return rv
+    elif func_name not in _registered_algorithms:
+        raise TypeError(f"{func_name}() requires a graph from a pandas backend")
+    return _auto_func(from_backend_name, func_name, *args, **kwargs)
+
+
+def _get_df(G):
+    if getattr(G, "__networkx_backend__", None) == "pandas_graph":
+        # Not `G.df`, which copies columns shared with other graphs to be written
+        return G._df
+    return G
 
 
 def _auto_func(from_backend_name, func_name, /, *args, **kwargs):
     # Do our own conversion and dispatching based on `nx.config.backend_priority`.
     # We want to refactor dispatching in networkx to make this simpler, and then
     # see if we can do it all (with backend-to-backend conversions) within networkx.
-    dfunc = _registered_algorithms[func_name]
-    for to_backend_name in nx.config.backend_priority:
-        if to_backend_name in {
-            "pandas",
-            "pandas_graph",
-        } or not dfunc.__wrapped__._should_backend_run(
-            to_backend_name, *args, **kwargs
-        ):
+    plan = _get_dispatch_plan(from_backend_name, func_name)
+    for to_backend_name, to_backend, backend_func in plan.backends:
+        if not _should_backend_run(to_backend, func_name, args, kwargs):
             continue
         try:
             return _run_with_backend(
-                from_backend_name, to_backend_name, dfunc, args, kwargs
+                plan, to_backend_name, to_backend, backend_func, args, kwargs
             )
         except NotImplementedError:
             pass
-    return _run_with_backend(from_backend_name, "networkx", dfunc, args, kwargs)
+    return _run_with_backend(plan, "networkx", None, plan.dfunc.orig_func, args, kwargs)
+
+
+def _should_backend_run(backend, func_name, args, kwargs):
+    # Same as `_dispatchable._should_backend_run` for an already loaded backend
+    # that is known to implement the function.
+    return (
+        (can_run := backend.can_run(func_name, args, kwargs))
+        and not isinstance(can_run, str)
+        and (should_run := backend.should_run(func_name, args, kwargs))
+        and not isinstance(should_run, str)
+    )
+
+
+class _DispatchPlan:
+    """What `_auto_func` needs to run a function that does not depend on arguments.
+
+    Plans are reused for every call until `nx.config.backend_priority` changes.
+    """
 
+    __slots__ = ["dfunc", "signature", "from_backend", "graphs", "backends"]
 
-def _run_with_backend(from_backend_name, to_backend_name, dfunc, args, kwargs):
+    def __init__(self, from_backend_name, func_name, backend_priority):
+        self.dfunc = dfunc = _registered_algorithms[func_name]
+        self.signature = inspect.signature(dfunc)
+        self.from_backend = _load_backend(from_backend_name)
+        self.graphs = tuple(dfunc.graphs.items())
+        # `(backend_name, backend, backend_func)` of backends to try in order
+        self.backends = tuple(
+            (backend_name, backend, getattr(backend, func_name))
+            for backend_name in backend_priority
+            if backend_name not in {"pandas", "pandas_graph"}
+            and hasattr(backend := _load_backend(backend_name), func_name)
+        )
+
+
+# Dispatch plans by `(from_backend_name, func_name)` for `_dispatch_plans_priority`
+_dispatch_plans = {}
+_dispatch_plans_priority = None
+
+
+def _get_dispatch_plan(from_backend_name, func_name):
+    global _dispatch_plans_priority
+    backend_priority = tuple(nx.config.backend_priority)
+    if backend_priority != _dispatch_plans_priority:
+        _dispatch_plans.clear()
+        _dispatch_plans_priority = backend_priority
+    key = (from_backend_name, func_name)
+    if (plan := _dispatch_plans.get(key)) is None:
+        plan = _dispatch_plans[key] = _DispatchPlan(
+            from_backend_name, func_name, backend_priority
+        )
+    return plan
+
+
+def _run_with_backend(plan, to_backend_name, to_backend, backend_func, args, kwargs):
     # Convert graph arguments from pandas to a backend an run with that backend.
-    from_backend = _load_backend(from_backend_name)
-    if to_backend_name == "networkx":
-        to_backend = None
-    else:
-        to_backend = _load_backend(to_backend_name)
-    # Hmm, his gets recomputed for each backend.
+    dfunc = plan.dfunc
+    from_backend = plan.from_backend
+    record = _instrument._new_record(dfunc.name, to_backend_name)
+    start = _instrument._timer()
     graphs_resolved = {
         gname: val
-        for gname, pos in dfunc.graphs.items()
+        for gname, pos in plan.graphs
         if (val := args[pos] if pos < len(args) else kwargs.get(gname)) is not None
     }
-    func_name = dfunc.name
+    attrs = _conversion_attrs(plan, args, kwargs)
     if dfunc.list_graphs:
         graphs_converted = {
             gname: (
                 [
-                    _convert_to_backend(g, from_backend, to_backend, func_name)
+                    _convert_to_backend(
+                        g,
+                        from_backend,
+                        to_backend_name,
+                        to_backend,
+                        dfunc,
+                        attrs[gname],
+                        record,
+                    )
                     for g in val
                 ]
                 if gname in dfunc.list_graphs
-                else _convert_to_backend(val, from_backend, to_backend, func_name)
+                else _convert_to_backend(
+                    val,
+                    from_backend,
+                    to_backend_name,
+                    to_backend,
+                    dfunc,
+                    attrs[gname],
+                    record,
+                )
             )
             for gname, val in graphs_resolved.items()
         }
     else:
         graphs_converted = {
-            gname: _convert_to_backend(graph, from_backend, to_backend, func_name)
+            gname: _convert_to_backend(
+                graph,
+                from_backend,
+                to_backend_name,
+                to_backend,
+                dfunc,
+                attrs[gname],
+                record,
+            )
             for gname, graph in graphs_resolved.items()
         }
     converted_args = list(args)
@@ -186,38 +328,250 @@ def _run_with_backend(from_backend_name, to_backend_name, dfunc, args, kwargs):
             converted_kwargs[gname] = val
         else:
             converted_args[dfunc.graphs[gname]] = val
-    if to_backend is None:
-        backend_func = dfunc.orig_func
-    else:
-        backend_func = getattr(to_backend, func_name)
+    converted = _instrument._timer()
     result = backend_func(*converted_args, **converted_kwargs)
+    ran = _instrument._timer()
     if dfunc._returns_graph:
         # Convert to pandas
-        if to_backend is not None:
-            result = to_backend.convert_to_nx(result)
-        result = from_backend.convert_from_nx(
-            result,
-            preserve_edge_attrs=True,
-            preserve_node_attrs=True,
-            preserve_graph_attrs=True,
-            name=func_name,
-        )
+        if hasattr(to_backend, "convert_to_pandas"):
+            result = to_backend.convert_to_pandas(result, name=dfunc.name)
+            result = from_backend.convert_from_pandas(
+                result,
+                preserve_edge_attrs=True,
+                preserve_node_attrs=True,
+                preserve_graph_attrs=True,
+                name=dfunc.name,
+            )
+            if _get_config("compact_nodes") and hasattr(result, "__networkx_backend__"):
+                result.nx.compact_nodes = True
+        else:
+            if to_backend is not None:
+                result = to_backend.convert_to_nx(result)
+            result = from_backend.convert_from_nx(
+                result,
+                preserve_edge_attrs=True,
+                preserve_node_attrs=True,
+                preserve_graph_attrs=True,
+                name=dfunc.name,
+            )
+    if record is not None:
+        record.convert_time = converted - start
+        record.run_time = ran - converted
+        record.result_time = _instrument._timer() - ran
+        _instrument._finish(record)
     return result
 
 
-def _convert_to_backend(G_from, from_backend, to_backend, func_name):
-    # TODO: convert directly to known backends instead of converting to nx first.
-    # TODO: use __networkx_cache__! Use value from cache if possible, and set to cache.
-    Gnx = from_backend.convert_to_nx(G_from)
-    if to_backend is None:
-        return Gnx
-    return to_backend.convert_from_nx(
-        Gnx,
-        preserve_edge_attrs=True,
-        preserve_node_attrs=True,
-        preserve_graph_attrs=True,
-        name=func_name,
+def _conversion_attrs(plan, args, kwargs):
+    """Return the attributes to convert for each graph argument of a call.
+
+    This resolves ``edge_attrs``, ``node_attrs``, and ``preserve_*_attrs`` of the
+    dispatchable for the given arguments like networkx does when it converts
+    graphs, so only the attributes used by the function are converted. The result
+    is ``{gname: kwargs}`` with keyword arguments for ``convert_from_nx``.
+    """
+    dfunc = plan.dfunc
+    if (
+        isinstance(dfunc.edge_attrs, str | dict)
+        or isinstance(dfunc.node_attrs, str | dict)
+        or isinstance(dfunc.preserve_edge_attrs, str)
+        or isinstance(dfunc.preserve_node_attrs, str)
+    ):
+        bound = plan.signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+    else:
+        arguments = {}
+    edge_attrs, preserve_edge_attrs = _resolve_attrs(
+        dfunc, arguments, dfunc.edge_attrs, dfunc.preserve_edge_attrs, 1
+    )
+    node_attrs, preserve_node_attrs = _resolve_attrs(
+        dfunc, arguments, dfunc.node_attrs, dfunc.preserve_node_attrs, None
+    )
+    preserve_graph_attrs = dfunc.preserve_graph_attrs
+    rv = {}
+    for gname in dfunc.graphs:
+        rv[gname] = {
+            "edge_attrs": (
+                preserve_edge_attrs.get(gname, edge_attrs)
+                if isinstance(preserve_edge_attrs, dict)
+                else edge_attrs
+            ),
+            "node_attrs": (
+                preserve_node_attrs.get(gname, node_attrs)
+                if isinstance(preserve_node_attrs, dict)
+                else node_attrs
+            ),
+            "preserve_edge_attrs": preserve_edge_attrs is True,
+            "preserve_node_attrs": preserve_node_attrs is True,
+            "preserve_graph_attrs": (
+                gname in preserve_graph_attrs
+                if isinstance(preserve_graph_attrs, set)
+                else preserve_graph_attrs
+            ),
+        }
+    return rv
+
+
+def _resolve_attrs(dfunc, arguments, attrs, preserve_attrs, default):
+    """Resolve edge or node attribute requirements like `_convert_arguments` does.
+
+    Returns ``(attrs, preserve_attrs)``, where ``attrs`` is None or a dict of
+    ``{attr: default}``, and ``preserve_attrs`` is a bool or a dict by graph name.
+    """
+    if preserve_attrs is True:
+        return None, True
+    if isinstance(preserve_attrs, str):
+        val = arguments[preserve_attrs]
+        if val is True or callable(val):
+            # e.g. `preserve_edge_attrs="attr"` and `func(attr=True)`
+            return None, True
+        if val is False and (
+            attrs == preserve_attrs
+            or isinstance(attrs, dict)
+            and preserve_attrs in attrs
+        ):
+            # `False` means "preserve no data", not `False` as the attribute
+            return None, False
+        preserve_attrs = False
+    if attrs is None:
+        return None, preserve_attrs
+    if isinstance(attrs, str):
+        if attrs[0] == "[":
+            # e.g. `edge_attrs="[edge_attributes]"` (argument of list of attributes)
+            return dict.fromkeys(arguments[attrs[1:-1]], default), preserve_attrs
+        val = arguments[attrs]
+        if callable(val):
+            # e.g. `edge_attrs="weight"` and `func(weight=myfunc)`
+            return None, True
+        if val is not None:
+            return {val: default}, preserve_attrs
+        if dfunc.name == "to_numpy_array" and hasattr(arguments["dtype"], "names"):
+            # Custom handling: attributes may be obtained from `dtype`
+            return dict.fromkeys(arguments["dtype"].names, default), preserve_attrs
+        return None, preserve_attrs
+    # e.g. `edge_attrs={"attr": "default"}` and `func(attr="foo", default=7)`
+    return {
+        attr: arguments.get(val, default) if isinstance(val, str) else val
+        for key, val in attrs.items()
+        if (attr := arguments[key]) is not None
+    }, preserve_attrs
+
+
+def _converted_nbytes(df, attrs):
+    # Bytes of the columns of DataFrame `df` that are converted with `attrs`
+    if not hasattr(df, "__networkx_backend__"):
+        return 0
+    columns = [df.nx.source, df.nx.target]
+    if df.nx.is_multigraph and df.nx.edge_key is not None:
+        columns.append(df.nx.edge_key)
+    if attrs["preserve_edge_attrs"]:
+        columns = df.columns
+    elif attrs["edge_attrs"]:
+        columns.extend(attr for attr in attrs["edge_attrs"] if attr in df.columns)
+    return int(df[columns].memory_usage(index=False).sum())
+
+
+def _cache_key(
+    edge_attrs,
+    node_attrs,
+    preserve_edge_attrs,
+    preserve_node_attrs,
+    preserve_graph_attrs,
+):
+    # Same as cache keys in networkx: (edge_attrs, node_attrs, graph_attrs)
+    return (
+        (
+            frozenset(edge_attrs.items())
+            if edge_attrs is not None
+            else preserve_edge_attrs
+        ),
+        (
+            frozenset(node_attrs.items())
+            if node_attrs is not None
+            else preserve_node_attrs
+        ),
+        preserve_graph_attrs,
     )
 
 
+def _has_values(frame, attrs, size):
+    # Whether every attribute in ``attrs`` (``(attr, default)`` items) is the same
+    # in graphs converted with all attributes, where missing values are NaN.
+    for attr, default in attrs:
+        if frame is not None and attr in frame.columns:
+            if frame[attr].hasnans or default is not None and len(frame) < size:
+                return False
+        elif default is not None:
+            return False
+    return True
+
+
+def _compat_all_attrs(df, cache_key):
+    """Return whether each part of ``cache_key`` may use a graph with all attributes.
+
+    Requested attributes that are missing are filled with defaults or left out, but
+    graphs converted with all attributes have NaN, so they are only compatible if
+    no requested values are missing.
+    """
+    edge_attrs, node_attrs, graph_attrs = cache_key
+    if edge_attrs is True or edge_attrs is False:
+        edge_compat = edge_attrs is False
+    else:
+        edge_compat = _has_values(df, edge_attrs, len(df))
+    if node_attrs is True or node_attrs is False:
+        node_compat = node_attrs is False
+    else:
+        node_compat = _has_values(df.nx._node_df, node_attrs, df.nx.csr.num_nodes)
+    return edge_compat, node_compat, graph_attrs is not True
+
+
+def _convert_to_backend(
+    G_from, from_backend, to_backend_name, to_backend, dfunc, attrs, record=None
+):
+    # Use converted graph from `__networkx_cache__` if possible, and set to cache.
+    if getattr(G_from, "__networkx_backend__", None) == "pandas_graph":
+        df = G_from._df  # `nx_pandas_graph` graphs keep the DataFrame (and cache) here
+    else:
+        df = G_from
+    use_cache = (
+        not dfunc.mutates_input
+        and isinstance(df, pd.DataFrame)
+        and df.nx.cache_enabled
+        and hasattr(df, "__networkx_backend__")
+    )
+    cache_key = _cache_key(**attrs)
+    if use_cache:
+        # A cached graph that has more attributes than needed is also compatible
+        compat_keys = itertools.product(
+            *(
+                (key, True) if is_compat else (key,)
+                for key, is_compat in zip(cache_key, _compat_all_attrs(df, cache_key))
+            )
+        )
+        rv = df.nx._cache_get(to_backend_name, *compat_keys)
+        if record is not None:
+            record.cache_hits += rv is not None
+            record.cache_misses += rv is None
+        if rv is not None:
+            return rv
+    if record is not None and isinstance(df, pd.DataFrame):
+        record.rows += len(df)
+        record.nbytes += _converted_nbytes(df, attrs)
+    if (
+        isinstance(df, pd.DataFrame)
+        and hasattr(df, "__networkx_backend__")
+        and hasattr(to_backend, "convert_from_pandas")
+    ):
+        # Convert directly without creating a networkx graph first
+        rv = to_backend.convert_from_pandas(df, **attrs, name=dfunc.name)
+    else:
+        rv = from_backend.convert_to_nx(G_from, **attrs)
+        if to_backend is not None:
+            rv = to_backend.convert_from_nx(rv, **attrs, name=dfunc.name)
+    if use_cache:
+        df.nx._cache_set(to_backend_name, cache_key, rv)
+    return rv
+
+
 backend_interface = BackendInterface()
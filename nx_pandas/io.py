@@ -0,0 +1,185 @@
+"""Read and write graph DataFrames with their ``df.nx`` properties.
+
+Graph properties are stored as JSON in the file metadata, so ``df.nx.graph`` must
+only have JSON values (str keys, lists, and no e.g. tuples or NumPy integers).
+``df.nx.node_df`` (or the isolated nodes of a lazily derived ``node_df``) is
+stored in a second file next to the edges, e.g. ``graph.parquet.nodes.parquet``.
+The CSR index may also be saved next to the edges (see ``df.nx.save_csr``).
+Requires pyarrow.
+"""
+
+import json
+import os
+
+import pandas as pd
+
+__all__ = ["read_feather", "read_parquet"]
+
+# Key of the graph properties in the file metadata
+_METADATA_KEY = b"nx_pandas"
+_VERSION = 1
+
+
+def read_parquet(
+    path, columns=None, *, node_columns=None, memory_map=True, load_csr=True
+):
+    """Read a graph DataFrame written with ``df.nx.to_parquet``.
+
+    Parameters
+    ----------
+    path : str or path-like
+    columns : list of str, optional
+        Edge attribute columns to read; the source, target, and edge key columns
+        are always read. All columns are read by default.
+    node_columns : list of str, optional
+        Node attribute columns of ``df.nx.node_df`` to read (default all).
+    memory_map : bool, default True
+        Memory-map the file instead of reading it into a buffer first.
+    load_csr : bool, default True
+        Use ``df.nx.csr`` saved with the graph (``df.nx.to_parquet(path, csr=True)``)
+        if it is still valid for the edges read. Indexes with pickled node labels
+        are not loaded; see ``df.nx.load_csr`` to load them from trusted files.
+    """
+    import pyarrow.parquet as pq
+
+    schema = pq.read_schema(path, memory_map=memory_map)
+    return _read(
+        pq.read_table, path, schema, columns, node_columns, memory_map, load_csr
+    )
+
+
+def read_feather(
+    path, columns=None, *, node_columns=None, memory_map=True, load_csr=True
+):
+    """Read a graph DataFrame written with ``df.nx.to_feather``.
+
+    ``df.nx.to_feather`` writes uncompressed files in one chunk by default, so
+    numeric columns without missing values are memory-mapped without a copy; these
+    columns are read-only (use ``df.copy()`` to modify them in-place). Other
+    columns, and columns of compressed files, are decoded. See `read_parquet` for
+    parameters.
+    """
+    import pyarrow.feather
+    import pyarrow.ipc
+
+    with pyarrow.memory_map(os.fspath(path)) as source:
+        schema = pyarrow.ipc.open_file(source).schema
+    return _read(
+        pyarrow.feather.read_table,
+        path,
+        schema,
+        columns,
+        node_columns,
+        memory_map,
+        load_csr,
+    )
+
+
+def _to_parquet(df, path, *, csr=False, **kwargs):
+    import pyarrow.parquet as pq
+
+    _write(pq.write_table, df, path, ".nodes.parquet", csr, kwargs)
+
+
+def _to_feather(df, path, *, csr=False, **kwargs):
+    import pyarrow.feather
+
+    # Let `read_feather` memory-map columns without decoding or concatenating them
+    kwargs.setdefault("compression", "uncompressed")
+    kwargs.setdefault("chunksize", max(len(df), 1))
+
+    _write(pyarrow.feather.write_feather, df, path, ".nodes.feather", csr, kwargs)
+
+
+def _write(write_table, df, path, nodes_suffix, csr, kwargs):
+    import pyarrow as pa
+
+    nx = df.nx
+    if nx._node_df is not None:
+        nodes, node_table = "node_df", nx._node_df
+    elif nx._isolated_nodes:
+        nodes = "isolated"
+        node_table = pd.DataFrame(index=pd.Index(nx._isolated_nodes))
+    else:
+        nodes = node_table = None
+    metadata = {
+        "version": _VERSION,
+        "source": nx.source,
+        "target": nx.target,
+        "edge_key": nx.edge_key if nx.is_multigraph else None,
+        "is_directed": nx.is_directed,
+        "is_multigraph": nx.is_multigraph,
+        "graph": nx.graph,
+        "compact_nodes": nx.compact_nodes,
+        "nodes": nodes,
+        "nodes_suffix": nodes_suffix,
+        "csr": csr,
+    }
+    try:
+        encoded = json.dumps(metadata)
+        is_json = json.loads(encoded)["graph"] == nx.graph
+    except (TypeError, ValueError):
+        is_json = False
+    if not is_json:
+        raise TypeError(
+            "Graph attributes `df.nx.graph` must be JSON values (e.g. str keys, "
+            "lists instead of tuples, and Python numbers) to be written to a file"
+        )
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {**table.schema.metadata, _METADATA_KEY: encoded}
+    )
+    write_table(table, path, **kwargs)
+    if node_table is not None:
+        table = pa.Table.from_pandas(node_table, preserve_index=True)
+        write_table(table, os.fspath(path) + nodes_suffix, **kwargs)
+    if csr:
+        df.nx.save_csr(os.fspath(path) + ".csr")
+
+
+def _read(read_table, path, schema, columns, node_columns, memory_map, load_csr):
+    if schema.metadata is None or _METADATA_KEY not in schema.metadata:
+        raise ValueError(f"{path!r} was not written with nx-pandas")
+    metadata = json.loads(schema.metadata[_METADATA_KEY])
+    if metadata["version"] > _VERSION:
+        raise ValueError(
+            f"{path!r} was written by a newer version of nx-pandas "
+            f"(format version {metadata['version']})"
+        )
+    source = metadata["source"]
+    target = metadata["target"]
+    edge_key = metadata["edge_key"]
+    if columns is not None:
+        keys = [source, target] + ([edge_key] if edge_key is not None else [])
+        columns = keys + [col for col in columns if col not in keys]
+    # Keep columns in separate blocks, so memory-mapped columns are not copied
+    df = read_table(path, columns=columns, memory_map=memory_map).to_pandas(
+        split_blocks=True, self_destruct=True
+    )
+    df.nx.set_properties(
+        source=source,
+        target=target,
+        is_directed=metadata["is_directed"],
+        is_multigraph=metadata["is_multigraph"],
+    )
+    if edge_key is not None:
+        df.nx.edge_key = edge_key
+    if metadata["compact_nodes"]:
+        # Categories of each column are read separately, so share them again
+        df.nx.compact_nodes = True
+    df.nx.graph.update(metadata["graph"])
+    if (nodes := metadata["nodes"]) is not None:
+        nodes_path = os.fspath(path) + metadata["nodes_suffix"]
+        # Node tables are small compared to edges, so select columns afterwards
+        # instead of finding the index columns to read.
+        node_table = read_table(nodes_path, memory_map=memory_map).to_pandas()
+        if nodes == "isolated":
+            df.nx._isolated_nodes = node_table.index.tolist()
+        else:
+            if node_columns is not None:
+                node_table = node_table[node_columns]
+            df.nx.node_df = node_table
+    if metadata.get("csr") and load_csr:
+        # Skip building the index if the saved one is valid
+        df.nx.load_csr(os.fspath(path) + ".csr")
+    return df
@@ -0,0 +1,77 @@
+"""A minimal array-based networkx backend for testing conversions with pandas.
+
+It is registered as the "arrays" backend by tests through the
+``networkx.backends`` entry point group.
+"""
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+
+class ArrayGraph:
+    __networkx_backend__ = "arrays"
+
+    def __init__(self, nodes, src, dst, *, is_directed):
+        self.nodes = nodes
+        self.src = src
+        self.dst = dst
+        self._is_directed = is_directed
+
+    def is_directed(self):
+        return self._is_directed
+
+    def is_multigraph(self):
+        return False
+
+
+class BackendInterface:
+    @staticmethod
+    def convert_from_nx(G, *args, **kwargs):
+        nodes = pd.Index(list(G), tupleize_cols=False)
+        edges = list(G.edges)
+        src = nodes.get_indexer([u for u, v in edges])
+        dst = nodes.get_indexer([v for u, v in edges])
+        return ArrayGraph(nodes, src, dst, is_directed=G.is_directed())
+
+    @staticmethod
+    def convert_to_nx(obj, **kwargs):
+        if not isinstance(obj, ArrayGraph):
+            return obj
+        G = nx.DiGraph() if obj.is_directed() else nx.Graph()
+        G.add_nodes_from(obj.nodes)
+        G.add_edges_from(zip(obj.nodes[obj.src], obj.nodes[obj.dst]))
+        return G
+
+    @staticmethod
+    def convert_from_pandas(df, *args, **kwargs):
+        csr = df.nx.csr
+        src, dst, _ = csr.edges
+        return ArrayGraph(csr.nodes, src, dst, is_directed=df.nx.is_directed)
+
+    @staticmethod
+    def convert_to_pandas(obj, *, name=None):
+        df = pd.DataFrame(
+            {"source": obj.nodes[obj.src], "target": obj.nodes[obj.dst]}
+        ).nx.set_properties(is_directed=obj.is_directed())
+        df.nx.node_df = pd.DataFrame(index=obj.nodes)
+        return df
+
+    @staticmethod
+    def number_of_isolates(G):
+        degrees = np.bincount(np.concatenate([G.src, G.dst]), minlength=len(G.nodes))
+        return int(np.count_nonzero(degrees == 0))
+
+    @staticmethod
+    def complement(G):
+        adj = np.zeros((len(G.nodes), len(G.nodes)), bool)
+        adj[G.src, G.dst] = True
+        if not G.is_directed():
+            adj |= adj.T
+            adj |= np.tri(len(G.nodes), dtype=bool)
+        np.fill_diagonal(adj, True)
+        src, dst = np.nonzero(~adj)
+        return ArrayGraph(G.nodes, src, dst, is_directed=G.is_directed())
+
+
+backend_interface = BackendInterface()
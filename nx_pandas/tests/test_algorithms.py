@@ -0,0 +1,353 @@
+import networkx as nx
+import pandas as pd
+import pytest
+
+from nx_pandas.interface import backend_interface
+
+graph_classes = [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+
+
+def _graphs(graph_class):
+    """Yield networkx graphs of ``graph_class`` and their DataFrame equivalents."""
+    graphs = [
+        nx.gnm_random_graph(30, 60, seed=42, directed=graph_class.is_directed(None)),
+        nx.karate_club_graph(),
+        nx.path_graph(1),
+        nx.empty_graph(3),
+    ]
+    for G in graphs:
+        G = graph_class(G)
+        G.add_edges_from([(0, 0), (1, 2), (2, 1)])  # self-loop and duplicates
+        for i, (*_, data) in enumerate(G.edges(data=True)):
+            data["weight"] = i % 7 + 1
+        yield G, backend_interface.convert_from_nx(
+            G, preserve_edge_attrs=True, preserve_node_attrs=True
+        )
+
+
+@pytest.fixture(params=graph_classes, ids=lambda cls: cls.__name__)
+def graphs(request):
+    return list(_graphs(request.param))
+
+
+def test_degree(graphs):
+    from nx_pandas_graph.interface import backend_interface as graph_interface
+
+    # `nx.is_empty` and `nx.number_of_selfloops` are not dispatched before networkx
+    # 3.5, and `nx.degree` uses `G.degree`, so they are called with the backend
+    for G, df in graphs:
+        H = graph_interface.convert_from_pandas(df)
+        assert list(nx.degree(H)) == list(nx.degree(G))
+        degree = backend_interface.degree(df)
+        # Like `G.degree`, iterating gives `(node, degree)` pairs
+        assert list(degree) == list(G.degree)
+        assert len(degree) == len(G.degree)
+        assert all(degree[n] == d for n, d in G.degree)
+        assert list(degree(weight="weight")) == list(G.degree(weight="weight"))
+        assert list(backend_interface.degree(df, weight="weight")) == list(
+            G.degree(weight="weight")
+        )
+        assert backend_interface.degree(df, 0) == G.degree(0)
+        assert list(backend_interface.degree(df, [0, -1])) == list(G.degree([0, -1]))
+        assert backend_interface.number_of_selfloops(df) == nx.number_of_selfloops(G)
+        assert backend_interface.is_empty(df) == nx.is_empty(G)
+        assert backend_interface.density(df) == nx.density(G)
+
+
+@pytest.mark.skipif(
+    not hasattr(nx.is_empty, "backends"),
+    reason="not dispatched by this version of networkx",
+)
+def test_degree_dispatch(graphs):
+    for G, df in graphs:
+        assert nx.number_of_selfloops(df) == nx.number_of_selfloops(G)
+        assert nx.is_empty(df) == nx.is_empty(G)
+
+
+def test_degree_missing_weights():
+    from nx_pandas_graph.classes import Graph
+
+    G = nx.path_graph(4)
+    G.edges[1, 2]["weight"] = 2
+    df = backend_interface.convert_from_nx(G, preserve_edge_attrs=True)
+    expected = dict(G.degree(weight="weight"))
+    assert dict(backend_interface.degree(df, weight="weight")) == expected
+    H = Graph.from_pandas(df)
+    assert {n: H.degree(weight="weight")[n] for n in H} == expected
+    assert dict(H.degree(weight="weight")) == expected
+
+
+def _assert_graphs_equal(G, H):
+    # Node order of networkx subgraph views depends on set order, so ignore it
+    assert set(G) == set(H)
+    assert dict(G.nodes(data=True)) == dict(H.nodes(data=True))
+    if G.is_multigraph():
+        assert nx.utils.edges_equal(
+            G.edges(keys=True, data=True), H.edges(keys=True, data=True)
+        )
+    else:
+        assert nx.utils.edges_equal(G.edges(data=True), H.edges(data=True))
+
+
+def test_subgraphs(graphs):
+    for G, df in graphs:
+        nodes = [2, 0, 1, 5, -1]
+        edges = list(G.edges(keys=True) if G.is_multigraph() else G.edges)[1:8:2]
+        edges.append((0, -1, 0)[: 3 if G.is_multigraph() else 2])
+        H = backend_interface.subgraph(df, nodes)
+        _assert_graphs_equal(G.subgraph(nodes), backend_interface.convert_to_nx(H))
+        # The index is derived from `df.nx.csr` and keeps node order
+        assert list(H.nx.csr.nodes) == [n for n in G if n in nodes]
+        H = backend_interface.edge_subgraph(df, edges)
+        _assert_graphs_equal(G.edge_subgraph(edges), backend_interface.convert_to_nx(H))
+        H = backend_interface.restricted_view(df, nodes[:2], edges[:2])
+        _assert_graphs_equal(
+            nx.restricted_view(G, nodes[:2], edges[:2]),
+            backend_interface.convert_to_nx(H),
+        )
+
+
+def _assert_same_graph(G, df):
+    H = backend_interface.convert_to_nx(df)
+    # Missing attributes of graph DataFrames are NaN
+    for data in [
+        *dict(H.nodes(data=True)).values(),
+        *(d for *_, d in H.edges(data=True)),
+    ]:
+        for key in [key for key, val in data.items() if val != val]:
+            del data[key]
+    assert type(H) is type(G)
+    assert list(H) == list(G)
+    _assert_graphs_equal(G, H)
+
+
+def test_operators(graphs):
+    (G, df), (H, hf), *_ = graphs
+    _assert_same_graph(nx.compose(G, H), nx.compose(df, hf))
+    _assert_same_graph(nx.disjoint_union(G, H), nx.disjoint_union(df, hf))
+    _assert_same_graph(
+        nx.union(G, H, rename=("G", "H")), nx.union(df, hf, rename=("G", "H"))
+    )
+    if G.is_directed():
+        _assert_same_graph(nx.reverse(G), nx.reverse(df))
+        for reciprocal in [False, True]:
+            _assert_same_graph(
+                G.to_undirected(reciprocal=reciprocal),
+                backend_interface.to_undirected(df, reciprocal=reciprocal),
+            )
+    else:
+        with pytest.raises(nx.NetworkXError, match="Cannot reverse"):
+            nx.reverse(df)
+
+
+def test_relabel(graphs):
+    for G, df in graphs:
+        mapping = {0: "a", 1: 2, 2: 1}
+        _assert_same_graph(nx.relabel_nodes(G, mapping), nx.relabel_nodes(df, mapping))
+        _assert_same_graph(nx.relabel_nodes(G, str), nx.relabel_nodes(df, str))
+        if not G.is_multigraph():
+            # Merge nodes; multigraphs fall back to networkx
+            mapping = {n: n % 3 for n in G}
+            _assert_same_graph(
+                nx.relabel_nodes(G, mapping), nx.relabel_nodes(df, mapping)
+            )
+        for ordering in ["default", "sorted", "increasing degree", "decreasing degree"]:
+            _assert_same_graph(
+                nx.convert_node_labels_to_integers(G, 1, ordering, "old"),
+                nx.convert_node_labels_to_integers(df, 1, ordering, "old"),
+            )
+        with pytest.raises(nx.NetworkXError, match="Unknown node ordering"):
+            nx.convert_node_labels_to_integers(df, ordering="random")
+        mapping = {2: "a", 0: "b"}
+        H = nx.relabel_nodes(G.copy(), mapping, copy=False)
+        assert nx.relabel_nodes(df, mapping, copy=False) is df
+        _assert_same_graph(H, df)
+
+
+def test_degree_centrality(graphs):
+    for G, df in graphs:
+        assert nx.degree_centrality(df) == nx.degree_centrality(G)
+        if G.is_directed():
+            assert nx.in_degree_centrality(df) == nx.in_degree_centrality(G)
+            assert nx.out_degree_centrality(df) == nx.out_degree_centrality(G)
+        else:
+            with pytest.raises(nx.NetworkXNotImplemented):
+                nx.in_degree_centrality(df)
+
+
+def test_native_does_not_convert(monkeypatch):
+    df = pd.DataFrame({"source": [0, 1], "target": [1, 2]})
+
+    def convert_to_nx(*args, **kwargs):
+        raise AssertionError("should not convert")
+
+    monkeypatch.setattr(backend_interface, "convert_to_nx", convert_to_nx)
+    assert nx.degree_centrality(df) == {0: 0.5, 1: 1.0, 2: 0.5}
+
+
+@pytest.mark.parametrize("is_directed", [True, False])
+@pytest.mark.parametrize("is_multigraph", [True, False])
+def test_duplicate_edges(is_directed, is_multigraph):
+    df = pd.DataFrame(
+        {
+            "source": [0, 1, 2, 1, 2, 2, 3],
+            "target": [1, 2, 1, 2, 2, 2, 0],
+            "weight": [1, 2, 3, 4, 5, 6, 7],
+        }
+    ).nx.set_properties(is_directed=is_directed, is_multigraph=is_multigraph)
+    G = backend_interface.convert_to_nx(df)
+    assert dict(backend_interface.degree(df)) == dict(G.degree)
+    assert dict(backend_interface.degree(df, weight="weight")) == dict(
+        G.degree(weight="weight")
+    )
+    assert backend_interface.number_of_selfloops(df) == nx.number_of_selfloops(G)
+    assert backend_interface.density(df) == nx.density(G)
+    assert nx.bipartite.density(df, [0, 2]) == nx.bipartite.density(G, [0, 2])
+    assert nx.degree_centrality(df) == nx.degree_centrality(G)
+
+
+def _assert_same_result(func, G, df, **kwargs):
+    try:
+        expected = func(G, **kwargs)
+    except Exception as exc:
+        with pytest.raises(type(exc)):
+            func(df, **kwargs)
+    else:
+        result = func(df, **kwargs)
+        if isinstance(expected, dict):
+            assert list(result) == list(expected)
+        assert result == pytest.approx(expected, rel=1e-6, abs=1e-9)
+
+
+def test_pagerank(graphs):
+    for G, df in graphs:
+        _assert_same_result(nx.pagerank, G, df)
+        _assert_same_result(nx.pagerank, G, df, weight=None)
+        _assert_same_result(
+            nx.pagerank,
+            G,
+            df,
+            alpha=0.9,
+            personalization={0: 1, 1: 2},
+            dangling={0: 3, 2: 1},
+            nstart={0: 1, 2: 1},
+        )
+        _assert_same_result(nx.pagerank, G, df, max_iter=1, tol=0)
+        _assert_same_result(nx.pagerank, G, df, personalization={-1: 1})
+
+
+def test_pagerank_missing_weights():
+    G = nx.gnm_random_graph(30, 60, seed=42, directed=True)
+    for i, (*_, data) in enumerate(G.edges(data=True)):
+        if i % 3:
+            data["weight"] = i % 7 + 1
+    df = backend_interface.convert_from_nx(G, preserve_edge_attrs=True)
+    assert df["weight"].isna().any()
+    # Missing weights are 1 like in networkx
+    _assert_same_result(nx.pagerank, G, df)
+
+
+def test_pagerank_non_numeric_weights_fall_back():
+    df = pd.DataFrame({"source": [0, 1], "target": [1, 2], "weight": ["a", "b"]})
+    with pytest.raises(ValueError, match="could not convert string to float"):
+        # Falls back to networkx, which raises
+        nx.pagerank(df)
+    assert nx.pagerank(df, weight=None) == pytest.approx(
+        nx.pagerank(nx.path_graph(3, create_using=nx.DiGraph))
+    )
+
+
+def test_hits(graphs):
+    # Skip small graphs where the leading singular vectors are not unique
+    for G, df in graphs[:2]:
+        hubs, authorities = nx.hits(df, tol=1e-12, max_iter=1000)
+        expected_hubs, expected_authorities = nx.hits(G)
+        assert hubs == pytest.approx(expected_hubs, abs=1e-6)
+        assert authorities == pytest.approx(expected_authorities, abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    "G, kwargs",
+    [
+        (nx.gnm_random_graph(200, 300, seed=42, directed=True), {}),
+        (nx.karate_club_graph(), {"max_iter": 20}),
+        (nx.path_graph(5), {}),
+        (nx.path_graph(5), {"normalized": False}),
+        (nx.DiGraph([(u, v) for u in range(3) for v in range(3, 7)]), {}),
+        (
+            nx.DiGraph([(u, v) for u in range(3) for v in range(3, 7)]),
+            {"normalized": False},
+        ),
+    ],
+)
+def test_hits_sparse(G, kwargs):
+    df = backend_interface.convert_from_nx(G, preserve_edge_attrs=True)
+    # Starting values are used in order like networkx, so reverse the dict
+    nstart = {n: i**2 + 1.0 for i, n in reversed(list(enumerate(G)))}
+    hubs, authorities = nx.hits(df, nstart=nstart, **kwargs)
+    expected_hubs, expected_authorities = nx.hits(G, nstart=nstart, **kwargs)
+    assert hubs == pytest.approx(expected_hubs, abs=1e-6)
+    assert authorities == pytest.approx(expected_authorities, abs=1e-6)
+    if kwargs.get("normalized", True) and G.number_of_nodes() > 5:
+        # Singular vectors of these graphs are unique, so any start converges
+        hubs, authorities = nx.hits(df, **kwargs)
+        assert hubs == pytest.approx(expected_hubs, abs=1e-6)
+        assert authorities == pytest.approx(expected_authorities, abs=1e-6)
+
+
+def test_components(graphs):
+    for G, df in graphs:
+        if G.is_directed():
+            funcs = [
+                nx.weakly_connected_components,
+                nx.strongly_connected_components,
+            ]
+            number_funcs = [
+                nx.number_weakly_connected_components,
+                nx.number_strongly_connected_components,
+                nx.is_weakly_connected,
+                nx.is_strongly_connected,
+            ]
+            with pytest.raises(nx.NetworkXNotImplemented):
+                nx.connected_components(df)
+        else:
+            funcs = [nx.connected_components]
+            number_funcs = [nx.number_connected_components, nx.is_connected]
+            assert nx.node_connected_component(df, 1) == nx.node_connected_component(
+                G, 1
+            )
+        for func in funcs:
+            result = list(func(df))
+            expected = list(func(G))
+            if func is nx.strongly_connected_components:
+                # Order of strongly connected components may differ
+                result = sorted(result, key=min)
+                expected = sorted(expected, key=min)
+            assert result == expected
+        for func in number_funcs:
+            assert func(df) == func(G)
+
+
+def test_components_null_graph():
+    df = pd.DataFrame({"source": [], "target": []}).nx.set_properties(is_directed=False)
+    assert list(nx.connected_components(df)) == []
+    with pytest.raises(nx.NetworkXPointlessConcept):
+        nx.is_connected(df)
+    with pytest.raises(KeyError):
+        nx.node_connected_component(df, 0)
+
+
+def test_clustering(graphs, monkeypatch):
+    # Use small chunks to exercise chunking
+    monkeypatch.setattr("nx_pandas.algorithms.cluster._CHUNK_SIZE", 7)
+    for G, df in graphs:
+        _assert_same_result(nx.triangles, G, df)
+        _assert_same_result(nx.triangles, G, df, nodes=[2, 0, -1])
+        _assert_same_result(nx.clustering, G, df)
+        _assert_same_result(nx.clustering, G, df, nodes=[2, 0, -1])
+        _assert_same_result(nx.transitivity, G, df)
+        _assert_same_result(nx.average_clustering, G, df)
+        _assert_same_result(nx.average_clustering, G, df, count_zeros=False)
+        if not G.is_directed() and not G.is_multigraph():
+            assert nx.triangles(df, 0) == nx.triangles(G, 0)
+            assert nx.clustering(df, 0) == nx.clustering(G, 0)
@@ -0,0 +1,74 @@
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+import nx_pandas
+from nx_pandas.interface import backend_interface
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "source": ["a", "b", "a", "c", "b", "d"],
+            "target": ["b", "c", "b", "a", "a", "d"],
+            "weight": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "other": list("uvwxyz"),
+        }
+    )
+
+
+def _chunks(df, size=2):
+    return (df.iloc[i : i + size] for i in range(0, len(df), size))
+
+
+@pytest.mark.parametrize("is_directed", [True, False])
+@pytest.mark.parametrize("is_multigraph", [True, False])
+def test_from_edge_chunks(df, is_directed, is_multigraph):
+    df.nx.set_properties(is_directed=is_directed, is_multigraph=is_multigraph)
+    result = nx_pandas.from_edge_chunks(
+        _chunks(df), is_directed=is_directed, is_multigraph=is_multigraph
+    )
+    assert result.nx.compact_nodes
+    assert result["source"].cat.codes.dtype == np.int8
+    assert result.nx.is_directed is is_directed
+    assert result.nx.is_multigraph is is_multigraph
+    assert list(result["source"]) == list(df["source"])
+    assert list(result["target"]) == list(df["target"])
+    G = backend_interface.convert_to_nx(df)
+    H = backend_interface.convert_to_nx(result)
+    assert nx.utils.graphs_equal(G, H)
+    assert list(H) == list(G)
+
+
+def test_builder_options(df):
+    builder = nx_pandas.GraphBuilder(edge_attrs=["weight"], is_directed=False)
+    for chunk in _chunks(df, 4):
+        builder.add_edges(chunk)
+    assert builder.num_nodes == 4
+    assert builder.num_edges == 6
+    result = builder.build(compact_nodes=False)
+    assert list(result.columns) == ["source", "target", "weight"]
+    assert result["source"].dtype == object
+    # Aggregate duplicate edges, including reversed edges of undirected graphs
+    builder = nx_pandas.GraphBuilder(aggregate="sum", is_directed=False)
+    result = builder.add_edges(df[["source", "target", "weight"]].iloc[:3])
+    result = builder.add_edges(df[["source", "target", "weight"]].iloc[3:]).build()
+    G = backend_interface.convert_to_nx(result)
+    assert dict(G.edges) == {
+        ("a", "b"): {"weight": 9.0},
+        ("b", "c"): {"weight": 2.0},
+        ("a", "c"): {"weight": 4.0},
+        ("d", "d"): {"weight": 6.0},
+    }
+    with pytest.raises(ValueError, match="only supported for simple graphs"):
+        nx_pandas.GraphBuilder(aggregate="sum", is_multigraph=True)
+    with pytest.raises(ValueError, match="aggregate must be one of"):
+        nx_pandas.GraphBuilder(aggregate="mean")
+
+
+def test_builder_empty():
+    df = nx_pandas.GraphBuilder(edge_attrs=["weight"]).build()
+    assert list(df.columns) == ["source", "target", "weight"]
+    assert len(backend_interface.convert_to_nx(df)) == 0
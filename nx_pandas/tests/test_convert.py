@@ -0,0 +1,182 @@
+import networkx as nx
+import pandas as pd
+import pytest
+
+from nx_pandas.interface import backend_interface
+
+
+@pytest.fixture
+def G():
+    G = nx.Graph()
+    G.add_edge(0, 1, weight=2.0, foo="a")
+    G.add_edge(1, 2, weight=3.0)
+    G.add_edge(2, 0)
+    G.add_edge(3, 3, foo="b")
+    G.nodes[3]["color"] = "red"
+    G.add_node(4, size=5)
+    return G
+
+
+@pytest.mark.parametrize(
+    "graph_class", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+)
+def test_convert_from_nx_matches_to_pandas_edgelist(G, graph_class):
+    G = graph_class(G)
+    if G.is_multigraph():
+        G.add_edge(0, 1, key="x", weight=10.0)
+    df = backend_interface.convert_from_nx(
+        G, preserve_edge_attrs=True, preserve_node_attrs=True
+    )
+    expected = nx.to_pandas_edgelist.orig_func(
+        G, edge_key="edge_key" if G.is_multigraph() else None
+    )
+    pd.testing.assert_frame_equal(df, expected[df.columns])
+    assert set(df.columns) == set(expected.columns)
+    assert df.nx.is_directed == G.is_directed()
+    assert df.nx.is_multigraph == G.is_multigraph()
+    assert list(df.nx.node_df.index) == list(G)
+
+
+def test_convert_from_nx_edge_attrs(G):
+    df = backend_interface.convert_from_nx(G, edge_attrs={"weight": 1, "bar": 0})
+    assert list(df.columns) == ["source", "target", "weight", "bar"]
+    assert list(df["weight"]) == [d.get("weight", 1) for _, _, d in G.edges(data=True)]
+    assert list(df["bar"]) == [0, 0, 0, 0]
+    df = backend_interface.convert_from_nx(G, edge_attrs={"foo": None, "bar": None})
+    assert list(df.columns) == ["source", "target", "foo"]
+    assert df["foo"].notna().tolist() == ["foo" in d for _, _, d in G.edges(data=True)]
+    df = backend_interface.convert_from_nx(G)
+    assert list(df.columns) == ["source", "target"]
+
+
+def test_convert_from_nx_node_attrs(G):
+    df = backend_interface.convert_from_nx(G)
+    assert df.nx.node_df.shape == (5, 0)
+    df = backend_interface.convert_from_nx(G, node_attrs={"color": "blue"})
+    assert list(df.nx.node_df.columns) == ["color"]
+    assert list(df.nx.node_df["color"]) == ["blue", "blue", "blue", "red", "blue"]
+    assert list(df.nx.node_df.index) == [0, 1, 2, 3, 4]
+    df = backend_interface.convert_from_nx(G, preserve_node_attrs=True)
+    assert list(df.nx.node_df.columns) == ["color", "size"]
+    assert df.nx.node_df.loc[4, "size"] == 5
+    assert df.nx.node_df["size"].isna().sum() == 4
+
+
+def test_convert_from_nx_lazy_node_df(G):
+    df = backend_interface.convert_from_nx(G)
+    # Without node attributes, only isolated nodes are kept
+    assert df.nx._node_df is None
+    assert df.nx._isolated_nodes == [4]
+    H = backend_interface.convert_to_nx(df)
+    assert list(H) == list(G)
+    df.nx.cache_enabled = True
+    nx.closeness_centrality(df)
+    csr = df.nx.csr
+    assert csr.nodes.tolist() == list(G)
+    # node_df is derived on first access, which keeps the index and cache
+    assert df.nx.node_df.shape == (5, 0)
+    assert list(df.nx.node_df.index) == list(G)
+    assert df.nx._isolated_nodes is None
+    assert df.nx.csr is csr
+    nx.closeness_centrality(df)
+    assert df.nx.cache_info()["hits"] == 1
+    # Nodes not in order of first appearance in edges need node_df
+    G = nx.Graph([(1, 0), (0, 2)])
+    G.add_node(3)
+    G.add_node(4)
+    df = backend_interface.convert_from_nx(G)
+    assert df.nx._isolated_nodes == [3, 4]
+    G = nx.Graph()
+    G.add_nodes_from([3, 0, 1])
+    G.add_edge(0, 1)
+    df = backend_interface.convert_from_nx(G)
+    assert df.nx._node_df is not None
+    assert list(backend_interface.convert_to_nx(df)) == [3, 0, 1]
+    assert df.nx.csr.nodes.tolist() == [3, 0, 1]
+
+
+def test_convert_from_nx_bad_attr_name(G):
+    G.add_edge(0, 1, source=1)
+    with pytest.raises(nx.NetworkXError, match="'source' is an attribute name"):
+        backend_interface.convert_from_nx(G, preserve_edge_attrs=True)
+
+
+@pytest.mark.parametrize(
+    "graph_class", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+)
+def test_convert_to_nx_roundtrip(G, graph_class):
+    G = graph_class(G)
+    G.add_node(-1)  # Isolated node
+    for *_, data in G.edges(data=True):
+        # Missing edge attributes become NaN (as with `nx.from_pandas_edgelist`)
+        data.setdefault("weight", 1.0)
+        data.pop("foo", None)
+    if G.is_multigraph():
+        G.add_edge(0, 1, key="x", weight=10.0)
+        G.add_edge(0, 1, weight=11.0)
+    df = backend_interface.convert_from_nx(
+        G, preserve_edge_attrs=True, preserve_node_attrs=True
+    )
+    H = backend_interface.convert_to_nx(df)
+    assert type(H) is graph_class
+    assert nx.utils.graphs_equal(G, H)
+    # Nodes and edges iterate in the same order
+    assert list(H) == list(G)
+    assert list(H.edges) == list(G.edges)
+    # NaN from missing node attributes are not added as attributes
+    assert H.nodes[4] == {"size": 5}
+    assert H.nodes[-1] == {}
+
+
+def test_convert_to_nx_without_node_df():
+    df = pd.DataFrame({"source": [2, 0, 2], "target": [0, 1, 0], "w": [1, 2, 3]})
+    G = backend_interface.convert_to_nx(df)
+    assert list(G) == [2, 0, 1]
+    # Duplicate edges update edge data, as with `nx.from_pandas_edgelist`
+    assert G.edges[2, 0] == {"w": 3}
+    df.nx.is_multigraph = True
+    G = backend_interface.convert_to_nx(df)
+    assert list(G.edges(keys=True, data="w")) == [
+        (2, 0, 0, 1),
+        (2, 0, 1, 3),
+        (0, 1, 0, 2),
+    ]
+    df["key"] = ["a", "b", "b"]
+    df.nx.edge_key = "key"
+    G = backend_interface.convert_to_nx(df)
+    assert list(G.edges(keys=True, data="w")) == [
+        (2, 0, "a", 1),
+        (2, 0, "b", 3),
+        (0, 1, "b", 2),
+    ]
+
+
+def test_convert_to_nx_attrs(G):
+    df = backend_interface.convert_from_nx(
+        G, preserve_edge_attrs=True, preserve_node_attrs=True, preserve_graph_attrs=True
+    )
+    H = backend_interface.convert_to_nx(
+        df,
+        edge_attrs={"weight": 1, "missing": 0},
+        node_attrs={"color": "blue"},
+        preserve_edge_attrs=False,
+        preserve_node_attrs=False,
+    )
+    assert list(H.edges(data=True)) == [
+        (0, 1, {"weight": 2.0}),
+        (0, 2, {"weight": 1.0}),
+        (1, 2, {"weight": 3.0}),
+        (3, 3, {"weight": 1.0}),
+    ]
+    assert dict(H.nodes(data=True)) == {
+        0: {"color": "blue"},
+        1: {"color": "blue"},
+        2: {"color": "blue"},
+        3: {"color": "red"},
+        4: {"color": "blue"},
+    }
+    H = backend_interface.convert_to_nx(
+        df, preserve_edge_attrs=False, preserve_node_attrs=False
+    )
+    assert all(not data for *_, data in H.edges(data=True))
+    assert all(not data for _, data in H.nodes(data=True))
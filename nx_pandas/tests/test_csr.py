@@ -0,0 +1,135 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from nx_pandas.interface import backend_interface
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "source": ["b", "a", "b", "c", "d", "c"],
+            "target": ["a", "c", "a", "c", "b", "a"],
+            "weight": [1, 2, 3, 4, 5, 6],
+        }
+    )
+
+
+def _check_csr(df):
+    csr = df.nx.csr
+    G = backend_interface.convert_to_nx(df)
+    assert list(csr.nodes) == list(G)
+    assert csr.src.dtype == csr.dst.dtype == np.int32
+    assert list(csr.nodes[csr.src]) == list(df["source"])
+    assert list(csr.nodes[csr.dst]) == list(df["target"])
+    for i, u in enumerate(csr.nodes):
+        start, stop = csr.indptr[i], csr.indptr[i + 1]
+        nbrs = csr.nodes[csr.indices[start:stop]]
+        eids = csr.edge_ids[start:stop]
+        if G.is_multigraph():
+            assert sorted(nbrs) == sorted(
+                v for v, keys in G._adj[u].items() for k in keys
+            )
+        else:
+            assert sorted(nbrs) == sorted(G._adj[u])
+            # Edge ids point to the rows holding the edge data
+            for v, eid in zip(nbrs, eids):
+                assert G._adj[u][v]["weight"] == df["weight"].iloc[eid]
+        if G.is_directed():
+            start, stop = csr.in_indptr[i], csr.in_indptr[i + 1]
+            preds = csr.nodes[csr.in_indices[start:stop]]
+            if G.is_multigraph():
+                assert sorted(preds) == sorted(
+                    v for v, keys in G._pred[u].items() for k in keys
+                )
+            else:
+                assert sorted(preds) == sorted(G._pred[u])
+
+
+@pytest.mark.parametrize("is_directed", [True, False])
+@pytest.mark.parametrize("is_multigraph", [True, False])
+@pytest.mark.parametrize("compact_nodes", [True, False])
+def test_csr(df, is_directed, is_multigraph, compact_nodes):
+    df.nx.set_properties(
+        is_directed=is_directed,
+        is_multigraph=is_multigraph,
+        compact_nodes=compact_nodes,
+    )
+    _check_csr(df)
+    df.nx.node_df = pd.DataFrame(index=["e", "c"])
+    _check_csr(df)
+    assert list(df.nx.csr.nodes) == ["e", "c", "b", "a", "d"]
+    df.nx._isolated_nodes = ["f"]
+    df.nx._node_df = None
+    _check_csr(df)
+    assert list(df.nx.csr.nodes) == ["b", "a", "c", "d", "f"]
+
+
+def test_csr_cached(df):
+    csr = df.nx.csr
+    assert df.nx.csr is csr
+    df.nx.is_directed = False
+    assert df.nx.csr is not csr
+    csr = df.nx.csr
+    df["source"] = df["source"].str.upper()
+    assert df.nx.csr is not csr
+    assert list(df.nx.csr.nodes) == ["B", "a", "A", "c", "C", "D", "b"]
+
+
+def test_csr_empty():
+    df = pd.DataFrame({"source": [], "target": []})
+    csr = df.nx.csr
+    assert csr.num_nodes == 0
+    assert list(csr.indptr) == [0]
+    assert len(csr.indices) == len(csr.in_indices) == 0
+
+
+@pytest.mark.parametrize("is_directed", [True, False])
+@pytest.mark.parametrize("compact_nodes", [True, False])
+def test_csr_save_load(df, tmp_path, is_directed, compact_nodes):
+    df.nx.set_properties(is_directed=is_directed, compact_nodes=compact_nodes)
+    df.nx.node_df = pd.DataFrame(index=["e", "c"])
+    expected = df.nx.csr
+    df.nx.save_csr(tmp_path / "csr")
+    df2 = df.copy()
+    df2.nx.set_properties(is_directed=is_directed)
+    df2.nx.node_df = df.nx.node_df
+    assert df2.nx.load_csr(tmp_path / "csr")
+    csr = df2.nx.csr
+    assert isinstance(csr.indptr, np.memmap)
+    assert list(csr.nodes) == list(expected.nodes)
+    for attr in ["src", "dst", "indptr", "indices", "edge_ids", "in_indptr"]:
+        np.testing.assert_array_equal(getattr(csr, attr), getattr(expected, attr))
+    _check_csr(df2)
+    # Saved indexes are not used for different graphs
+    df2.loc[0, "target"] = "d"
+    assert not df2.nx.load_csr(tmp_path / "csr")
+    df2.nx.is_directed = not is_directed
+    assert not df2.nx.load_csr(tmp_path / "csr")
+    assert not df2.nx.load_csr(tmp_path / "missing")
+
+
+@pytest.mark.parametrize(
+    "nodes, pickled",
+    [
+        (["a", "b", "c"], False),
+        ([1, 2, 3], False),
+        ([1.5, 2.5, 3.5], False),
+        (["a\x00", "b", "c"], True),
+        ([(1, 2), (2, 3), (3, 4)], True),
+    ],
+)
+def test_csr_save_load_pickle(tmp_path, nodes, pickled):
+    df = pd.DataFrame(
+        {"source": nodes, "target": nodes[1:] + nodes[:1], "weight": [1, 2, 3]}
+    )
+    df.nx.save_csr(tmp_path / "csr")
+    if not pickled:
+        # Node labels are loaded without pickle
+        np.load(tmp_path / "csr" / "nodes.npy", allow_pickle=False)
+    df2 = df.copy()
+    assert df2.nx.load_csr(tmp_path / "csr") is not pickled
+    assert df2.nx.load_csr(tmp_path / "csr", allow_pickle=True)
+    assert df2.nx.csr.nodes.tolist() == nodes
+    _check_csr(df2)
@@ -1,7 +1,11 @@
-import networkx as nx  # noqa: F401
+import networkx as nx
+import numpy as np
 import pandas as pd
 import pytest
 
+from nx_pandas._patch import _copy_on_write
+from nx_pandas.interface import backend_interface
+
 
 @pytest.fixture
 def df():
@@ -14,6 +18,7 @@ def test_defaults(df):
     assert df.nx.is_directed is True
     assert df.nx.is_multigraph is False
     assert df.nx.cache_enabled is False
+    assert df.nx.compact_nodes is False
 
 
 def test_df_attrs(df):
@@ -120,8 +125,10 @@ def test_set_properties(df):
         is_directed=False,
         is_multigraph=True,
         cache_enabled=True,
+        compact_nodes=True,
     )
     assert df is df2
+    assert df.nx.compact_nodes is True
     assert df.nx.source == "target"
     assert df.nx.target == "source"
     assert df.nx.edge_key == "foo"
@@ -146,3 +153,234 @@ def test_set_properties(df):
     assert df.nx.is_directed is False
     assert df.nx.is_multigraph is True
     assert df.nx.cache_enabled is True
+
+
+def test_compact_nodes(df):
+    df["source"] = ["x", "y", "z"]
+    df["target"] = ["y", "w", "x"]
+    G = nx.from_pandas_edgelist(df, edge_attr="foo", create_using=nx.DiGraph)
+    df.nx.compact_nodes = True
+    assert df.nx.compact_nodes is True
+    assert df["source"].cat.codes.dtype == "int8"
+    assert list(df["source"].cat.categories) == ["x", "y", "w", "z"]
+    assert df["target"].dtype == df["source"].dtype
+    assert nx.pagerank(df, weight="foo") == pytest.approx(nx.pagerank(G, weight="foo"))
+    # Nodes are decoded when converting to networkx
+    assert list(nx.shortest_path(df, "x", "w")) == ["x", "y", "w"]
+    df.nx.compact_nodes = False
+    assert list(df["source"]) == ["x", "y", "z"]
+    assert df["source"].dtype == object
+    # Graphs returned by dispatched functions may be created in compact form
+    nx.config.backends.pandas.compact_nodes = True
+    try:
+        H = nx.reverse(df)
+    finally:
+        nx.config.backends.pandas.compact_nodes = False
+    assert H.nx.compact_nodes is True
+    assert set(zip(H["source"], H["target"])) == {("y", "x"), ("w", "y"), ("x", "z")}
+
+
+def _cache_counts(df):
+    info = df.nx.cache_info()
+    return info["hits"], info["misses"], info["entries"]
+
+
+def test_cache_converted_graphs(df):
+    df.nx.cache_enabled = True
+    expected = nx.closeness_centrality(
+        nx.from_pandas_edgelist(df, create_using=nx.DiGraph)
+    )
+    assert nx.closeness_centrality(df) == expected
+    assert _cache_counts(df) == (0, 1, 1)
+    [G] = df.__networkx_cache__["backends"]["networkx"].values()
+    assert nx.closeness_centrality(df) == expected
+    assert nx.betweenness_centrality(df) == nx.betweenness_centrality(G)
+    assert _cache_counts(df) == (2, 1, 1)
+    # Changing the DataFrame invalidates the cache
+    df["bar"] = 1
+    assert nx.closeness_centrality(df) == expected
+    assert _cache_counts(df) == (2, 2, 1)
+    [G2] = df.__networkx_cache__["backends"]["networkx"].values()
+    assert G2 is not G
+    # Only attributes used by the function are converted
+    assert G2.edges[0, 1] == {}
+    df.nx.is_directed = False
+    nx.closeness_centrality(df)
+    [G3] = df.__networkx_cache__["backends"]["networkx"].values()
+    assert not G3.is_directed()
+    assert _cache_counts(df) == (2, 3, 1)
+    df.nx.cache_enabled = False
+    nx.closeness_centrality(df)
+    assert _cache_counts(df) == (2, 3, 0)
+    assert df.nx.cache_info()["nbytes"] == 0
+
+
+def test_cache_limits(df):
+    df.nx.set_properties(cache_enabled=True, cache_max_entries=2)
+    assert df.nx.cache_max_bytes is None
+    for distance in ["foo", None, "foo", "source"]:
+        nx.closeness_centrality(df, distance=distance)
+    # The least recently used graph (with no attributes) was evicted
+    cache = df.__networkx_cache__["backends"]["networkx"]
+    assert set(cache) == {
+        (frozenset({("foo", 1)}), False, False),
+        (frozenset({("source", 1)}), False, False),
+    }
+    info = df.nx.cache_info()
+    assert info["evictions"] == 1
+    assert info["entries"] == 2
+    assert info["nbytes"] > 0
+    # A byte budget evicts until the cache fits
+    df.nx.cache_max_bytes = info["nbytes"] - 1
+    assert df.nx.cache_info()["entries"] == 1
+    assert df.nx.cache_info()["evictions"] == 2
+    df.nx.cache_max_bytes = 0
+    assert df.nx.cache_info()["entries"] == 0
+    # Limits default to the global config
+    df.nx._cache_max_entries = None
+    assert df.nx.cache_max_entries == nx.config.backends.pandas.cache_max_entries
+
+
+def test_cache_converted_graphs_attrs(df):
+    df.nx.cache_enabled = True
+    df["bar"] = [1.0, None, 3.0]
+    G = nx.from_pandas_edgelist(df, edge_attr=True, create_using=nx.DiGraph)
+    expected = nx.closeness_centrality(G, distance="foo")
+    assert nx.closeness_centrality(df, distance="foo") == expected
+    cache = df.__networkx_cache__["backends"]["networkx"]
+    [G2] = cache.values()
+    assert all(data.keys() == {"foo"} for *_, data in G2.edges(data=True))
+    # Missing values are filled with the default (1 for weights)
+    nx.closeness_centrality(df, distance="bar")
+    G3 = cache[frozenset({("bar", 1)}), False, False]
+    assert list(G3.edges(data="bar")) == [(0, 1, 1.0), (1, 2, 1), (2, 0, 3.0)]
+    # A graph with all attributes may be used when fewer attributes are needed
+    cache.clear()
+    cache[True, True, True] = G
+    assert nx.closeness_centrality(df, distance="foo") == expected
+    assert _cache_counts(df) == (1, 2, 1)
+    # ...but not when requested attributes are missing, since they are NaN there
+    G_all = backend_interface.convert_to_nx(df)
+    assert any(data["bar"] != data["bar"] for *_, data in G_all.edges(data=True))
+    cache[True, True, True] = G_all
+    nx.closeness_centrality(df, distance="bar")
+    assert list(cache[frozenset({("bar", 1)}), False, False].edges(data="bar")) == [
+        (0, 1, 1.0),
+        (1, 2, 1),
+        (2, 0, 3.0),
+    ]
+
+
+@pytest.mark.parametrize("compact_nodes", [True, False])
+@pytest.mark.parametrize("is_multigraph", [True, False])
+def test_add_edges_from_frame(df, compact_nodes, is_multigraph):
+    df.nx.set_properties(
+        cache_enabled=True, compact_nodes=compact_nodes, is_multigraph=is_multigraph
+    )
+    df.nx.graph["name"] = "test"
+    nx.closeness_centrality(df, distance="foo")
+    csr = df.nx.csr
+    new = pd.DataFrame({"source": [1, 3], "target": [0, 0], "bar": [1.0, 2.0]})
+    df2 = df.nx.add_edges_from_frame(new)
+    assert list(df2.columns) == ["source", "target", "foo", "bar"]
+    assert df2.nx.compact_nodes is compact_nodes
+    assert df2.nx.is_multigraph is is_multigraph
+    assert df2.nx.graph == {"name": "test"}
+    expected = pd.concat([df, new], ignore_index=True)
+    expected.nx.set_properties(is_multigraph=is_multigraph)
+    # The index is extended, not rebuilt
+    assert df2.nx._csr is not None
+    assert df2.nx.csr.nodes[:3].equals(csr.nodes)
+    assert list(df2.nx.csr.nodes) == list(expected.nx.csr.nodes)
+    np.testing.assert_array_equal(df2.nx.csr.indptr, expected.nx.csr.indptr)
+    # Cached graphs get the new edges
+    [G] = df2.__networkx_cache__["backends"]["networkx"].values()
+    assert df.__networkx_cache__["backends"] == {}
+    # Missing values are filled with the default (1 for distances)
+    H = nx.from_pandas_edgelist(
+        expected.fillna({"foo": 1}),
+        edge_attr="foo",
+        create_using=nx.MultiDiGraph if is_multigraph else nx.DiGraph,
+    )
+    assert nx.utils.graphs_equal(G, H)
+    assert list(G) == list(H)
+    assert nx.closeness_centrality(df2, distance="foo") == nx.closeness_centrality(
+        H, distance="foo"
+    )
+    assert df2.nx.cache_info()["hits"] == 1
+
+
+def test_add_edges_from_frame_isolated_nodes(df):
+    df.nx._isolated_nodes = [5]
+    df.nx.csr
+    new = pd.DataFrame({"source": [0], "target": [2]})
+    # Nodes stay lazy if no new nodes are added
+    df2 = df.nx.add_edges_from_frame(new)
+    assert df2.nx._isolated_nodes == [5]
+    assert list(df2.nx.csr.nodes) == [0, 1, 2, 5]
+    # New nodes come after isolated nodes
+    new = pd.DataFrame({"source": [6], "target": [5]})
+    df3 = df2.nx.add_edges_from_frame(new)
+    assert df3.nx._isolated_nodes is None
+    assert list(df3.nx.node_df.index) == [0, 1, 2, 5]
+    assert list(df3.nx.csr.nodes) == [0, 1, 2, 5, 6]
+
+
+def test_add_edges_from_frame_pandas_graph(df):
+    from nx_pandas_graph.classes import DiGraph
+
+    G = DiGraph.from_pandas(df.nx.set_properties(cache_enabled=True))
+    nx.pagerank(G)
+    G.add_edges_from_frame(pd.DataFrame({"source": [3], "target": [0]}))
+    assert len(G.df) == 4
+    assert list(G.df.nx.csr.nodes) == [0, 1, 2, 3]
+
+
+def test_copy_shares_columns(df):
+    from nx_pandas_graph.classes import DiGraph, Graph
+
+    df.nx.set_properties(cache_enabled=True)
+    df.nx.graph["name"] = "test"
+    G = DiGraph.from_pandas(df)
+    csr = df.nx.csr
+    nx.betweenness_centrality(G)  # Not native, so converts and caches
+    H = G.copy()
+    assert H._df is not df
+    # Columns are shared until either graph is written to
+    assert np.shares_memory(H._df["foo"].to_numpy(), df["foo"].to_numpy())
+    assert H.df.nx.csr is csr
+    assert H.df.nx.cache_info()["entries"] == df.nx.cache_info()["entries"] == 1
+    assert H.graph == G.graph and H.graph is not G.graph
+    if not _copy_on_write():
+        # Writing to `df` directly would reach the copy
+        with pytest.raises(ValueError, match="read-only"):
+            df.loc[0, "foo"] = 10
+    # Writes to the copy or the original succeed and never reach the other
+    H.df.loc[0, "foo"] = 10
+    assert G.df.loc[0, "foo"] == 2
+    G.df.loc[1, "foo"] = 20
+    assert H.df.loc[1, "foo"] == 0
+    assert df is G.df and df.loc[1, "foo"] == 20
+    if not _copy_on_write():
+        # Copying shared columns keeps the index and cached graphs
+        assert G.df.nx.csr is H.df.nx.csr is csr
+        assert G.df.nx.cache_info()["entries"] == 1
+        assert H.df.nx.cache_info()["entries"] == 1
+    df.loc[1, "foo"] = 0
+    H.df["foo"] = 0
+    assert df["foo"].tolist() == [2, 0, 1]
+    # Changing directedness shares edges, but not derived data
+    U = Graph.from_pandas(df)
+    assert U.df.nx.is_directed is False
+    assert df.nx.is_directed is True
+    assert np.shares_memory(U.df["source"].to_numpy(), df["source"].to_numpy())
+    assert U.df.nx.csr is not csr
+    assert U.df.nx.cache_info()["entries"] == 0
+    # Copying with `from_pandas` shares columns like `copy`
+    df.nx.node_df = pd.DataFrame({"bar": [1, 2, 3]})
+    C = Graph.from_pandas(df, copy=True)
+    assert C._df.nx.is_directed is False
+    assert np.shares_memory(C._df["foo"].to_numpy(), df["foo"].to_numpy())
+    C.df.loc[0, "foo"] = 10
+    C.df.nx.node_df.loc[0, "bar"] = 10
+    assert df.loc[0, "foo"] == 2 and df.nx.node_df.loc[0, "bar"] == 1
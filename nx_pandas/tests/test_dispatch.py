@@ -0,0 +1,97 @@
+from importlib.metadata import EntryPoint
+
+import networkx as nx
+import pandas as pd
+import pytest
+from networkx.utils.backends import backends
+
+from nx_pandas import interface
+from nx_pandas.interface import BackendInterface, backend_interface
+
+
+def test_dispatch_plans_are_reused():
+    df = pd.DataFrame({"source": [0, 1], "target": [1, 2]})
+    expected = nx.closeness_centrality(nx.path_graph(3, create_using=nx.DiGraph))
+    assert nx.closeness_centrality(df) == expected
+    plan = interface._dispatch_plans[("pandas", "closeness_centrality")]
+    assert nx.closeness_centrality(df) == expected
+    assert interface._dispatch_plans[("pandas", "closeness_centrality")] is plan
+    assert backend_interface.closeness_centrality is (
+        backend_interface.closeness_centrality
+    )
+
+
+def test_dispatch_plans_invalidated_by_backend_priority():
+    df = pd.DataFrame({"source": [0, 1], "target": [1, 2]})
+    nx.closeness_centrality(df)
+    plan = interface._dispatch_plans[("pandas", "closeness_centrality")]
+    orig_priority = nx.config.backend_priority
+    try:
+        nx.config.backend_priority = ["pandas_graph"]
+        nx.closeness_centrality(df)
+        new_plan = interface._dispatch_plans[("pandas", "closeness_centrality")]
+        assert new_plan is not plan
+        assert new_plan.backends == ()
+        # Mutating the list in-place is also noticed
+        nx.config.backend_priority.clear()
+        nx.closeness_centrality(df)
+        assert (
+            interface._dispatch_plans[("pandas", "closeness_centrality")]
+            is not new_plan
+        )
+    finally:
+        nx.config.backend_priority = orig_priority
+
+
+@pytest.fixture
+def array_backend(monkeypatch):
+    """Register the stand-in "arrays" backend and try it first."""
+    from nx_pandas.tests import array_backend
+
+    monkeypatch.setitem(
+        backends,
+        "arrays",
+        EntryPoint(
+            "arrays",
+            "nx_pandas.tests.array_backend:backend_interface",
+            "networkx.backends",
+        ),
+    )
+    monkeypatch.setattr(nx.config, "backend_priority", ["arrays"])
+
+    def fail(*args, **kwargs):
+        raise AssertionError("should not convert with networkx graphs")
+
+    monkeypatch.setattr(backend_interface, "convert_to_nx", fail)
+    monkeypatch.setattr(array_backend.BackendInterface, "convert_from_nx", fail)
+    monkeypatch.setattr(array_backend.BackendInterface, "convert_to_nx", fail)
+    return array_backend
+
+
+@pytest.mark.parametrize("is_directed", [True, False])
+def test_direct_conversion(array_backend, is_directed):
+    G = nx.path_graph(4, create_using=nx.DiGraph if is_directed else nx.Graph)
+    G.add_nodes_from([10, 11])
+    df = BackendInterface.convert_from_nx(G)
+    assert nx.number_of_isolates(df) == 2
+    result = nx.complement(df)
+    assert result.nx.is_directed == is_directed
+    expected = nx.complement(G)
+    assert list(result.nx.node_df.index) == list(expected)
+    edges = set(zip(result["source"], result["target"]))
+    if is_directed:
+        assert edges == set(expected.edges)
+    else:
+        assert {frozenset(edge) for edge in edges} == {
+            frozenset(edge) for edge in expected.edges
+        }
+
+
+def test_direct_conversion_pandas_graph(array_backend):
+    from nx_pandas_graph.interface import backend_interface as pandas_graph_backend
+
+    G = pandas_graph_backend.convert_from_nx(nx.path_graph(4))
+    assert nx.number_of_isolates(G) == 0
+    result = nx.complement(G)
+    assert result.__networkx_backend__ == "pandas_graph"
+    assert len(result.df) == 3
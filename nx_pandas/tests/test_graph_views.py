@@ -0,0 +1,109 @@
+import itertools
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from nx_pandas_graph.interface import backend_interface
+
+
+@pytest.fixture(params=[nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph])
+def graphs(request):
+    G = request.param()
+    G.add_edge(3, 1, weight=2.0)
+    G.add_edge(1, 2, weight=1.5)
+    G.add_edge(2, 2, weight=4.0)
+    G.add_edge(1, 3, weight=7.0)
+    if G.is_multigraph():
+        G.add_edge(1, 2, key="x", weight=9.0)
+    G.add_node(9, color="red")
+    G.add_node(1, color="blue")
+    H = backend_interface.convert_from_nx(
+        G, preserve_edge_attrs=True, preserve_node_attrs=True
+    )
+    return G, H
+
+
+def test_nodes(graphs):
+    G, H = graphs
+    assert len(H) == H.number_of_nodes() == len(G)
+    assert list(H) == list(H.nodes) == list(G)
+    assert dict(H.nodes(data=True)) == dict(G.nodes(data=True))
+    assert dict(H.nodes(data="color")) == dict(G.nodes(data="color"))
+    assert 1 in H and H.has_node(9)
+    assert 5 not in H and [] not in H and not H.has_node(5)
+    with pytest.raises(nx.NetworkXError):
+        H.neighbors(5)
+
+
+def test_edges(graphs):
+    G, H = graphs
+    assert len(H.edges) == H.number_of_edges() == G.number_of_edges()
+    assert sorted(H.edges(data="weight")) == sorted(G.edges(data="weight"))
+    assert sorted(H.edges([2, 1])) == sorted(G.edges([2, 1]))
+    # Iterating over edges of multigraphs gives keys
+    assert sorted(H.edges, key=str) == sorted(G.edges, key=str)
+    assert sorted(H.edges(), key=str) == sorted(G.edges(), key=str)
+    if G.is_multigraph():
+        assert sorted(H.edges(keys=True), key=str) == sorted(
+            G.edges(keys=True), key=str
+        )
+    for u, v in itertools.product([1, 2, 3, 9, 5], repeat=2):
+        assert H.has_edge(u, v) == G.has_edge(u, v)
+        assert ((u, v) in H.edges) == ((u, v) in G.edges)
+        if u in G:
+            assert H.number_of_edges(u, v) == G.number_of_edges(u, v)
+        if G.has_edge(u, v):
+            assert H[u][v] == G[u][v]
+            e = (u, v, 0) if G.is_multigraph() else (u, v)
+            assert H.edges[e] == G.edges[e]
+            # Values are read one row at a time, but still as Python scalars
+            assert type(H.edges[e]["weight"]) is float
+    for n in G:
+        assert sorted(H.neighbors(n)) == sorted(G.neighbors(n))
+        assert dict(H.adj[n]) == dict(G.adj[n])
+        if G.is_directed():
+            assert sorted(H.predecessors(n)) == sorted(G.predecessors(n))
+
+
+def test_degree(graphs):
+    G, H = graphs
+    assert dict(H.degree) == dict(G.degree)
+    assert dict(H.degree(weight="weight")) == dict(G.degree(weight="weight"))
+    assert dict(H.degree([2, 1, 5])) == dict(G.degree([2, 1, 5]))
+    for n in G:
+        assert H.degree[n] == G.degree[n]
+        assert H.degree(n, weight="weight") == G.degree(n, weight="weight")
+
+
+def test_subgraph(graphs):
+    G, H = graphs
+    S = nx.subgraph(H, [1, 2, 9])
+    assert type(S) is type(H)
+    assert sorted(S.edges(data="weight")) == sorted(
+        G.subgraph([1, 2, 9]).edges(data="weight")
+    )
+    assert S.nodes[9] == {"color": "red"}
+    assert S.graph is not H.graph
+    S = H.edge_subgraph([(1, 2, 0)] if G.is_multigraph() else [(1, 2)])
+    assert list(S) == [1, 2]
+    assert S.number_of_edges() == 1
+
+
+def test_reverse_and_to_undirected(graphs):
+    G, H = graphs
+    U = H.to_undirected()
+    assert not U.is_directed() and U.is_multigraph() == G.is_multigraph()
+    assert sorted(U.edges(data="weight")) == sorted(
+        G.to_undirected().edges(data="weight")
+    )
+    with pytest.raises(NotImplementedError):
+        H.to_undirected(as_view=True)
+    if not G.is_directed():
+        return
+    R = H.reverse()
+    assert sorted(R.edges(data="weight")) == sorted(G.reverse().edges(data="weight"))
+    # Without a copy, the reversed graph shares the columns of `H`
+    R = H.reverse(copy=False)
+    assert sorted(R.edges(data="weight")) == sorted(G.reverse().edges(data="weight"))
+    assert np.shares_memory(R.df["weight"].to_numpy(), H.df["weight"].to_numpy())
@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+
+def _run(code):
+    env = {k: v for k, v in os.environ.items() if k != "NETWORKX_TEST_BACKEND"}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+def test_import_networkx_does_not_import_pandas():
+    _run("import sys, networkx; assert 'pandas' not in sys.modules, 'pandas imported'")
+
+
+def test_pandas_patched_when_imported():
+    # Both before and after networkx is imported
+    _run(
+        "import networkx, pandas as pd; "
+        "assert pd.DataFrame({'source': [0], 'target': [1]}).nx.source == 'source'"
+    )
+    _run(
+        "import pandas as pd, networkx; "
+        "assert pd.DataFrame({'source': [0], 'target': [1]}).nx.source == 'source'"
+    )
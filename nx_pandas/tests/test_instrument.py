@@ -0,0 +1,85 @@
+import networkx as nx
+import pandas as pd
+import pytest
+
+import nx_pandas
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {"source": [0, 1, 2], "target": [1, 2, 0], "weight": [1.0, 2.0, 3.0]}
+    )
+
+
+def test_instrument(df):
+    df.nx.cache_enabled = True
+    records = []
+    with nx_pandas.instrument(records.append) as stats:
+        nx.pagerank(df)  # native
+        nx.closeness_centrality(df, distance="weight")
+        nx.closeness_centrality(df, distance="weight")  # cache hit
+        nx.complement(df)  # returns a graph
+    nx.closeness_centrality(df)
+    assert records == list(stats.records)
+    assert [(r.func_name, r.backend) for r in stats] == [
+        ("pagerank", "pandas"),
+        ("closeness_centrality", "networkx"),
+        ("closeness_centrality", "networkx"),
+        ("complement", "networkx"),
+    ]
+    pagerank, closeness1, closeness2, complement = stats
+    assert pagerank.run_time > 0
+    assert pagerank.convert_time == pagerank.rows == 0
+    assert closeness1.rows == 3
+    # source, target, and weight columns of int64 and float64
+    assert closeness1.nbytes == 3 * 3 * 8
+    assert (closeness1.cache_hits, closeness1.cache_misses) == (0, 1)
+    assert (closeness2.cache_hits, closeness2.cache_misses) == (1, 0)
+    assert closeness2.rows == 0
+    assert complement.result_time > 0
+    assert complement.total_time == pytest.approx(
+        complement.convert_time + complement.run_time + complement.result_time
+    )
+    summary = stats.summary()
+    assert summary["closeness_centrality"]["calls"] == 2
+    assert summary["closeness_centrality"]["backends"] == {"networkx": 2}
+    assert summary["closeness_centrality"]["cache_hits"] == 1
+    assert summary["closeness_centrality"]["rows"] == 3
+    assert closeness1.as_dict()["func_name"] == "closeness_centrality"
+
+
+def test_instrument_list_graphs(df):
+    df.nx.cache_enabled = True
+    with nx_pandas.instrument() as stats:
+        nx.compose_all([df, df])
+    [record] = stats
+    # The same DataFrame is converted once, then found in the cache
+    assert record.rows == 3
+    assert (record.cache_hits, record.cache_misses) == (1, 1)
+
+
+def test_instrument_max_records(df):
+    stats = nx_pandas.DispatchStats(max_records=2)
+    for _ in range(3):
+        stats._add(nx_pandas.CallRecord("pagerank", "pandas"))
+    assert len(stats) == 2
+    # Totals include dropped records
+    assert stats.summary()["pagerank"]["calls"] == 3
+    assert nx_pandas.stats.records.maxlen is not None
+
+
+def test_instrument_config(df):
+    nx_pandas.stats.clear()
+    nx.pagerank(df)
+    assert len(nx_pandas.stats) == 0
+    nx.config.backends.pandas.instrument = True
+    try:
+        with nx_pandas.instrument() as stats:
+            nx.pagerank(df)
+        nx.pagerank(df)
+    finally:
+        nx.config.backends.pandas.instrument = False
+    assert len(stats) == 1
+    assert len(nx_pandas.stats) == 2
+    nx_pandas.stats.clear()
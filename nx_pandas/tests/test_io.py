@@ -0,0 +1,110 @@
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+import nx_pandas
+from nx_pandas.interface import backend_interface
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture(params=["parquet", "feather"])
+def fmt(request):
+    return request.param
+
+
+def _roundtrip(df, tmp_path, fmt, **kwargs):
+    path = tmp_path / f"graph.{fmt}"
+    getattr(df.nx, f"to_{fmt}")(path)
+    return getattr(nx_pandas, f"read_{fmt}")(path, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "graph_class", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+)
+def test_roundtrip(tmp_path, fmt, graph_class):
+    G = graph_class()
+    G.add_edge("a", "b", weight=2.0)
+    G.add_edge("b", "c", weight=3.0)
+    G.add_node("d", size=5)
+    G.graph["name"] = "test"
+    df = backend_interface.convert_from_nx(
+        G, preserve_edge_attrs=True, preserve_node_attrs=True, preserve_graph_attrs=True
+    )
+    df2 = _roundtrip(df, tmp_path, fmt)
+    pd.testing.assert_frame_equal(df2, df)
+    pd.testing.assert_frame_equal(df2.nx.node_df, df.nx.node_df)
+    for attr in ["source", "target", "is_directed", "is_multigraph", "graph"]:
+        assert getattr(df2.nx, attr) == getattr(df.nx, attr)
+    if G.is_multigraph():
+        assert df2.nx.edge_key == "edge_key"
+    H = backend_interface.convert_to_nx(df2)
+    assert nx.utils.graphs_equal(G, H)
+    assert list(H) == list(G)
+
+
+def test_columns(tmp_path, fmt):
+    df = pd.DataFrame(
+        {"u": [0, 1], "v": [1, 2], "weight": [1.0, 2.0], "other": ["x", "y"]}
+    )
+    df.nx.set_properties(source="u", target="v", is_directed=False)
+    df.nx._isolated_nodes = [3]
+    df2 = _roundtrip(df, tmp_path, fmt, columns=["weight"])
+    assert list(df2.columns) == ["u", "v", "weight"]
+    assert df2.nx.source == "u"
+    assert df2.nx.is_directed is False
+    # Isolated nodes of a lazy `node_df` stay lazy
+    assert df2.nx._node_df is None
+    assert df2.nx._isolated_nodes == [3]
+    df.nx.compact_nodes = True
+    df2 = _roundtrip(df, tmp_path, fmt, columns=[])
+    assert list(df2.columns) == ["u", "v"]
+    assert df2.nx.compact_nodes is True
+
+
+@pytest.mark.parametrize("graph", [{1: 2}, {"a": (2, 3)}, {"a": np.int64(1)}])
+def test_graph_attrs_not_json(tmp_path, fmt, graph):
+    df = pd.DataFrame({"source": [0], "target": [1]})
+    df.nx.graph = graph
+    with pytest.raises(TypeError, match="must be JSON values"):
+        _roundtrip(df, tmp_path, fmt)
+
+
+def test_feather_memory_mapped(tmp_path):
+    df = pd.DataFrame({"source": [0, 1, 2], "target": [1, 2, 0], "w": [1.0, 2, 3]})
+    df2 = _roundtrip(df, tmp_path, "feather")
+    pd.testing.assert_frame_equal(df2, df)
+    # Columns are views of the file, not copies
+    assert not df2["w"].to_numpy().flags.writeable
+
+
+def test_not_a_graph_file(tmp_path):
+    path = tmp_path / "edges.parquet"
+    pd.DataFrame({"source": [0], "target": [1]}).to_parquet(path)
+    with pytest.raises(ValueError, match="not written with nx-pandas"):
+        nx_pandas.read_parquet(path)
+
+
+def test_csr(tmp_path, fmt):
+    df = pd.DataFrame({"source": [0, 1, 2], "target": [1, 2, 0]})
+    path = tmp_path / f"graph.{fmt}"
+    getattr(df.nx, f"to_{fmt}")(path, csr=True)
+    assert (tmp_path / f"graph.{fmt}.csr" / "indptr.npy").exists()
+    df2 = getattr(nx_pandas, f"read_{fmt}")(path)
+    assert df2.nx._csr is not None
+    assert list(df2.nx.csr.nodes) == [0, 1, 2]
+    assert nx.pagerank(df2) == pytest.approx(nx.pagerank(df))
+    df2 = getattr(nx_pandas, f"read_{fmt}")(path, load_csr=False)
+    assert df2.nx._csr is None
+
+
+def test_csr_pickled_nodes(tmp_path, fmt):
+    df = pd.DataFrame({"source": [b"a", b"b"], "target": [b"b", b"a"]})
+    path = tmp_path / f"graph.{fmt}"
+    getattr(df.nx, f"to_{fmt}")(path, csr=True)
+    # Reading never unpickles node labels of the saved index
+    df2 = getattr(nx_pandas, f"read_{fmt}")(path)
+    assert df2.nx._csr is None
+    assert df2.nx.load_csr(f"{path}.csr", allow_pickle=True)
+    assert df2.nx.csr.nodes.tolist() == [b"a", b"b"]
@@ -0,0 +1,122 @@
+import networkx as nx
+import numpy as np
+import pandas as pd
+from networkx.utils.backends import _registered_algorithms
+
+__all__ = ["networkx_algorithm"]
+
+# Native pandas implementations of networkx functions, by name
+_registry = {}
+
+
+def networkx_algorithm(func=None, *, name=None, returns_graph=False):
+    """Register a native implementation of a networkx function for DataFrames.
+
+    The function is called with graph DataFrames in place of networkx graphs and
+    may raise ``NotImplementedError`` for arguments it does not support, in which
+    case the graphs are converted and the function is run by another backend.
+    Functions that return graphs return graph DataFrames.
+    """
+    if func is None:
+        return lambda func: networkx_algorithm(
+            func, name=name, returns_graph=returns_graph
+        )
+    if name is None:
+        name = func.__name__
+    if name in _registry:
+        raise KeyError(f"Algorithm already exists in registry: {name}")
+    if name in _registered_algorithms:
+        func.graphs = _registered_algorithms[name].graphs
+        func.returns_graph = _registered_algorithms[name]._returns_graph
+    else:
+        # Not dispatched by this version of networkx, but may be called directly
+        func.graphs = {"G": 0}
+        func.returns_graph = returns_graph
+    _registry[name] = func
+    return func
+
+
+def _edge_weights(df, weight, edge_ids=None, *, default=1.0):
+    """Return edge weights as a float array, or None if all weights are default.
+
+    Missing (NaN) weights are ``default`` like in networkx. Raises
+    NotImplementedError if the weights are not numeric.
+    """
+    if weight is None or weight not in df.columns:
+        return None
+    values = df[weight]
+    if not pd.api.types.is_numeric_dtype(values.dtype):
+        raise NotImplementedError(f"Non-numeric edge weights: {weight!r}")
+    values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    if np.isnan(values).any():
+        values = np.where(np.isnan(values), default, values)
+    if edge_ids is not None:
+        values = values[edge_ids]
+    return values
+
+
+def _raise_if_directed(df):
+    if df.nx.is_directed:
+        raise nx.NetworkXNotImplemented("not implemented for directed type")
+
+
+def _raise_if_undirected(df):
+    if not df.nx.is_directed:
+        raise nx.NetworkXNotImplemented("not implemented for undirected type")
+
+
+def _raise_if_multigraph(df):
+    if df.nx.is_multigraph:
+        raise nx.NetworkXNotImplemented("not implemented for multigraph type")
+
+
+def _to_dict(csr, values):
+    """Return ``{node: value}`` for an array of values aligned with node codes."""
+    return dict(zip(csr.nodes.tolist(), values.tolist()))
+
+
+def _is_node(csr, n):
+    try:
+        return n in csr.nodes
+    except TypeError:
+        return False
+
+
+def _node_code(csr, n):
+    """Return the code of node ``n``, or -1 if it is not in the graph."""
+    if not _is_node(csr, n):
+        return -1
+    return csr.nodes.get_loc(n)
+
+
+def _nbr_slice(indptr, indices, i, j):
+    """Return the ``[start, stop)`` positions of neighbor ``j`` of node ``i``."""
+    start, stop = indptr[i], indptr[i + 1]
+    nbrs = indices[start:stop]
+    return (
+        start + np.searchsorted(nbrs, j, "left"),
+        start + np.searchsorted(nbrs, j, "right"),
+    )
+
+
+def _nbunch_to_dict(csr, values, nbunch):
+    """Like `_to_dict`, but only for nodes in ``nbunch`` that are in the graph."""
+    nodes = pd.Index(list(nbunch), tupleize_cols=False)
+    nodes = nodes[nodes.isin(csr.nodes)]
+    return dict(zip(nodes.tolist(), values[csr.nodes.get_indexer(nodes)].tolist()))
+
+
+def _nbunch_codes(csr, nbunch):
+    """Return the distinct codes of the nodes of ``nbunch`` in the graph.
+
+    ``nbunch`` is a node or an iterable of nodes, like for ``G.nbunch_iter``.
+    """
+    if _is_node(csr, nbunch):
+        return np.array([csr.nodes.get_loc(nbunch)])
+    try:
+        codes = csr.nodes.get_indexer(list(nbunch))
+    except TypeError as exc:
+        raise nx.NetworkXError(
+            f"nbunch is not a node or a sequence of nodes: {nbunch!r}"
+        ) from exc
+    return pd.unique(codes[codes >= 0])
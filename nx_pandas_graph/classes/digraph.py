@@ -1,5 +1,9 @@
 import networkx as nx
+
+from nx_pandas.algorithms import operators
+
 from .graph import Graph
+from .reportviews import AdjacencyView
 
 __all__ = ["DiGraph"]
 
@@ -12,3 +16,29 @@ class DiGraph(Graph):
     @classmethod
     def to_networkx_class(cls):
         return nx.DiGraph
+
+    @property
+    def succ(self):
+        return AdjacencyView(self._df)
+
+    @property
+    def pred(self):
+        return AdjacencyView(self._df, pred=True)
+
+    successors = Graph.neighbors
+
+    def predecessors(self, n):
+        try:
+            return iter(self.pred[n])
+        except KeyError as err:
+            raise nx.NetworkXError(f"The node {n} is not in the digraph.") from err
+
+    def reverse(self, copy=True):
+        """Return the graph with edges reversed by swapping the node columns.
+
+        With ``copy=False``, the columns are shared with this graph instead of
+        copied, like the read-only view returned by networkx.
+        """
+        # Shared columns are writeable, so copy any shared with other graphs first
+        df = self._df if copy else self.df
+        return self.from_pandas(operators.reverse(df, copy=copy))
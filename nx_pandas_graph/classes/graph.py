@@ -1,10 +1,23 @@
+import functools
+
 import networkx as nx
+import pandas as pd
+
+from nx_pandas._patch import _copy_frame, _freeze_frame, _own_frame, _view_columns
+from nx_pandas.algorithms import function
+from nx_pandas.utils import _is_node
+
+from .reportviews import AdjacencyView, DegreeView, EdgeView, NodeView, _edge_ids
 
 __all__ = ["Graph"]
 
+_shallow_copy = functools.partial(pd.DataFrame.copy, deep=False)
+
 
 class Graph:
     __networkx_backend__ = "pandas_graph"
+    # Whether `_df` has read-only columns shared with other graphs (see `df`)
+    _shared = False
 
     def __new__(cls, incoming_graph_data=None, **attr):
         if incoming_graph_data is None:
@@ -45,9 +58,16 @@ class Graph:
                     f"requested.\nUse `{cls.__name__}.from_pandas(df, copy=None)` "
                     "(copy=None is the default) to allow a copy when needed."
                 )
-            new_graph = new_graph.copy()
-            new_graph.df.nx.is_directed = cls.is_directed()
-            new_graph.df.nx.is_multigraph = cls.is_multigraph()
+            # Only the flags of the copy change, and edges are shared with `df`.
+            # Unless copying, writes reach both, like the graph of `df` itself.
+            new_graph.df = _copy_frame(
+                df,
+                is_directed=cls.is_directed(),
+                is_multigraph=cls.is_multigraph(),
+                share=_view_columns if copy else _shallow_copy,
+            )
+            # Columns that are read-only (see `copy`) are copied by `G.df`
+            new_graph._shared = _freeze_frame(df) if copy else True
         return new_graph
 
     @classmethod
@@ -77,28 +97,130 @@ class Graph:
     #
     name = nx.Graph.name
 
+    @property
+    def df(self):
+        """The graph DataFrame with edges of the graph (see ``df.nx``).
+
+        With pandas copy-on-write, copies of the graph share columns until either
+        is written to. Otherwise, columns shared by ``copy`` are read-only in both
+        graphs, and each graph copies them the first time its ``G.df`` is used,
+        so it may be written to. Until then, in-place writes to a DataFrame that
+        was given to ``from_pandas`` raise ValueError instead of reaching copies.
+        """
+        if self._shared:
+            _own_frame(self._df)
+            self._shared = False
+        return self._df
+
+    @df.setter
+    def df(self, val):
+        self._df = val
+        self._shared = False
+
     @property
     def graph(self):
-        return self.df.nx.graph
+        return self._df.nx.graph
 
     @graph.setter
     def graph(self, val):
-        self.df.nx.graph = val
+        self._df.nx.graph = val
+
+    #
+    # Read-only views (backed by `df.nx.csr`; see `reportviews`)
+    #
+    @property
+    def nodes(self):
+        return NodeView(self._df)
+
+    @property
+    def edges(self):
+        return EdgeView(self._df)
+
+    @property
+    def adj(self):
+        return AdjacencyView(self._df)
+
+    @property
+    def degree(self):
+        return DegreeView(self._df)
+
+    def __iter__(self):
+        return iter(self._df.nx.csr.nodes.tolist())
+
+    def __contains__(self, n):
+        return _is_node(self._df.nx.csr, n)
+
+    def __len__(self):
+        return self._df.nx.csr.num_nodes
+
+    def __getitem__(self, n):
+        return self.adj[n]
+
+    def number_of_nodes(self):
+        return self._df.nx.csr.num_nodes
+
+    def order(self):
+        return self._df.nx.csr.num_nodes
+
+    def has_node(self, n):
+        return n in self
+
+    def has_edge(self, u, v):
+        return len(_edge_ids(self._df, u, v)) > 0
+
+    def neighbors(self, n):
+        try:
+            return iter(self.adj[n])
+        except KeyError as err:
+            raise nx.NetworkXError(f"The node {n} is not in the graph.") from err
+
+    def number_of_edges(self, u=None, v=None):
+        if u is None:
+            return self._df.nx.csr.num_edges
+        return int(self.has_edge(u, v))
 
     #
     # Graph methods
     #
+    def add_edges_from_frame(self, edges):
+        """Add edges from the rows of DataFrame ``edges``.
+
+        See ``df.nx.add_edges_from_frame``; cached conversions are kept up to date.
+        """
+        self._df = self._df.nx.add_edges_from_frame(edges)
+
+    def subgraph(self, nodes):
+        """Return the subgraph induced on ``nodes`` as a new graph.
+
+        Rows are selected with a mask over the source and target columns, and
+        properties and node data are kept (see ``nx_pandas._patch._select_frame``).
+        """
+        return self.from_pandas(function.subgraph(self._df, nodes))
+
+    def edge_subgraph(self, edges):
+        """Return the subgraph of ``edges`` and their nodes as a new graph."""
+        return self.from_pandas(function.edge_subgraph(self._df, edges))
+
+    def to_undirected(self, reciprocal=False, as_view=False):
+        """Return an undirected copy of the graph (see ``function.to_undirected``).
+
+        Views are not supported, so ``as_view=True`` raises NotImplementedError.
+        """
+        return self.to_undirected_class().from_pandas(
+            function.to_undirected(self._df, reciprocal=reciprocal, as_view=as_view)
+        )
+
     def copy(self, as_view=False):
+        """Return a copy of the graph.
+
+        Copies share the column buffers of ``G.df`` until they are written to, so
+        copying is cheap even for large graphs (see ``df``).
+        """
         new_graph = object.__new__(self.__class__)
-        df = self.df
-        if not as_view:
-            df_orig = df
-            df = df_orig.copy()
-            for attr in ["_source", "_target", "_edge_key"]:
-                setattr(df.nx, attr, getattr(df_orig.nx, attr))
-            for attr in ["graph", "_cache", "node_df"]:
-                val = getattr(df_orig.nx, attr)
-                if val is not None:
-                    setattr(df.nx, attr, val.copy())
-        new_graph.df = df
+        if as_view:
+            new_graph._df = self._df
+            new_graph._shared = self._shared
+            return new_graph
+        new_graph._df = _copy_frame(self._df, share=_view_columns)
+        new_graph._shared = self._shared = _freeze_frame(self._df)
         return new_graph
@@ -1,5 +1,6 @@
 import networkx as nx
 from .graph import Graph
+from .reportviews import _edge_ids, _edge_keys
 
 __all__ = ["MultiGraph"]
 
@@ -23,3 +24,13 @@ class MultiGraph(Graph):
     @classmethod
     def to_undirected_class(cls):
         return MultiGraph
+
+    def has_edge(self, u, v, key=None):
+        if key is None:
+            return super().has_edge(u, v)
+        return (u, v, key) in self.edges
+
+    def number_of_edges(self, u=None, v=None):
+        if u is None:
+            return self._df.nx.csr.num_edges
+        return len(set(_edge_keys(self._df, _edge_ids(self._df, u, v))))
@@ -0,0 +1,312 @@
+"""Read-only views of graph DataFrames backed by ``df.nx.csr``.
+
+Nodes are looked up in the hashed node table of the CSR index, and neighbors are
+sorted by node code, so ``u in G``, ``G.has_edge(u, v)`` and ``G[u][v]`` are
+O(1) or O(log degree) without converting the graph to networkx. Neighbors are
+reported in node order (see `nx_pandas.csr.CSRIndex`), and edge data comes from
+the last row of duplicate edges of simple graphs.
+"""
+
+from collections.abc import Mapping, Set
+
+import networkx as nx
+import numpy as np
+
+from nx_pandas.algorithms.function import DegreeView
+from nx_pandas.utils import _is_node, _nbr_slice, _nbunch_codes, _node_code
+
+__all__ = ["AdjacencyView", "AtlasView", "DegreeView", "EdgeView", "NodeView"]
+
+
+def _edge_ids(df, u, v):
+    """Return the DataFrame rows of the edges from ``u`` to ``v`` in row order."""
+    csr = df.nx.csr
+    if (i := _node_code(csr, u)) < 0 or (j := _node_code(csr, v)) < 0:
+        return csr.edge_ids[:0]
+    start, stop = _nbr_slice(csr.indptr, csr.indices, i, j)
+    return csr.edge_ids[start:stop]
+
+
+def _attr_names(df):
+    keys = {df.nx.source, df.nx.target}
+    if df.nx.is_multigraph:
+        keys.add(df.nx.edge_key)
+    return [col for col in df.columns if col not in keys]
+
+
+def _edge_data(df, edge_ids):
+    """Return the edge data dicts of rows ``edge_ids`` (like `convert_to_nx`).
+
+    Only the given rows of each column are read, so this is cheap for large frames.
+    """
+    if not (names := _attr_names(df)):
+        return [{} for _ in range(len(edge_ids))]
+    columns = [df[name].take(edge_ids).tolist() for name in names]
+    return [dict(zip(names, values)) for values in zip(*columns)]
+
+
+def _edge_keys(df, edge_ids):
+    """Return the keys of parallel edges with rows ``edge_ids`` (in row order)."""
+    edge_key = df.nx.edge_key
+    if edge_key in df.columns:
+        keys = df[edge_key].take(edge_ids).tolist()
+    else:
+        keys = [None] * len(edge_ids)
+    # Rows without keys get the next unused integer key, as in `convert_to_nx`
+    seen = set()
+    for idx, key in enumerate(keys):
+        if key is None:
+            key = keys[idx] = len(seen)
+            while key in seen:
+                key = keys[idx] = key + 1
+        seen.add(key)
+    return keys
+
+
+def _keydict(df, edge_ids):
+    keydict = {}
+    for key, data in zip(_edge_keys(df, edge_ids), _edge_data(df, edge_ids)):
+        keydict.setdefault(key, {}).update(data)
+    return keydict
+
+
+class NodeView(Mapping, Set):
+    """View of the nodes of a graph like ``G.nodes``; ``G.nodes[n]`` is node data."""
+
+    __slots__ = ("_df",)
+
+    def __init__(self, df):
+        self._df = df
+
+    def __len__(self):
+        return self._df.nx.csr.num_nodes
+
+    def __iter__(self):
+        return iter(self._df.nx.csr.nodes.tolist())
+
+    def __contains__(self, n):
+        return _is_node(self._df.nx.csr, n)
+
+    def __getitem__(self, n):
+        if isinstance(n, slice):
+            raise nx.NetworkXError(
+                f"{type(self).__name__} does not support slicing, "
+                f"try list(G.nodes)[{n.start}:{n.stop}:{n.step}]"
+            )
+        if n not in self:
+            raise KeyError(n)
+        node_df = self._df.nx._node_df
+        if node_df is None or n not in node_df.index:
+            return {}
+        row = node_df.loc[[n]]
+        return {
+            col: val
+            for col, val in row.to_dict("records")[0].items()
+            if row[col].notna().iat[0]
+        }
+
+    def __call__(self, data=False, default=None):
+        if data is False:
+            return self
+        return self.data(data, default)
+
+    def data(self, data=True, default=None):
+        if data is False:
+            return self
+        if data is True:
+            return ((n, self[n]) for n in self)
+        return ((n, self[n].get(data, default)) for n in self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({tuple(self)})"
+
+    def __str__(self):
+        return str(list(self))
+
+
+class AtlasView(Mapping):
+    """View of the neighbors of one node like ``G[u]``.
+
+    ``G[u][v]`` is the edge data dict, or ``{key: data}`` for multigraphs.
+    """
+
+    __slots__ = ("_df", "_code", "_pred")
+
+    def __init__(self, df, code, *, pred=False):
+        self._df = df
+        self._code = code
+        self._pred = pred
+
+    def _arrays(self):
+        csr = self._df.nx.csr
+        if self._pred:
+            return csr.in_indptr, csr.in_indices, csr.in_edge_ids
+        return csr.indptr, csr.indices, csr.edge_ids
+
+    def _nbr_codes(self):
+        indptr, indices, _ = self._arrays()
+        nbrs = indices[indptr[self._code] : indptr[self._code + 1]]
+        if self._df.nx.is_multigraph and len(nbrs) > 1:
+            # Parallel edges are adjacent
+            nbrs = nbrs[np.r_[True, nbrs[1:] != nbrs[:-1]]]
+        return nbrs
+
+    def __len__(self):
+        return len(self._nbr_codes())
+
+    def __iter__(self):
+        return iter(self._df.nx.csr.nodes.take(self._nbr_codes()).tolist())
+
+    def __contains__(self, v):
+        return len(self._edge_ids(v)) > 0
+
+    def _edge_ids(self, v):
+        if (j := _node_code(self._df.nx.csr, v)) < 0:
+            return np.empty(0, np.intp)
+        indptr, indices, edge_ids = self._arrays()
+        start, stop = _nbr_slice(indptr, indices, self._code, j)
+        return edge_ids[start:stop]
+
+    def __getitem__(self, v):
+        if not len(edge_ids := self._edge_ids(v)):
+            raise KeyError(v)
+        if self._df.nx.is_multigraph:
+            return _keydict(self._df, edge_ids)
+        return _edge_data(self._df, edge_ids[-1:])[0]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)})"
+
+
+class AdjacencyView(Mapping):
+    """View of the adjacency of a graph like ``G.adj`` (or ``G.pred``)."""
+
+    __slots__ = ("_df", "_pred")
+
+    def __init__(self, df, *, pred=False):
+        self._df = df
+        self._pred = pred
+
+    def __len__(self):
+        return self._df.nx.csr.num_nodes
+
+    def __iter__(self):
+        return iter(self._df.nx.csr.nodes.tolist())
+
+    def __contains__(self, n):
+        return _is_node(self._df.nx.csr, n)
+
+    def __getitem__(self, n):
+        if (i := _node_code(self._df.nx.csr, n)) < 0:
+            raise KeyError(n)
+        return AtlasView(self._df, i, pred=self._pred)
+
+    def __repr__(self):
+        adj = {n: dict(nbrs) for n, nbrs in self.items()}
+        return f"{type(self).__name__}({adj})"
+
+
+class EdgeView(Set):
+    """View of the edges of a graph like ``G.edges``.
+
+    Edges of undirected graphs are reported once. Iterating is O(E), and
+    ``(u, v) in G.edges`` and ``G.edges[u, v]`` are O(log degree).
+    """
+
+    __slots__ = ("_df",)
+
+    def __init__(self, df):
+        self._df = df
+
+    def __len__(self):
+        return self._df.nx.csr.num_edges
+
+    def _arrays(self, nbunch=None):
+        """Return ``(u, v, edge_ids)`` codes of edges in adjacency order."""
+        csr = self._df.nx.csr
+        indptr, indices, edge_ids = csr.indptr, csr.indices, csr.edge_ids
+        rows = np.repeat(np.arange(csr.num_nodes, dtype=indices.dtype), np.diff(indptr))
+        if nbunch is None:
+            if self._df.nx.is_directed:
+                return rows, indices, edge_ids
+            # Report each edge from the node that comes first
+            mask = indices >= rows
+            return rows[mask], indices[mask], edge_ids[mask]
+        # Report edges of nodes in the order of nbunch
+        rank = np.full(csr.num_nodes, -1)
+        codes = _nbunch_codes(csr, nbunch)
+        rank[codes] = np.arange(len(codes))
+        mask = rank[rows] >= 0
+        if not self._df.nx.is_directed:
+            # Edges between nodes of nbunch are reported from the first of them
+            mask &= (rank[indices] < 0) | (rank[indices] >= rank[rows])
+        rows, indices, edge_ids = rows[mask], indices[mask], edge_ids[mask]
+        order = np.argsort(rank[rows], kind="stable")
+        return rows[order], indices[order], edge_ids[order]
+
+    def _iter(self, nbunch=None, data=False, default=None, keys=False):
+        df = self._df
+        rows, cols, edge_ids = self._arrays(nbunch)
+        nodes = df.nx.csr.nodes
+        edges = zip(nodes.take(rows).tolist(), nodes.take(cols).tolist())
+        if keys and df.nx.is_multigraph:
+            edge_keys = []
+            if len(rows):
+                # Parallel edges are adjacent; find the keys of each group
+                starts = np.r_[True, (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])]
+                bounds = np.r_[starts.nonzero()[0], len(rows)]
+                for start, stop in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+                    edge_keys.extend(_edge_keys(df, edge_ids[start:stop]))
+            edges = ((u, v, key) for (u, v), key in zip(edges, edge_keys))
+        if data is False:
+            return edges
+        names = _attr_names(df)
+        if data is True:
+            datas = df[names].take(edge_ids).to_dict("records")
+        elif data in names:
+            datas = df[data].take(edge_ids).tolist()
+        else:
+            datas = [default] * len(edge_ids)
+        return ((*edge, d) for edge, d in zip(edges, datas))
+
+    def __iter__(self):
+        # Like networkx, edges of multigraphs are reported with keys
+        return self._iter(keys=self._df.nx.is_multigraph)
+
+    def __contains__(self, e):
+        try:
+            u, v, *key = e
+        except (TypeError, ValueError):
+            return False
+        if len(key) > 1 or key and not self._df.nx.is_multigraph:
+            return False
+        edge_ids = _edge_ids(self._df, u, v)
+        if not key:
+            return len(edge_ids) > 0
+        return key[0] in _edge_keys(self._df, edge_ids)
+
+    def __getitem__(self, e):
+        if isinstance(e, slice):
+            raise nx.NetworkXError(
+                f"{type(self).__name__} does not support slicing, "
+                f"try list(G.edges)[{e.start}:{e.stop}:{e.step}]"
+            )
+        if self._df.nx.is_multigraph:
+            u, v, key = e
+            keydict = _keydict(self._df, _edge_ids(self._df, u, v))
+            return keydict[key]
+        u, v = e
+        if not len(edge_ids := _edge_ids(self._df, u, v)):
+            raise KeyError(e)
+        return _edge_data(self._df, edge_ids[-1:])[0]
+
+    def __call__(self, nbunch=None, data=False, *, default=None, keys=False):
+        if nbunch is None and data is False and (keys or not self._df.nx.is_multigraph):
+            return self
+        return self._iter(nbunch, data, default, keys)
+
+    def data(self, data=True, default=None, nbunch=None, *, keys=False):
+        return self._iter(nbunch, data, default, keys)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)})"
@@ -6,6 +6,10 @@ class BackendInterface:
     @staticmethod
     def convert_from_nx(*args, **kwargs):
         df = pandas_backend.convert_from_nx(*args, **kwargs)
+        return BackendInterface.convert_from_pandas(df)
+
+    @staticmethod
+    def convert_from_pandas(df, *args, **kwargs):
         graph_class = (
             (classes.MultiDiGraph if df.nx.is_multigraph else classes.DiGraph)
             if df.nx.is_directed
@@ -14,10 +18,16 @@ class BackendInterface:
         return graph_class.from_pandas(df)
 
     @staticmethod
-    def convert_to_nx(obj, *, name=None):
+    def convert_to_nx(obj, **kwargs):
+        if getattr(obj, "__networkx_backend__", None) == "pandas_graph":
+            obj = obj._df
+        return pandas_backend.convert_to_nx(obj, **kwargs)
+
+    @staticmethod
+    def convert_to_pandas(obj, *, name=None):
         if getattr(obj, "__networkx_backend__", None) == "pandas_graph":
-            obj = obj.df
-        return pandas_backend.convert_to_nx(obj, name=name)
+            return obj.df
+        return obj
 
     def __getattr__(self, attr):
         return pandas_backend.__getattr__(attr, from_backend_name="pandas_graph")